@@ -0,0 +1,45 @@
+"""
+Alignment of tokens on parts with several optional parts: dynamic programming compared to
+a naive backtracking over the optional parts.
+
+Usage: python benchmarks/bench_alignment.py [max_nb_optional_parts]
+"""
+import sys
+import time
+
+from esgvoc.api._alignment import fully_matches
+
+
+def _backtrack(is_required, tokens, matches, part_index=0, token_index=0) -> bool:
+    if part_index == len(is_required):
+        return token_index == len(tokens)
+    if token_index < len(tokens) and matches(part_index, tokens[token_index]) and \
+       _backtrack(is_required, tokens, matches, part_index + 1, token_index + 1):
+        return True
+    return not is_required[part_index] and \
+           _backtrack(is_required, tokens, matches, part_index + 1, token_index)
+
+
+def _report(name: str, elapsed: float) -> None:
+    print(f'{name:<50} {elapsed * 1000:>10.3f} ms')
+
+
+def main(max_nb_optional_parts: int) -> None:
+    # Every optional part accepts any token, the last required part accepts none of them:
+    # the worst case of the backtracking.
+    def matches(part_index: int, token: str) -> bool:
+        return part_index < len(is_required) - 1
+    for nb_optional_parts in range(4, max_nb_optional_parts + 1, 4):
+        is_required = [False] * nb_optional_parts + [True]
+        tokens = ['token'] * (nb_optional_parts // 2 + 1)
+        start = time.perf_counter()
+        assert not fully_matches(is_required, tokens, matches)
+        _report(f'dynamic programming {nb_optional_parts} optional parts',
+                time.perf_counter() - start)
+        start = time.perf_counter()
+        assert not _backtrack(is_required, tokens, matches)
+        _report(f'backtracking {nb_optional_parts} optional parts', time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,61 @@
+"""
+Throughput of term lookups with the default connection compared to the read only profile,
+with concurrent threads.
+Requires the installed databases (see `esgvoc install`).
+
+Usage: python benchmarks/bench_db_connection.py [nb_queries] [nb_threads]
+"""
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import esgvoc.core.service as service
+from esgvoc.core.db.connection import DBConnection
+from esgvoc.core.db.models.universe import UTerm
+from sqlmodel import select
+
+
+def _report(name: str, nb_queries: int, elapsed: float) -> None:
+    print(f'{name:<50} {nb_queries:>10} queries {elapsed:>8.3f} s {nb_queries/elapsed:>12.0f} queries/s')
+
+
+def _run(connection: DBConnection, term_ids: list[str], nb_threads: int) -> float:
+    def lookup(chunk: list[str]) -> None:
+        # One session per chunk, as the API opens one session per call.
+        for term_id in chunk:
+            with connection.create_session() as session:
+                session.exec(select(UTerm).where(UTerm.id == term_id)).all()
+    chunks = [term_ids[index::nb_threads] for index in range(nb_threads)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=nb_threads) as executor:
+        list(executor.map(lookup, chunks))
+    return time.perf_counter() - start
+
+
+def main(nb_queries: int, nb_threads: int) -> None:
+    db_file_path = Path(service.state_service.universe.db_path)
+    db_settings = service.service_settings.db
+    with DBConnection(db_file_path).create_session() as session:
+        all_term_ids = list(session.exec(select(UTerm.id)).all())
+    term_ids = [random.choice(all_term_ids) for _ in range(nb_queries)]
+    profiles = {
+        'default': DBConnection(db_file_path),
+        'read only': DBConnection(db_file_path, read_only=True,
+                                  pragmas=db_settings.get_pragmas(),
+                                  pool_size=db_settings.pool_size),
+        'read only immutable': DBConnection(db_file_path, read_only=True, immutable=True,
+                                            pragmas=db_settings.get_pragmas(),
+                                            pool_size=db_settings.pool_size),
+    }
+    for name, connection in profiles.items():
+        _run(connection, term_ids[:100], nb_threads)  # Warms up the pool.
+        _report(f'{name} ({nb_threads} threads)', nb_queries,
+                _run(connection, term_ids, nb_threads))
+        connection.get_engine().dispose()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 8)
@@ -0,0 +1,36 @@
+"""
+Throughput of the DRS generator.
+Requires the installed databases (see `esgvoc install`).
+
+Usage: python benchmarks/bench_drs_generator.py [nb_expressions]
+"""
+import sys
+import time
+
+from esgvoc.apps.drs import DrsType, generate_drs_many
+
+PROJECT_ID = 'cmip6plus'
+FACETS = {'mip_era': 'CMIP6Plus', 'activity_id': 'CMIP', 'institution_id': 'IPSL',
+          'source_id': 'MIROC6', 'experiment_id': 'historical', 'member_id': 'r1i1p1f1',
+          'table_id': 'Amon', 'variable_id': 'tas', 'grid_label': 'gn',
+          'version': 'v20240101', 'time_range': '20000101-20001231'}
+
+
+def _report(name: str, nb_expressions: int, elapsed: float) -> None:
+    print(f'{name:<50} {nb_expressions:>10} expressions {elapsed:>8.3f} s ' +
+          f'{nb_expressions/elapsed:>12.0f} expressions/s')
+
+
+def main(nb_expressions: int) -> None:
+    for drs_type in DrsType:
+        # Facets are generated on the fly, as they would be read from a catalog.
+        facets = (dict(FACETS, member_id=f'r{index % 100 + 1}i1p1f1')
+                  for index in range(nb_expressions))
+        start = time.perf_counter()
+        for report in generate_drs_many(PROJECT_ID, facets, drs_type):
+            assert report.validated
+        _report(f'generate {drs_type.value}', nb_expressions, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
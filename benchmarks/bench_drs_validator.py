@@ -0,0 +1,38 @@
+"""
+Throughput of the DRS validator.
+Requires the installed databases (see `esgvoc install`).
+
+Usage: python benchmarks/bench_drs_validator.py [nb_expressions]
+"""
+import sys
+import time
+
+from esgvoc.apps.drs import DrsType, DrsValidator
+
+PROJECT_ID = 'cmip6plus'
+EXPRESSIONS = {
+    DrsType.dataset_id: 'CMIP6Plus.CMIP.IPSL.MIROC6.historical.r1i1p1f1.Amon.tas.gn',
+    DrsType.directory: 'CMIP6Plus/CMIP/IPSL/MIROC6/historical/r1i1p1f1/Amon/tas/gn/v20240101',
+    DrsType.filename: 'tas_Amon_MIROC6_historical_r1i1p1f1_gn_20000101-20001231.nc',
+}
+
+
+def _report(name: str, nb_expressions: int, elapsed: float) -> None:
+    print(f'{name:<50} {nb_expressions:>10} expressions {elapsed:>8.3f} s ' +
+          f'{nb_expressions/elapsed:>12.0f} expressions/s')
+
+
+def main(nb_expressions: int) -> None:
+    start = time.perf_counter()
+    validator = DrsValidator(PROJECT_ID)
+    print(f'compilation: {time.perf_counter() - start:.3f} s')
+    for drs_type, expression in EXPRESSIONS.items():
+        expressions = [expression] * nb_expressions
+        start = time.perf_counter()
+        for report in validator.validate_many(expressions, drs_type):
+            assert report.validated
+        _report(f'validate {drs_type.value}', nb_expressions, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,48 @@
+"""
+Throughput of the matching of values against all the terms of a project (project index), for
+values that match a pattern or a composite term and for values that match none, compared to
+a linear scan of the matchers of these terms.
+Requires the installed databases (see `esgvoc install`).
+
+Usage: python benchmarks/bench_project_index.py [nb_values]
+"""
+import random
+import sys
+import time
+from typing import Callable
+
+import esgvoc.api.projects as projects
+
+PROJECT_ID = 'cmip6plus'
+MATCHING_VALUES = ['r1i1p1f1', 'r2i1p1f2', 'r10i2p3f4', 'v20240101']
+NON_MATCHING_VALUES = ['IPL', 'r1i1p1f111', 'x20240101', 'v2024']
+
+
+def _report(name: str, nb_values: int, elapsed: float) -> None:
+    print(f'{name:<40} {nb_values:>10} values {elapsed:>8.3f} s {nb_values/elapsed:>12.0f} values/s')
+
+
+def _run(match: Callable[[str], list], values: list[str]) -> float:
+    start = time.perf_counter()
+    for value in values:
+        match(value)
+    return time.perf_counter() - start
+
+
+def main(nb_values: int) -> None:
+    index = projects._load_project_index(PROJECT_ID)
+
+    def combined_match(value: str) -> list:
+        return list(index._match_combined(value))
+
+    def linear_match(value: str) -> list:
+        return [item for item in index.combined_matchers if item[2](value)]
+    print(f'{len(index.combined_matchers)} pattern and separator less composite terms')
+    for name, choices in (('matching', MATCHING_VALUES), ('non matching', NON_MATCHING_VALUES)):
+        values = [random.choice(choices) for _ in range(nb_values)]
+        _report(f'combined regex {name}', nb_values, _run(combined_match, values))
+        _report(f'linear scan {name}', nb_values, _run(linear_match, values))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,45 @@
+"""
+Latency of get_all_terms_in_universe returning the specs of the terms (raw) compared to
+the Pydantic term instances, with an empty term cache (instantiation and validation of every
+term) and with a warm one.
+Requires the installed databases (see `esgvoc install`).
+
+Usage: python benchmarks/bench_raw_terms.py [nb_runs]
+"""
+import sys
+import time
+from typing import Callable
+
+import esgvoc.api.universe as universe
+from esgvoc.api import clear_term_cache
+
+
+def _run(function: Callable[[], list], nb_runs: int,
+         before: Callable[[], None]|None = None) -> tuple[float, int]:
+    elapsed = 0.0
+    nb_terms = 0
+    for _ in range(nb_runs):
+        if before:
+            before()
+        start = time.perf_counter()
+        nb_terms = len(function())
+        elapsed += time.perf_counter() - start
+    return elapsed / nb_runs, nb_terms
+
+
+def _report(name: str, latency: float, nb_terms: int) -> None:
+    print(f'{name:<35} {latency * 1000:>10.3f} ms/call {nb_terms:>10} terms')
+
+
+def main(nb_runs: int) -> None:
+    universe.get_all_terms_in_universe(raw=True)  # Warms up the connection.
+    _report('pydantic (empty term cache)',
+            *_run(universe.get_all_terms_in_universe, nb_runs, clear_term_cache))
+    universe.get_all_terms_in_universe()
+    _report('pydantic (warm term cache)',
+            *_run(universe.get_all_terms_in_universe, nb_runs))
+    _report('raw', *_run(lambda: universe.get_all_terms_in_universe(raw=True), nb_runs))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,103 @@
+"""
+Latency of the term id searches (LIKE, STARTS_WITH, ENDS_WITH, REGEX) on a synthetic universe:
+scan of the table with a regex per row, compared to the search layer without the full text
+search table (native SQLite string functions, ranges of the index for the literal prefixes)
+and with it.
+
+Usage: python benchmarks/bench_search.py [nb_terms] [nb_queries]
+"""
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from esgvoc.api._utils import _DB_VERSION_SESSION_INFO_KEY
+from esgvoc.api.search import SearchSettings, SearchType, create_str_comparison_expression
+from esgvoc.core.db.connection import DBConnection
+from esgvoc.core.db.fts import create_fts_table
+from esgvoc.core.db.models.mixins import TermKind
+from esgvoc.core.db.models.universe import DataDescriptor, UTerm, universe_create_db
+from sqlalchemy import insert
+from sqlmodel import select
+
+_WORDS = ['air', 'sea', 'land', 'ice', 'temperature', 'pressure', 'flux', 'mass', 'wind',
+          'cloud', 'snow', 'soil', 'carbon', 'ocean', 'surface', 'tendency']
+
+
+def _create_universe(db_file_path: Path, nb_terms: int) -> list[str]:
+    universe_create_db(db_file_path)
+    connection = DBConnection(db_file_path)
+    rng = random.Random(0)
+    term_ids = [f'{rng.choice(_WORDS)}-{rng.choice(_WORDS)}-{index:07d}' for index in range(nb_terms)]
+    with connection.create_session() as session:
+        data_descriptor = DataDescriptor(id='variable', context={}, term_kind=TermKind.PLAIN)
+        session.add(data_descriptor)
+        session.commit()
+        rows = [{'id': term_id, 'specs': {'id': term_id, 'type': 'variable', 'drs_name': term_id},
+                 'kind': TermKind.PLAIN, 'type': 'variable', 'drs_name': term_id,
+                 'data_descriptor_pk': data_descriptor.pk} for term_id in term_ids]
+        session.execute(insert(UTerm), rows)
+        session.commit()
+    create_fts_table(connection, UTerm.__tablename__)
+    connection.analyze()
+    connection.get_engine().dispose()
+    return term_ids
+
+
+def _run(connection: DBConnection, values: list[str], settings: SearchSettings,
+         use_session: bool) -> tuple[float, int]:
+    nb_results = 0
+    start = time.perf_counter()
+    for value in values:
+        with connection.create_session() as session:
+            session.info[_DB_VERSION_SESSION_INFO_KEY] = (str(connection.file_path), 'bench')
+            expression = create_str_comparison_expression(UTerm.id, value, settings,
+                                                          session if use_session else None)
+            nb_results += len(session.exec(select(UTerm.pk).where(expression)).all())
+    return (time.perf_counter() - start) / len(values), nb_results
+
+
+def _report(name: str, latency: float, nb_results: int) -> None:
+    print(f'{name:<45} {latency * 1000:>10.3f} ms/search {nb_results:>10} results')
+
+
+def main(nb_terms: int, nb_queries: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_file_path = Path(tmp_dir) / 'universe.sqlite'
+        term_ids = _create_universe(db_file_path, nb_terms)
+        connection = DBConnection(db_file_path)
+        rng = random.Random(1)
+        samples = [rng.choice(term_ids) for _ in range(nb_queries)]
+        # The baseline regex runs on every row: the groups hide the literal prefixes.
+        cases = {
+            'LIKE': (SearchType.LIKE, [sample[-9:-2] for sample in samples],
+                     '.*{}.*'),
+            'STARTS_WITH': (SearchType.STARTS_WITH, [sample[:12] for sample in samples],
+                            '(?:^{}).*'),
+            'ENDS_WITH': (SearchType.ENDS_WITH, [sample[-6:] for sample in samples],
+                          '{}$'),
+            'REGEX': (SearchType.REGEX, [f'^{sample[:16]}.*5$' for sample in samples],
+                      '(?:{})'),
+        }
+        regex_settings = SearchSettings(type=SearchType.REGEX)
+        for name, (search_type, values, baseline_pattern) in cases.items():
+            baseline_values = [baseline_pattern.format(value) for value in values]
+            _report(f'{name} regex scan',
+                    *_run(connection, baseline_values, regex_settings, False))
+            settings = SearchSettings(type=search_type)
+            _report(f'{name} without full text search', *_run(connection, values, settings, False))
+            _report(f'{name} with full text search', *_run(connection, values, settings, True))
+            if search_type == SearchType.REGEX:
+                continue
+            insensitive_settings = SearchSettings(type=search_type, case_sensitive=False)
+            _report(f'{name} case insensitive scan',
+                    *_run(connection, values, insensitive_settings, False))
+            _report(f'{name} case insensitive full text search',
+                    *_run(connection, values, insensitive_settings, True))
+        connection.get_engine().dispose()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 50)
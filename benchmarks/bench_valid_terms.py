@@ -0,0 +1,42 @@
+"""
+Throughput of the batch validation API compared to one call per value.
+Requires the installed databases (see `esgvoc install`).
+
+Usage: python benchmarks/bench_valid_terms.py [nb_values]
+"""
+import random
+import sys
+import time
+
+import esgvoc.api.projects as projects
+
+PROJECT_ID = 'cmip6plus'
+COLLECTION_IDS = ['institution_id', 'member_id', 'time_range']
+VALUES = ['IPSL', 'IPL', 'CNRM-CERFACS', 'r1i1p1f1', 'r2i1p1f2', 'r1i1p1f111',
+          '20241206-20241207', '0241206-0241207']
+
+
+def _report(name: str, nb_values: int, elapsed: float) -> None:
+    print(f'{name:<50} {nb_values:>10} values {elapsed:>8.3f} s {nb_values/elapsed:>12.0f} values/s')
+
+
+def main(nb_values: int) -> None:
+    values = [random.choice(VALUES) for _ in range(nb_values)]
+    for collection_id in COLLECTION_IDS:
+        start = time.perf_counter()
+        for value in values:
+            projects.valid_term_in_collection(value, PROJECT_ID, collection_id)
+        _report(f'valid_term_in_collection {collection_id}', nb_values, time.perf_counter() - start)
+        start = time.perf_counter()
+        projects.valid_terms_in_collection(values, PROJECT_ID, collection_id)
+        _report(f'valid_terms_in_collection {collection_id}', nb_values, time.perf_counter() - start)
+        # Without repeated values.
+        unique_values = [f'{value}{index}' for index, value in enumerate(values)]
+        start = time.perf_counter()
+        projects.valid_terms_in_collection(unique_values, PROJECT_ID, collection_id)
+        _report(f'valid_terms_in_collection {collection_id} (unique)', nb_values,
+                time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,40 @@
+"""
+Scaling of the multiprocess validation with the number of workers.
+Requires the installed databases (see `esgvoc install`).
+
+Usage: python benchmarks/bench_validate_many.py [nb_values]
+"""
+import os
+import random
+import sys
+import time
+
+import esgvoc.api.projects as projects
+from esgvoc.api.bulk import validate_many
+
+PROJECT_ID = 'cmip6plus'
+VALUES = ['IPSL', 'IPL', 'CNRM-CERFACS', 'r1i1p1f1', 'r2i1p1f2', 'r1i1p1f111',
+          '20241206-20241207', '0241206-0241207']
+
+
+def _report(name: str, nb_values: int, elapsed: float) -> None:
+    print(f'{name:<50} {nb_values:>10} values {elapsed:>8.3f} s {nb_values/elapsed:>12.0f} values/s')
+
+
+def main(nb_values: int) -> None:
+    # Unique values, so that the batch deduplication does not hide the cost of the validation.
+    values = [f'{random.choice(VALUES)}{index}' for index in range(nb_values)]
+    start = time.perf_counter()
+    expected = projects.valid_terms_in_project(values, PROJECT_ID)
+    _report('valid_terms_in_project', nb_values, time.perf_counter() - start)
+    nb_workers = 1
+    while nb_workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        result = list(validate_many(values, PROJECT_ID, max_workers=nb_workers))
+        _report(f'validate_many {nb_workers} worker(s)', nb_values, time.perf_counter() - start)
+        assert result == expected
+        nb_workers *= 2
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -26,7 +26,13 @@ from esgvoc.api.projects import (get_all_projects,
                                  valid_term_in_all_projects,
                                  valid_term_in_project,
                                  valid_term_in_collection,
-                                 valid_term)
+                                 valid_term,
+                                 valid_terms_in_all_projects,
+                                 valid_terms_in_project,
+                                 valid_terms_in_collection,
+                                 valid_terms)
+from esgvoc.api.bulk import validate_many
+from esgvoc.api._utils import configure_term_cache, get_term_cache_info, clear_term_cache
 
 
 __all__ = ["MatchingTerm",
@@ -59,4 +65,12 @@ __all__ = ["MatchingTerm",
            "valid_term_in_all_projects",
            "valid_term_in_project",
            "valid_term_in_collection",
-           "valid_term"]
\ No newline at end of file
+           "valid_term",
+           "valid_terms_in_all_projects",
+           "valid_terms_in_project",
+           "valid_terms_in_collection",
+           "valid_terms",
+           "validate_many",
+           "configure_term_cache",
+           "get_term_cache_info",
+           "clear_term_cache"]
\ No newline at end of file
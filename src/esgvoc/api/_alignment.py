@@ -0,0 +1,128 @@
+'''
+Alignment of tokens on a sequence of parts, some of them being optional.
+
+Each part consumes one token or, if it is optional, no token. Rather than backtracking over the
+optional parts (exponential), the alignment is computed by dynamic programming over the
+(part, token) positions, in O(nb parts x nb tokens) calls of the matching function.
+When the tokens can't be aligned, the alignment with the fewest errors is returned so as to
+report meaningful errors.
+'''
+from enum import Enum
+from typing import Callable, Sequence
+
+
+class Step(Enum):
+    MATCH = 0
+    """The part consumes the token that matches it."""
+    MISMATCH = 1
+    """The part consumes the token that doesn't match it (error)."""
+    SKIP = 2
+    """The optional part consumes no token."""
+    MISSING = 3
+    """The required part consumes no token (error)."""
+    EXTRA = 4
+    """The token is not consumed by any part (error)."""
+
+
+# (step, part index or None, token index or None).
+AlignmentStep = tuple[Step, int|None, int|None]
+
+
+def align(is_required: Sequence[bool],
+          tokens: Sequence[str],
+          matches: Callable[[int, str], bool]) -> tuple[int, list[AlignmentStep]]:
+    '''
+    Aligns the tokens on the parts. `is_required` gives the requirement of each part and
+    `matches(part index, token)` tells whether the token matches the part.
+    Returns the number of errors and the steps of the alignment, in the order of the parts
+    and the tokens. Among the alignments with the fewest errors, the first one in the order
+    consume the token, skip the part, discard the token is returned (it is the first alignment
+    that an exhaustive backtracking would find, trying the steps in that order).
+    '''
+    nb_parts = len(is_required)
+    nb_tokens = len(tokens)
+    # costs[i][j]: the fewest errors to align the parts from i on the tokens from j.
+    costs = [[0] * (nb_tokens + 1) for _ in range(nb_parts + 1)]
+    matched = [[False] * nb_tokens for _ in range(nb_parts)]
+    for j in range(nb_tokens + 1):
+        costs[nb_parts][j] = nb_tokens - j
+    for i in range(nb_parts - 1, -1, -1):
+        skip_cost = 1 if is_required[i] else 0
+        costs_i = costs[i]
+        costs_next = costs[i + 1]
+        costs_i[nb_tokens] = skip_cost + costs_next[nb_tokens]
+        for j in range(nb_tokens - 1, -1, -1):
+            matched[i][j] = matches(i, tokens[j])
+            costs_i[j] = min((0 if matched[i][j] else 1) + costs_next[j + 1],
+                             skip_cost + costs_next[j],
+                             1 + costs_i[j + 1])
+    steps: list[AlignmentStep] = list()
+    i = j = 0
+    while i < nb_parts or j < nb_tokens:
+        cost = costs[i][j]
+        if i < nb_parts and j < nb_tokens and \
+           (0 if matched[i][j] else 1) + costs[i + 1][j + 1] == cost:
+            steps.append((Step.MATCH if matched[i][j] else Step.MISMATCH, i, j))
+            i += 1
+            j += 1
+        elif i < nb_parts and (1 if is_required[i] else 0) + costs[i + 1][j] == cost:
+            steps.append((Step.MISSING if is_required[i] else Step.SKIP, i, None))
+            i += 1
+        else:
+            steps.append((Step.EXTRA, None, j))
+            j += 1
+    return costs[0][0], steps
+
+
+def fully_matches(is_required: Sequence[bool],
+                  tokens: Sequence[str],
+                  matches: Callable[[int, str], bool]) -> bool:
+    '''
+    Tells whether the tokens can be aligned on the parts without any error.
+    '''
+    nb_parts = len(is_required)
+    nb_tokens = len(tokens)
+    if nb_tokens > nb_parts:
+        return False
+    # reachable[j]: the tokens before j can be consumed by the parts processed so far.
+    reachable = [True] + [False] * nb_tokens
+    for i in range(nb_parts):
+        next_reachable = [False] * (nb_tokens + 1)
+        for j in range(nb_tokens + 1):
+            if reachable[j]:
+                if not is_required[i]:
+                    next_reachable[j] = True
+                if j < nb_tokens and matches(i, tokens[j]):
+                    next_reachable[j + 1] = True
+        reachable = next_reachable
+        if not any(reachable):
+            return False
+    return reachable[nb_tokens]
+
+
+def skip_optional_parts(is_required: Sequence[bool], states: frozenset[int]) -> frozenset[int]:
+    '''
+    Returns the given states (indexes of the next part to match) and the states reachable
+    by skipping optional parts.
+    '''
+    result = set(states)
+    for state in sorted(states):
+        while state < len(is_required) and not is_required[state]:
+            state += 1
+            result.add(state)
+    return frozenset(result)
+
+
+def advance(is_required: Sequence[bool],
+            states: frozenset[int],
+            token: str,
+            matches: Callable[[int, str], bool]) -> frozenset[int]:
+    '''
+    Matches the parts incrementally, one token at a time (e.g., one directory level at a time).
+    The states are the indexes of the next part to match, starting from frozenset([0]).
+    Returns the states after the token: an empty set means that the tokens so far can't be
+    matched by the parts, whatever the next tokens. The tokens fully match the parts when
+    `len(is_required)` is in `skip_optional_parts(is_required, states)`.
+    '''
+    return frozenset(state + 1 for state in skip_optional_parts(is_required, states)
+                     if state < len(is_required) and matches(state, token))
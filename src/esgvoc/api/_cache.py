@@ -0,0 +1,121 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable, Literal, TypeVar
+
+T = TypeVar('T')
+
+# (database file path, version: git hash and identity of the file, see get_state_db_version).
+DBVersion = tuple[str, str|None]
+
+
+@dataclass
+class CacheInfo:
+    hits: int
+    misses: int
+    size: int
+    max_size: int|None = None
+    evictions: int = 0
+
+
+class DBCache:
+    '''
+    Caches values computed from the content of databases.
+    The entries of a database are bound to its version: they are dropped as soon as
+    a different version of the database is requested (e.g., the database has been rebuilt).
+    '''
+    def __init__(self) -> None:
+        self._dbs: dict[str, tuple[str|None, dict]] = dict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _get_entries(self, db_version: DBVersion) -> dict:
+        db_file_path, version = db_version
+        with self._lock:
+            current = self._dbs.get(db_file_path)
+            if current is None or current[0] != version:
+                current = (version, dict())
+                self._dbs[db_file_path] = current
+        return current[1]
+
+    def get(self, db_version: DBVersion, key: Hashable, factory: Callable[[], T]) -> T:
+        entries = self._get_entries(db_version)
+        with self._lock:
+            if key in entries:
+                self.hits += 1
+                return entries[key]
+            self.misses += 1
+        # The value is computed outside the lock: concurrent misses may compute it twice.
+        result = factory()
+        with self._lock:
+            entries[key] = result
+        return result
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            size = sum(len(entries) for _, entries in self._dbs.values())
+            return CacheInfo(self.hits, self.misses, size)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._dbs.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class BoundedCache:
+    '''
+    Caches at most `max_size` values. Once full, the least recently used entry is evicted
+    (`lru`) or the oldest one (`fifo`, the hits don't reorder the entries).
+    A size of 0 disables the cache.
+    '''
+    def __init__(self, max_size: int, eviction: Literal['lru', 'fifo'] = 'lru') -> None:
+        self._entries: OrderedDict[Hashable, object] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.configure(max_size, eviction)
+
+    def configure(self, max_size: int, eviction: Literal['lru', 'fifo'] = 'lru') -> None:
+        if max_size < 0:
+            raise ValueError(f'the size of the cache must be positive, not {max_size}')
+        if eviction not in ('lru', 'fifo'):
+            raise ValueError(f'unknown eviction {eviction}')
+        with self._lock:
+            self.max_size = max_size
+            self.eviction = eviction
+            self._evict()
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key: Hashable, factory: Callable[[], T]) -> T:
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                if self.eviction == 'lru':
+                    self._entries.move_to_end(key)
+                return self._entries[key]  # type: ignore[return-value]
+            self.misses += 1
+        # The value is computed outside the lock: concurrent misses may compute it twice.
+        result = factory()
+        if self.max_size:
+            with self._lock:
+                self._entries[key] = result
+                self._evict()
+        return result
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, len(self._entries), self.max_size,
+                         self.evictions)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
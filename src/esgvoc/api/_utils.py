@@ -1,15 +1,20 @@
-from typing import Sequence
+from typing import Literal, Sequence
 
 
-import esgvoc.core.constants as api_settings
+from esgvoc.api._cache import BoundedCache, CacheInfo, DBVersion
 from esgvoc.api.data_descriptors import DATA_DESCRIPTOR_CLASS_MAPPING
 from esgvoc.core.db.models.project import PTerm
 from esgvoc.core.db.models.universe import UTerm
+from esgvoc.core.service.state import BaseState
 from pydantic import BaseModel
+from sqlalchemy.orm import object_session
 from sqlmodel import Session
 
 import esgvoc.core.service as service
-UNIVERSE_DB_CONNECTION = service.state_service.universe.db_connection
+
+_DB_VERSION_SESSION_INFO_KEY = 'db_version'
+# Instantiated terms, built on first use from the settings.
+_TERM_CACHE: BoundedCache|None = None
 
 
 def get_pydantic_class(data_descriptor_id_or_term_type: str) -> type[BaseModel]:
@@ -19,17 +24,93 @@ def get_pydantic_class(data_descriptor_id_or_term_type: str) -> type[BaseModel]:
         raise ValueError(f"{data_descriptor_id_or_term_type} pydantic class not found")
 
 
-def get_universe_session() -> Session:
+def get_state_db_version(state: BaseState) -> DBVersion|None:
+    # A database rebuilt by another process is reopened first. The version holds the identity
+    # of the file, so a database rebuilt from the same git hash has another version too.
+    with state.db_lock:
+        state.refresh_db_connection()
+        if connection:=state.db_connection:
+            return (str(connection.get_file_path()), f'{state.db_version}@{state.db_file_id}')
+        else:
+            return None
+
+
+def create_session(state: BaseState) -> Session|None:
+    # Under the lock of the state, so that the session belongs to the versioned connection.
+    with state.db_lock:
+        if db_version:=get_state_db_version(state):
+            session = state.db_connection.create_session()  # type: ignore[union-attr]
+            # The version of the database is bound to the session so as to key the caches.
+            session.info[_DB_VERSION_SESSION_INFO_KEY] = db_version
+            return session
+        else:
+            return None
+
+
+def get_db_version(session: Session) -> DBVersion:
+    return session.info[_DB_VERSION_SESSION_INFO_KEY]
 
-    if UNIVERSE_DB_CONNECTION:
-        return UNIVERSE_DB_CONNECTION.create_session()
+
+def get_universe_session() -> Session:
+    if session:=create_session(service.state_service.universe):
+        return session
     else:
         raise RuntimeError('universe connection is not initialized')
 
 
+def _get_term_cache() -> BoundedCache:
+    global _TERM_CACHE
+    if _TERM_CACHE is None:
+        cache_settings = service.service_settings.cache
+        _TERM_CACHE = BoundedCache(cache_settings.term_cache_size,
+                                   cache_settings.term_cache_eviction)
+    return _TERM_CACHE
+
+
+def configure_term_cache(max_size: int, eviction: Literal['lru', 'fifo'] = 'lru') -> None:
+    """
+    Sets the size and the eviction policy of the cache of the terms instantiated by the API
+    (default: the cache section of the settings). The entries in excess are evicted.
+
+    :param max_size: The maximum number of terms (0 disables the cache)
+    :type max_size: int
+    :param eviction: lru evicts the least recently used terms first, fifo the oldest ones
+    :type eviction: Literal['lru', 'fifo']
+    :raises ValueError: If the size is negative or the eviction is unknown
+    """
+    _get_term_cache().configure(max_size, eviction)
+
+
+def get_term_cache_info() -> CacheInfo:
+    """
+    Returns the statistics of the cache of the terms instantiated by the API.
+
+    :returns: The hits, misses, size, max size and evictions of the cache.
+    :rtype: CacheInfo
+    """
+    return _get_term_cache().info()
+
+
+def clear_term_cache() -> None:
+    """Empties the cache of the terms instantiated by the API and resets its statistics."""
+    _get_term_cache().clear()
+
+
 def instantiate_pydantic_term(term: UTerm|PTerm) -> BaseModel:
-    term_class = get_pydantic_class(term.specs[api_settings.TERM_TYPE_JSON_KEY])
-    return term_class(**term.specs)
+    """
+    Returns the Pydantic instance of the term. The instances are cached by database file, term
+    pk and database version, and shared by the callers: the term models are frozen, and their
+    nested lists and dicts must not be mutated either (use `model_copy(deep=True)` to get a
+    private copy).
+    """
+    term_class = get_pydantic_class(term.type)  # type: ignore[arg-type]
+    session = object_session(term)
+    db_version = session.info.get(_DB_VERSION_SESSION_INFO_KEY) if session else None
+    if db_version is None:
+        return term_class(**term.specs)
+    db_file_path, version = db_version
+    return _get_term_cache().get((db_file_path, term.pk, version),
+                                 lambda: term_class(**term.specs))
 
 
 def instantiate_pydantic_terms(db_terms: Sequence[UTerm|PTerm],
@@ -37,3 +118,21 @@ def instantiate_pydantic_terms(db_terms: Sequence[UTerm|PTerm],
     for db_term in db_terms:
         term = instantiate_pydantic_term(db_term)
         list_to_populate.append(term)
+
+
+def instantiate_term(term: UTerm|PTerm, raw: bool) -> BaseModel|dict:
+    """Returns the specs of the term if `raw`, otherwise its Pydantic instance."""
+    return term.specs if raw else instantiate_pydantic_term(term)
+
+
+def instantiate_terms(db_terms: Sequence[UTerm|PTerm],
+                      list_to_populate: list,
+                      raw: bool) -> None:
+    """
+    Populates the list with the specs of the terms if `raw` (the Pydantic validation is
+    skipped), otherwise with their Pydantic instances.
+    """
+    if raw:
+        list_to_populate.extend(db_term.specs for db_term in db_terms)
+    else:
+        instantiate_pydantic_terms(db_terms, list_to_populate)
@@ -0,0 +1,120 @@
+"""
+Validation of large amounts of values with a pool of processes.
+
+The values are dispatched by chunks to the worker processes, each of them having its own
+database connections and compiled caches. The results are yielded in the order of the values.
+"""
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator
+
+import esgvoc.api.projects as projects
+import esgvoc.core.service as service
+from esgvoc.api.report import ValidationReport
+from esgvoc.api.search import MatchingTerm
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+# (project id, collection id, term id).
+_Target = tuple[str|None, str|None, str|None]
+_Result = ValidationReport|list[MatchingTerm]
+
+
+def _valid_chunk(target: _Target, values: list[str]) -> list[_Result]:
+    project_id, collection_id, term_id = target
+    if project_id is None:
+        return projects.valid_terms_in_all_projects(values)
+    elif collection_id is None:
+        return projects.valid_terms_in_project(values, project_id)
+    elif term_id is None:
+        return projects.valid_terms_in_collection(values, project_id, collection_id)
+    else:
+        return projects.valid_terms(values, project_id, collection_id, term_id)
+
+
+def _chunk(values: Iterable[str], chunk_size: int) -> Iterator[list[str]]:
+    iterator = iter(values)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def validate_many(values: Iterable[str],
+                  project_id: str|None = None,
+                  collection_id: str|None = None,
+                  term_id: str|None = None,
+                  max_workers: int|None = None,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[_Result]:
+    """
+    Validates the given values with a pool of processes.
+    The target of the validation depends on the given ids, as for the batch validation functions
+    of `esgvoc.api.projects`:
+
+    - no project id: the values are validated against all the projects, like \
+      `valid_terms_in_all_projects`;
+    - a project id: the values are validated against the project, like `valid_terms_in_project`;
+    - a project id and a collection id: like `valid_terms_in_collection`;
+    - a project id, a collection id and a term id: like `valid_terms`.
+
+    The values are consumed lazily and dispatched by chunks; only a bounded number of chunks
+    are processed at the same time, so that arbitrary large iterables can be validated.
+    This function returns an iterator of the results of the values, in the order of the values.
+    Its items are ValidationReport instances if a term id is given,
+    otherwise lists of MatchingTerm.
+
+    If any of the provided ids (`project_id`, `collection_id` or `term_id`) is not found,
+    the function raises a ValueError when the results are collected.
+
+    :param values: The values to be validated
+    :type values: Iterable[str]
+    :param project_id: A project id
+    :type project_id: str|None
+    :param collection_id: A collection id
+    :type collection_id: str|None
+    :param term_id: A term id
+    :type term_id: str|None
+    :param max_workers: The number of processes (default: the number of CPUs). \
+    With 1 worker, the values are validated in the current process.
+    :type max_workers: int|None
+    :param chunk_size: The number of values sent to a process at once
+    :type chunk_size: int
+    :returns: An iterator of the results of the values.
+    :rtype: Iterator[ValidationReport|list[MatchingTerm]]
+    :raises ValueError: If any of the provided ids is not found, or immediately if the number \
+    of workers or the chunk size is not positive or if the ids are inconsistent
+    """
+    if max_workers is not None and max_workers < 1:
+        raise ValueError(f'max workers must be greater than 0, got {max_workers}')
+    if chunk_size < 1:
+        raise ValueError(f'chunk size must be greater than 0, got {chunk_size}')
+    if term_id is not None and collection_id is None:
+        raise ValueError('a term id is given without collection id')
+    if (term_id is not None or collection_id is not None) and project_id is None:
+        raise ValueError('a collection id is given without project id')
+    target: _Target = (project_id, collection_id, term_id)
+    max_workers = max_workers if max_workers is not None else os.cpu_count() or 1
+    # The arguments are checked above, when the function is called, and not on the first
+    # iteration of the generator.
+    return _validate_many(values, target, max_workers, chunk_size)
+
+
+def _validate_many(values: Iterable[str],
+                   target: _Target,
+                   max_workers: int,
+                   chunk_size: int) -> Iterator[_Result]:
+    chunks = _chunk(values, chunk_size)
+    if max_workers == 1:
+        for chunk in chunks:
+            yield from _valid_chunk(target, chunk)
+        return
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             initializer=service.discard_db_connections) as executor:
+        # Two chunks per worker keep the workers busy while the results are consumed.
+        pending: deque[Future[list[_Result]]] = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_valid_chunk, target, chunk))
+            if len(pending) >= 2 * max_workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
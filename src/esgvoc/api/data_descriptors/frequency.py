@@ -18,6 +18,7 @@ version = "None"
 class ConfiguredBaseModel(BaseModel):
     model_config = ConfigDict(
         validate_assignment = True,
+        frozen = True,
         validate_default = True,
         extra = "allow",
         arbitrary_types_allowed = True,
@@ -1,28 +1,50 @@
+import logging
 import re
-from typing import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Literal, Sequence, TypeVar, overload
 
 import esgvoc.api.universe as universe
 import esgvoc.core.constants
 import esgvoc.core.service as service
-from esgvoc.api._utils import (get_universe_session, instantiate_pydantic_term,
-                               instantiate_pydantic_terms)
+from esgvoc.api._alignment import Step, align, fully_matches
+from esgvoc.api._cache import DBCache
+from esgvoc.api._utils import (create_session, get_db_version, get_universe_session,
+                               instantiate_term, instantiate_terms)
 from esgvoc.api.report import (ProjectTermError, UniverseTermError,
                                ValidationError, ValidationReport)
 from esgvoc.api.search import MatchingTerm, SearchSettings, create_str_comparison_expression
-from esgvoc.core.db.connection import DBConnection
 from esgvoc.core.db.models.mixins import TermKind
 from esgvoc.core.db.models.project import Collection, Project, PTerm
 from esgvoc.core.db.models.universe import UTerm
 from pydantic import BaseModel
-from sqlmodel import Session, and_, select
+from sqlalchemy.orm import contains_eager, selectinload
+from sqlmodel import Session, col, select
 
+T = TypeVar('T')
 
-def _get_project_connection(project_id: str) -> DBConnection|None:
-    return service.state_service.projects[project_id].db_connection
+_LOGGER = logging.getLogger(__name__)
+
+# Compiled regex of the pattern terms, keyed by term pk.
+_PATTERN_CACHE = DBCache()
+# Compiled regex of the separator less composite terms.
+_COMPOSITE_PATTERN_CACHE = DBCache()
+# Index of the terms of a project: (collection id, drs_name) -> term id.
+_DRS_NAME_INDEX_CACHE = DBCache()
+_DRS_NAME_INDEX_KEY = 'drs_name'
+# Terms resolved for the parts of the composites: (data descriptor or collection id, term id) -> term.
+_RESOLVED_TERMS_SESSION_INFO_KEY = 'resolved_terms'
+# Index of all the terms of a project, keyed by project id and universe version.
+_PROJECT_INDEX_CACHE = DBCache()
+_BACK_REFERENCE_REGEX = re.compile(r'\\[1-9]|\(\?P=')
+# Prefix of the named groups of the terms in the combined regex of a project index.
+_COMBINED_GROUP_PREFIX = 'esgvoc_term_'
+
+
+def _get_project_session(project_id: str) -> Session|None:
+    return create_session(service.state_service.projects[project_id])
 
 def _get_project_session_with_exception(project_id: str) -> Session:
-    if connection:=_get_project_connection(project_id):
-        project_session = connection.create_session()
+    if project_session:=create_session(service.state_service.projects[project_id]):
         return project_session
     else:
         raise ValueError(f'unable to find project {project_id}')
@@ -31,9 +53,25 @@ def _get_project_session_with_exception(project_id: str) -> Session:
 def _resolve_term(term_composite_part: dict,
                   universe_session: Session,
                   project_session: Session) -> UTerm|PTerm:
-    '''First find the term in the universe than in the current project'''
+    '''
+    First find the term in the universe than in the current project.
+    The resolved terms are cached in the project session, so the parts of the composites
+    are resolved once for all the values validated with the same sessions.
+    '''
     term_id = term_composite_part[esgvoc.core.constants.TERM_ID_JSON_KEY]
     term_type = term_composite_part[esgvoc.core.constants.TERM_TYPE_JSON_KEY]
+    resolved_terms = project_session.info.setdefault(_RESOLVED_TERMS_SESSION_INFO_KEY, dict())
+    key = (term_type, term_id)
+    if key not in resolved_terms:
+        resolved_terms[key] = _find_term_to_resolve(term_id, term_type,
+                                                    universe_session, project_session)
+    return resolved_terms[key]
+
+
+def _find_term_to_resolve(term_id: str,
+                          term_type: str,
+                          universe_session: Session,
+                          project_session: Session) -> UTerm|PTerm:
     uterms = universe._find_terms_in_data_descriptor(data_descriptor_id=term_type,
                                                      term_id=term_id,
                                                      session=universe_session,
@@ -53,13 +91,14 @@ def _resolve_term(term_composite_part: dict,
 
 
 def _get_term_composite_separator_parts(term: UTerm|PTerm) -> tuple[str, list]:
-    separator = term.specs[esgvoc.core.constants.COMPOSITE_SEPARATOR_JSON_KEY]
     parts = term.specs[esgvoc.core.constants.COMPOSITE_PARTS_JSON_KEY]
-    return separator, parts
+    return term.separator or '', parts
+
+
+def _is_composite_part_required(part: dict) -> bool:
+    return part.get(esgvoc.core.constants.COMPOSITE_REQUIRED_PART_JSON_KEY, True)
 
 
-# TODO: support optionality of parts of composite.
-# It is backtrack possible for more than one missing parts.
 def _valid_value_term_composite_with_separator(value: str,
                                                term: UTerm|PTerm,
                                                universe_session: Session,
@@ -67,7 +106,31 @@ def _valid_value_term_composite_with_separator(value: str,
                                                    -> list[ValidationError]:
     result = list()
     separator, parts = _get_term_composite_separator_parts(term)
-    if separator in value:
+    is_required = [_is_composite_part_required(part) for part in parts]
+    if not all(is_required):
+        # The splits are aligned on the parts by dynamic programming (see _alignment).
+        part_errors: dict[tuple[int, str], list[ValidationError]] = dict()
+
+        def matches(part_index: int, split: str) -> bool:
+            if (part_index, split) not in part_errors:
+                resolved_term = _resolve_term(parts[part_index], universe_session,
+                                              project_session)
+                part_errors[(part_index, split)] = _valid_value(split, resolved_term,
+                                                                universe_session,
+                                                                project_session)
+            return not part_errors[(part_index, split)]
+        splits = value.split(separator)
+        if not fully_matches(is_required, splits, matches):
+            # Same errors as the required parts, along the best alignment: the errors of
+            # the parts that don't match their split, the composite error if some splits
+            # are missing or extra.
+            _, steps = align(is_required, splits, matches)
+            for step, part_index, split_index in steps:
+                if step == Step.MISMATCH:
+                    result.extend(part_errors[(part_index, splits[split_index])])  # type: ignore[index]
+            if any(step in (Step.MISSING, Step.EXTRA) for step, _, _ in steps):
+                result.append(_create_term_error(value, term))
+    elif separator in value:
         splits = value.split(separator)
         if len(splits) == len(parts):
             for index in range(0, len(splits)):
@@ -92,24 +155,75 @@ def _transform_to_pattern(term: UTerm|PTerm,
                           project_session: Session) -> str:
     match term.kind:
         case TermKind.PLAIN:
-            result = term.specs[esgvoc.core.constants.DRS_SPECS_JSON_KEY]
+            result = term.drs_name
         case TermKind.PATTERN:
-            result = term.specs[esgvoc.core.constants.PATTERN_JSON_KEY]
+            result = term.regex
         case TermKind.COMPOSITE:
             separator, parts =  _get_term_composite_separator_parts(term)
-            result = ""
-            for part in parts:
-                resolved_term = _resolve_term(part, universe_session, project_session)
-                pattern = _transform_to_pattern(resolved_term, universe_session, project_session)
-                result = f'{result}{pattern}{separator}'
-            result = result.rstrip(separator)
+            is_required = [_is_composite_part_required(part) for part in parts]
+            patterns = [_transform_to_pattern(_resolve_term(part, universe_session,
+                                                            project_session),
+                                              universe_session, project_session)
+                        for part in parts]
+            if any(is_required):
+                # The separator of an optional part is optional too: the parts before the
+                # first required part are followed by their separator, the others are
+                # preceded by it.
+                first_required = is_required.index(True)
+                result = ""
+                for index, pattern in enumerate(patterns):
+                    if index < first_required:
+                        pattern = f'{pattern}{separator}'
+                    elif index > first_required:
+                        pattern = f'{separator}{pattern}'
+                    result = f'{result}{pattern}' if is_required[index] \
+                             else f'{result}(?:{pattern})?'
+            else:
+                # All the parts are optional: one alternative per first present part, that
+                # isn't preceded by the separator.
+                alternatives = [patterns[first] + \
+                                ''.join(f'(?:{separator}{pattern})?'
+                                        for pattern in patterns[first + 1:])
+                                for first in range(len(patterns))]
+                result = '(?:' + '|'.join(alternatives) + ')?'
         case _:
             raise NotImplementedError(f'unsupported term kind {term.kind}')
     return result
 
 
-# TODO: support optionality of parts of composite.
-# It is backtrack possible for more than one missing parts.
+def _compile_term_composite_separator_less(term: UTerm|PTerm,
+                                           universe_session: Session,
+                                           project_session: Session) -> re.Pattern:
+    pattern = _transform_to_pattern(term, universe_session, project_session)
+    try:
+        # Term patterns are meant to be validated individually.
+        # So their regex are defined as a whole (begins by a ^, ends by a $).
+        # As the pattern is a concatenation of plain or regex, multiple ^ and $ can exist.
+        # The later, must be removed.
+        pattern = pattern.replace('^', '').replace('$', '')
+        pattern = f'^{pattern}$'
+        return re.compile(pattern)
+    except Exception as e:
+        msg = f'regex compilation error:\n{e}'
+        raise ValueError(msg) from e
+
+
+def _get_term_composite_separator_less_regex(term: UTerm|PTerm,
+                                             universe_session: Session,
+                                             project_session: Session) -> re.Pattern:
+    # The parts of a composite may be resolved in both databases: the regex is bound to
+    # the version of the database of the term and keyed by the version of the other one.
+    if isinstance(term, UTerm):
+        term_session, other_session = universe_session, project_session
+    else:
+        term_session, other_session = project_session, universe_session
+    return _COMPOSITE_PATTERN_CACHE.get(get_db_version(term_session),
+                                        (term.pk, get_db_version(other_session)),
+                                        lambda: _compile_term_composite_separator_less(term,
+                                                                                       universe_session,
+                                                                                       project_session))
+
+
 def _valid_value_term_composite_separator_less(value: str,
                                                term: UTerm|PTerm,
                                                universe_session: Session,
@@ -117,18 +231,7 @@ def _valid_value_term_composite_separator_less(value: str,
                                                    -> list[ValidationError]:
     result = list()
     try:
-        pattern = _transform_to_pattern(term, universe_session, project_session)
-        try:
-            # Term patterns are meant to be validated individually.
-            # So their regex are defined as a whole (begins by a ^, ends by a $).
-            # As the pattern is a concatenation of plain or regex, multiple ^ and $ can exist.
-            # The later, must be removed.
-            pattern = pattern.replace('^', '').replace('$', '')
-            pattern = f'^{pattern}$'
-            regex = re.compile(pattern)
-        except Exception as e:
-            msg = f'regex compilation error:\n{e}'
-            raise ValueError(msg) from e    
+        regex = _get_term_composite_separator_less_regex(term, universe_session, project_session)
         match = regex.match(value)
         if match is None:
             result.append(_create_term_error(value, term))
@@ -144,8 +247,7 @@ def _valid_value_for_term_composite(value: str,
                                     project_session: Session)\
                                         -> list[ValidationError]:
     result = list()
-    separator, _ = _get_term_composite_separator_parts(term)
-    if separator:
+    if term.separator:
         result = _valid_value_term_composite_with_separator(value, term, universe_session,
                                                             project_session)
     else:
@@ -161,6 +263,17 @@ def _create_term_error(value: str, term: UTerm|PTerm) -> ValidationError:
         return ProjectTermError(value, term)
 
 
+def _get_term_session(term: UTerm|PTerm,
+                      universe_session: Session,
+                      project_session: Session) -> Session:
+    return universe_session if isinstance(term, UTerm) else project_session
+
+
+def _get_compiled_pattern(term: UTerm|PTerm, session: Session) -> re.Pattern:
+    return _PATTERN_CACHE.get(get_db_version(session), term.pk,
+                              lambda: re.compile(term.regex))  # type: ignore[arg-type]
+
+
 def _valid_value(value: str,
                  term: UTerm|PTerm,
                  universe_session: Session,
@@ -168,11 +281,12 @@ def _valid_value(value: str,
     result = list()
     match term.kind:
         case TermKind.PLAIN:
-            if term.specs[esgvoc.core.constants.DRS_SPECS_JSON_KEY] != value:
+            if term.drs_name != value:
                 result.append(_create_term_error(value, term))
         case TermKind.PATTERN:
-            # OPTIM: Pattern can be compiled and stored for further matching.
-            pattern_match = re.match(term.specs[esgvoc.core.constants.PATTERN_JSON_KEY], value)
+            regex = _get_compiled_pattern(term, _get_term_session(term, universe_session,
+                                                                  project_session))
+            pattern_match = regex.match(value)
             if pattern_match is None:
                 result.append(_create_term_error(value, term))
         case TermKind.COMPOSITE:
@@ -193,15 +307,26 @@ def _check_and_strip_value(value: str) -> str:
         raise ValueError('value should not be empty')
 
 
+def _build_drs_name_index(project_session: Session) -> dict[tuple[str, str], str]:
+    result: dict[tuple[str, str], str] = dict()
+    statement = select(Collection.id, PTerm.id, PTerm.drs_name).select_from(PTerm) \
+                .join(Collection).where(col(PTerm.drs_name).is_not(None))
+    for collection_id, term_id, drs_name in project_session.exec(statement):
+        if drs_name:
+            result.setdefault((collection_id, drs_name), term_id)
+    return result
+
+
+def _get_drs_name_index(project_session: Session) -> dict[tuple[str, str], str]:
+    return _DRS_NAME_INDEX_CACHE.get(get_db_version(project_session), _DRS_NAME_INDEX_KEY,
+                                     lambda: _build_drs_name_index(project_session))
+
+
 def _search_plain_term_and_valid_value(value: str,
                                        collection_id: str,
                                        project_session: Session) \
                                         -> str|None:
-    where_expression = and_(Collection.id == collection_id,
-                            PTerm.specs[esgvoc.core.constants.DRS_SPECS_JSON_KEY] == f'"{value}"')
-    statement = select(PTerm).join(Collection).where(where_expression)
-    term = project_session.exec(statement).one_or_none()
-    return term.id if term else None
+    return _get_drs_name_index(project_session).get((collection_id, value))
 
 
 def _valid_value_against_all_terms_of_collection(value: str,
@@ -222,12 +347,207 @@ def _valid_value_against_all_terms_of_collection(value: str,
         raise RuntimeError(f'collection {collection.id} has no term')
 
 
-def _valid_value_against_given_term(value: str,
-                                    collection_id: str,
-                                    term_id: str,
-                                    universe_session: Session,
-                                    project_session: Session)\
-                                        -> list[ValidationError]:
+def _compile_term_matcher(term: UTerm|PTerm,
+                          universe_session: Session,
+                          project_session: Session) -> Callable[[str], bool]:
+    '''
+    Compiles the term into a function that tells if a value validates the term,
+    following the same rules as _valid_value but without any database access.
+    '''
+    match term.kind:
+        case TermKind.PLAIN:
+            drs_name = term.drs_name
+            return lambda value: value == drs_name
+        case TermKind.PATTERN:
+            regex = _get_compiled_pattern(term, _get_term_session(term, universe_session,
+                                                                  project_session))
+            return lambda value: regex.match(value) is not None
+        case TermKind.COMPOSITE:
+            separator, parts = _get_term_composite_separator_parts(term)
+            if separator:
+                part_matchers = [_compile_term_matcher(_resolve_term(part, universe_session,
+                                                                     project_session),
+                                                       universe_session, project_session)
+                                 for part in parts]
+                is_required = [_is_composite_part_required(part) for part in parts]
+                if not all(is_required):
+                    return lambda value: fully_matches(is_required, value.split(separator),
+                                                       lambda index, split: \
+                                                           part_matchers[index](split))
+
+                def matcher(value: str) -> bool:
+                    if separator not in value:
+                        return False
+                    splits = value.split(separator)
+                    return len(splits) == len(part_matchers) and \
+                           all(part_matcher(split) for part_matcher, split in zip(part_matchers,
+                                                                                  splits))
+                return matcher
+            else:
+                regex = _get_term_composite_separator_less_regex(term, universe_session,
+                                                                 project_session)
+                return lambda value: regex.match(value) is not None
+        case _:
+            raise NotImplementedError(f'unsupported term kind {term.kind}')
+
+
+def _get_combinable_pattern(term: UTerm|PTerm,
+                            universe_session: Session,
+                            project_session: Session) -> str|None:
+    match term.kind:
+        case TermKind.PATTERN:
+            pattern = term.regex
+        case TermKind.COMPOSITE if not term.separator:
+            pattern = _get_term_composite_separator_less_regex(term, universe_session,
+                                                               project_session).pattern
+        case _:
+            return None
+    # Back references can't be combined as the groups are renumbered.
+    return None if _BACK_REFERENCE_REGEX.search(pattern) else pattern
+
+
+class _ProjectIndex:
+    '''
+    Index of all the terms of a project, so as to find the terms that a value matches
+    without any database access:
+    - the drs_names of the plain terms are stored in a dictionary;
+    - the other terms are compiled into matchers. The regex of the pattern terms and the
+      separator less composites are combined into one alternation of named groups: a regex
+      match returns the first of these terms that the value matches, if any, and the next
+      ones are searched in the alternation of the following terms. So the cost of a value is
+      one regex match per matching term plus one, whatever the number of terms.
+    The matching terms are returned in the order of the collections then the terms.
+    '''
+    def __init__(self,
+                 project_id: str,
+                 universe_session: Session,
+                 project_session: Session) -> None:
+        self.plain_terms: dict[str, list[tuple[int, MatchingTerm]]] = dict()
+        self.combined_matchers: list[tuple[int, MatchingTerm, Callable[[str], bool]]] = list()
+        self.other_matchers: list[tuple[int, MatchingTerm, Callable[[str], bool]]] = list()
+        # The matchers of the non plain terms, by collection id.
+        self.collection_matchers: dict[str, list[tuple[int, MatchingTerm,
+                                                       Callable[[str], bool]]]] = dict()
+        combined_patterns: list[str] = list()
+        rank = 0
+        for collection in _get_all_collections_in_project(project_session, with_terms=True):
+            if collection.term_kind != TermKind.PLAIN and not collection.terms:
+                raise RuntimeError(f'collection {collection.id} has no term')
+            collection_matchers = self.collection_matchers.setdefault(collection.id, list())
+            drs_names_found: set[str] = set()
+            for term in collection.terms:
+                rank += 1
+                matching_term = MatchingTerm(project_id, collection.id, term.id)
+                if collection.term_kind == TermKind.PLAIN:
+                    # Same as the drs_name index: the first term of the collection wins.
+                    drs_name = term.drs_name
+                    if drs_name and drs_name not in drs_names_found:
+                        drs_names_found.add(drs_name)
+                        self.plain_terms.setdefault(drs_name, list()).append((rank, matching_term))
+                elif term.kind == TermKind.PLAIN:
+                    drs_name = term.drs_name
+                    self.plain_terms.setdefault(drs_name, list()).append((rank, matching_term))
+                else:
+                    matcher = _compile_term_matcher(term, universe_session, project_session)
+                    pattern = _get_combinable_pattern(term, universe_session, project_session)
+                    collection_matchers.append((rank, matching_term, matcher))
+                    if pattern is None:
+                        self.other_matchers.append((rank, matching_term, matcher))
+                    else:
+                        combined_patterns.append(pattern)
+                        self.combined_matchers.append((rank, matching_term, matcher))
+        self.project_id = project_id
+        self.combined_patterns = combined_patterns
+        # The alternations of the combined patterns from a given index, built on first use
+        # (None if the patterns can't be combined).
+        self.combined_regexes: dict[int, re.Pattern|None] = dict()
+
+    def _get_combined_regex(self, start: int) -> re.Pattern|None:
+        if start not in self.combined_regexes:
+            try:
+                regex: re.Pattern|None = re.compile('|'.join(
+                    f'(?P<{_COMBINED_GROUP_PREFIX}{index}>{self.combined_patterns[index]})'
+                    for index in range(start, len(self.combined_patterns))))
+            except re.error as e:
+                # Patterns that can't be combined (e.g., inline flags): linear matching.
+                _LOGGER.debug(f'no combined regex for the terms of project {self.project_id}: '
+                              + str(e))
+                regex = None
+            self.combined_regexes[start] = regex
+        return self.combined_regexes[start]
+
+    def _match_combined(self, value: str) -> Iterator[tuple[int, MatchingTerm,
+                                                             Callable[[str], bool]]]:
+        start = 0
+        while start < len(self.combined_matchers):
+            regex = self._get_combined_regex(start)
+            if regex is None:
+                yield from (item for item in self.combined_matchers[start:] if item[2](value))
+                return
+            match = regex.match(value)
+            if match is None or match.lastgroup is None:
+                return
+            # The group of the term closes after the groups of its pattern. The group matches
+            # as the regex of the term does: the matcher of the term is not called.
+            index = int(match.lastgroup[len(_COMBINED_GROUP_PREFIX):])
+            yield self.combined_matchers[index]
+            start = index + 1
+
+    def match(self, value: str) -> list[MatchingTerm]:
+        found = list(self.plain_terms.get(value, ()))
+        found.extend(self._match_combined(value))
+        found.extend(item for item in self.other_matchers if item[2](value))
+        if len(found) > 1:
+            found.sort(key=lambda item: item[0])
+        return [item[1] for item in found]
+
+    def has_collection(self, collection_id: str) -> bool:
+        return collection_id in self.collection_matchers
+
+    def match_in_collection(self, value: str, collection_id: str) -> list[MatchingTerm]:
+        found = [item for item in self.plain_terms.get(value, ())
+                 if item[1].collection_id == collection_id]
+        found.extend(item for item in self.collection_matchers.get(collection_id, ())
+                     if item[2](value))
+        if len(found) > 1:
+            found.sort(key=lambda item: item[0])
+        return [item[1] for item in found]
+
+
+def _get_project_index(project_id: str,
+                       universe_session: Session,
+                       project_session: Session) -> _ProjectIndex:
+    # The composites of the project may be resolved in the universe.
+    return _PROJECT_INDEX_CACHE.get(get_db_version(project_session),
+                                    (project_id, get_db_version(universe_session)),
+                                    lambda: _ProjectIndex(project_id, universe_session,
+                                                          project_session))
+
+
+def _load_project_index(project_id: str) -> _ProjectIndex:
+    with get_universe_session() as universe_session, \
+         _get_project_session_with_exception(project_id) as project_session:
+        return _get_project_index(project_id, universe_session, project_session)
+
+
+def _valid_values(values: Iterable[str], validator: Callable[[str], T]) -> list[T]:
+    # Repeated values are validated once: their results are shared.
+    results: dict[str, T] = dict()
+    result: list[T] = list()
+    for value in values:
+        if value not in results:
+            results[value] = validator(_check_and_strip_value(value))
+        result.append(results[value])
+    return result
+
+
+def _create_given_term_validator(collection_id: str,
+                                 term_id: str,
+                                 universe_session: Session,
+                                 project_session: Session)\
+                                     -> Callable[[str], list[ValidationError]]:
+    msg = f'unable to valid term {term_id} ' +\
+          f'in collection {collection_id}'
     try:
         terms = _find_terms_in_collection(collection_id,
                                           term_id,
@@ -235,15 +555,29 @@ def _valid_value_against_given_term(value: str,
                                           None)
         if terms:
             term = terms[0]
-            result = _valid_value(value, term, universe_session, project_session)
         else:
             raise ValueError(f'unable to find term {term_id} ' +
                              f'in collection {collection_id}')
     except Exception as e:
-        msg = f'unable to valid term {term_id} ' +\
-              f'in collection {collection_id}'
         raise RuntimeError(msg) from e
-    return result
+
+    def validator(value: str) -> list[ValidationError]:
+        try:
+            return _valid_value(value, term, universe_session, project_session)
+        except Exception as e:
+            raise RuntimeError(msg) from e
+    return validator
+
+
+def _valid_value_against_given_term(value: str,
+                                    collection_id: str,
+                                    term_id: str,
+                                    universe_session: Session,
+                                    project_session: Session)\
+                                        -> list[ValidationError]:
+    validator = _create_given_term_validator(collection_id, term_id,
+                                             universe_session, project_session)
+    return validator(value)
 
 
 def valid_term(value: str,
@@ -288,19 +622,47 @@ def valid_term(value: str,
         return ValidationReport(value, errors)
 
 
-def _valid_term_in_collection(value: str,
-                              project_id: str,
-                              collection_id: str,
-                              universe_session: Session,
-                              project_session: Session) \
-                                -> list[MatchingTerm]:
-    value = _check_and_strip_value(value)
-    result = list()
-    collections = _find_collections_in_project(collection_id,
-                                               project_session,
-                                               None)
-    if collections:
-        collection = collections[0]
+def valid_terms(values: Iterable[str],
+                project_id: str,
+                collection_id: str,
+                term_id: str) \
+                   -> list[ValidationReport]:
+    """
+    Batch version of `valid_term`: check if the given values may or may not represent
+    the given term. The sessions and the term are fetched once for all the values and
+    the repeated values are validated once.
+    
+    If any of the provided ids (`project_id`, `collection_id` or `term_id`) is not found,
+    the function raises a ValueError.
+
+    :param values: The values to be validated
+    :type values: Iterable[str]
+    :param project_id: A project id
+    :type project_id: str
+    :param collection_id: A collection id
+    :type collection_id: str
+    :param term_id: A term id
+    :type term_id: str
+    :returns: The validation reports, in the order of the given values
+    :rtype: list[ValidationReport]
+    :raises ValueError: If any of the provided ids is not found
+    """
+    with get_universe_session() as universe_session, \
+         _get_project_session_with_exception(project_id) as project_session:
+        validator = _create_given_term_validator(collection_id, term_id,
+                                                 universe_session, project_session)
+        return _valid_values(values, lambda value: ValidationReport(value, validator(value)))
+
+
+def _create_validator_of_collection(project_id: str,
+                                   collection: Collection,
+                                   universe_session: Session,
+                                   project_session: Session) \
+                                       -> Callable[[str], list[MatchingTerm]]:
+    collection_id = collection.id
+
+    def validator(value: str) -> list[MatchingTerm]:
+        result = list()
         match collection.term_kind:
             case TermKind.PLAIN:
                 term_id_found = _search_plain_term_and_valid_value(value, collection_id,
@@ -313,10 +675,36 @@ def _valid_term_in_collection(value: str,
                                                                               project_session)
                 for term_id_found in term_ids_found:
                     result.append(MatchingTerm(project_id, collection_id, term_id_found))
+        return result
+    return validator
+
+
+def _create_collection_validator(project_id: str,
+                                 collection_id: str,
+                                 universe_session: Session,
+                                 project_session: Session) \
+                                     -> Callable[[str], list[MatchingTerm]]:
+    collections = _find_collections_in_project(collection_id,
+                                               project_session,
+                                               None)
+    if collections:
+        return _create_validator_of_collection(project_id, collections[0],
+                                               universe_session, project_session)
     else:
         msg = f'unable to find collection {collection_id}'
         raise ValueError(msg)
-    return result
+
+
+def _valid_term_in_collection(value: str,
+                              project_id: str,
+                              collection_id: str,
+                              universe_session: Session,
+                              project_session: Session) \
+                                -> list[MatchingTerm]:
+    value = _check_and_strip_value(value)
+    validator = _create_collection_validator(project_id, collection_id,
+                                             universe_session, project_session)
+    return validator(value)
 
 
 def valid_term_in_collection(value: str,
@@ -356,16 +744,49 @@ def valid_term_in_collection(value: str,
                                          universe_session, project_session)
 
 
+def valid_terms_in_collection(values: Iterable[str],
+                              project_id: str,
+                              collection_id: str) \
+                                -> list[list[MatchingTerm]]:
+    """
+    Batch version of `valid_term_in_collection`: check if the given values may or may not
+    represent a term in the given collection. The sessions and the collection are fetched once
+    for all the values and the repeated values are validated once.
+
+    If any of the provided ids (`project_id` or `collection_id`) is not found,
+    the function raises a ValueError.
+
+    :param values: The values to be validated
+    :type values: Iterable[str]
+    :param project_id: A project id
+    :type project_id: str
+    :param collection_id: A collection id
+    :type collection_id: str
+    :returns: The lists of terms that the values match, in the order of the given values.
+    :rtype: list[list[MatchingTerm]]
+    :raises ValueError: If any of the provided ids is not found
+    """
+    with get_universe_session() as universe_session, \
+         _get_project_session_with_exception(project_id) as project_session:
+        validator = _create_collection_validator(project_id, collection_id,
+                                                 universe_session, project_session)
+        return _valid_values(values, validator)
+
+
+def _create_project_validator(project_id: str,
+                              universe_session: Session,
+                              project_session: Session) \
+                                  -> Callable[[str], list[MatchingTerm]]:
+    return _get_project_index(project_id, universe_session, project_session).match
+
+
 def _valid_term_in_project(value: str,
                            project_id: str,
                            universe_session: Session,
                            project_session: Session) -> list[MatchingTerm]:
-    result = list()
-    collections = _get_all_collections_in_project(project_session)
-    for collection in collections:
-        result.extend(_valid_term_in_collection(value, project_id, collection.id,
-                                                universe_session, project_session))
-    return result
+    value = _check_and_strip_value(value)
+    validator = _create_project_validator(project_id, universe_session, project_session)
+    return validator(value)
 
 
 def valid_term_in_project(value: str, project_id: str) -> list[MatchingTerm]:
@@ -398,7 +819,29 @@ def valid_term_in_project(value: str, project_id: str) -> list[MatchingTerm]:
         return _valid_term_in_project(value, project_id, universe_session, project_session)
 
 
-def valid_term_in_all_projects(value: str) -> list[MatchingTerm]:
+def valid_terms_in_project(values: Iterable[str], project_id: str) -> list[list[MatchingTerm]]:
+    """
+    Batch version of `valid_term_in_project`: check if the given values may or may not
+    represent a term in the given project. The sessions and the collections are fetched once
+    for all the values and the repeated values are validated once.
+
+    If the `project_id` is not found, the function raises a ValueError.
+
+    :param values: The values to be validated
+    :type values: Iterable[str]
+    :param project_id: A project id
+    :type project_id: str
+    :returns: The lists of terms that the values match, in the order of the given values.
+    :rtype: list[list[MatchingTerm]]
+    :raises ValueError: If the `project_id` is not found
+    """
+    with get_universe_session() as universe_session, \
+         _get_project_session_with_exception(project_id) as project_session:
+        validator = _create_project_validator(project_id, universe_session, project_session)
+        return _valid_values(values, validator)
+
+
+def valid_term_in_all_projects(value: str, max_workers: int = 1) -> list[MatchingTerm]:
     """
     Check if the given value may or may not represent a term in all projects. The function
     returns the terms that the value matches.
@@ -415,15 +858,45 @@ def valid_term_in_all_projects(value: str) -> list[MatchingTerm]:
 
     :param value: A value to be validated
     :type value: str
+    :param max_workers: Number of threads processing the projects concurrently (1: sequentially)
+    :type max_workers: int
     :returns: The list of terms that the value matches.
     :rtype: list[MatchingTerm]
     """
-    result = list()
-    with get_universe_session() as universe_session:
-        for project_id in get_all_projects():
-            with _get_project_session_with_exception(project_id) as project_session:
-                result.extend(_valid_term_in_project(value, project_id,
-                                                     universe_session, project_session))
+    def valid_term_in_given_project(project_id: str) -> list[MatchingTerm]:
+        with get_universe_session() as universe_session, \
+             _get_project_session_with_exception(project_id) as project_session:
+            return _valid_term_in_project(value, project_id, universe_session, project_session)
+    return _map_all_projects(valid_term_in_given_project, max_workers)
+
+
+def valid_terms_in_all_projects(values: Iterable[str],
+                                max_workers: int = 1) -> list[list[MatchingTerm]]:
+    """
+    Batch version of `valid_term_in_all_projects`: check if the given values may or may not
+    represent a term in all projects. The sessions and the collections are fetched once
+    for all the values and the repeated values are validated once.
+
+    :param values: The values to be validated
+    :type values: Iterable[str]
+    :param max_workers: Number of threads processing the projects concurrently (1: sequentially)
+    :type max_workers: int
+    :returns: The lists of terms that the values match, in the order of the given values.
+    :rtype: list[list[MatchingTerm]]
+    """
+    values = list(values)
+
+    def valid_terms_in_given_project(project_id: str) -> list[list[MatchingTerm]]:
+        with get_universe_session() as universe_session, \
+             _get_project_session_with_exception(project_id) as project_session:
+            validator = _create_project_validator(project_id, universe_session,
+                                                  project_session)
+            return _valid_values(values, validator)
+    # The matching terms of a value are merged in the order of the projects.
+    result: list[list[MatchingTerm]] = [list() for _ in values]
+    for project_results in _apply_to_all_projects(valid_terms_in_given_project, max_workers):
+        for matching_terms, project_matching_terms in zip(result, project_results):
+            matching_terms.extend(project_matching_terms)
     return result
 
 
@@ -434,19 +907,46 @@ def _find_terms_in_collection(collection_id: str,
     """Settings only apply on the term_id comparison."""
     where_expression = create_str_comparison_expression(field=PTerm.id,
                                                         value=term_id,
-                                                        settings=settings)
+                                                        settings=settings,
+                                                        session=session)
+    # The collection is loaded with the terms (e.g., for the validation errors).
     statement = select(PTerm).join(Collection).where(Collection.id==collection_id,
-                                                     where_expression)
+                                                     where_expression) \
+                             .options(contains_eager(PTerm.collection))  # type: ignore[arg-type]
     results = session.exec(statement)
     result = results.all()    
     return result
 
 
+@overload
 def find_terms_in_collection(project_id:str,
                              collection_id: str,
                              term_id: str,
-                             settings: SearchSettings|None = None) \
-                                -> list[BaseModel]:
+                             settings: SearchSettings|None = None,
+                             raw: Literal[False] = False) -> list[BaseModel]: ...
+
+
+@overload
+def find_terms_in_collection(project_id:str,
+                             collection_id: str,
+                             term_id: str,
+                             settings: SearchSettings|None = None,
+                             *, raw: Literal[True]) -> list[dict]: ...
+
+
+@overload
+def find_terms_in_collection(project_id:str,
+                             collection_id: str,
+                             term_id: str,
+                             settings: SearchSettings|None = None,
+                             raw: bool = False) -> list[BaseModel]|list[dict]: ...
+
+
+def find_terms_in_collection(project_id:str,
+                             collection_id: str,
+                             term_id: str,
+                             settings: SearchSettings|None = None,
+                             raw: bool = False) -> list[BaseModel]|list[dict]:
     """
     Finds one or more terms, based on the specified search settings, in the given collection of a project.
     This function performs an exact match on the `project_id` and `collection_id`, 
@@ -470,14 +970,18 @@ def find_terms_in_collection(project_id:str,
     :type term_id: str
     :param settings: The search settings
     :type settings: SearchSettings|None
-    :returns: A list of Pydantic term instances. Returns an empty list if no matches are found.
-    :rtype: list[BaseModel]
+    :param raw: If `True`, returns the specs (dict) of the terms instead of their Pydantic
+      instances, without validating them
+    :type raw: bool
+    :returns: A list of Pydantic term instances (or specs). Returns an empty list if no matches
+    are found.
+    :rtype: list[BaseModel]|list[dict]
     """
-    result: list[BaseModel] = list()
-    if connection:=_get_project_connection(project_id):
-        with connection.create_session() as session:
+    result: list = list()
+    if project_session:=_get_project_session(project_id):
+        with project_session as session:
             terms = _find_terms_in_collection(collection_id, term_id, session, settings)
-            instantiate_pydantic_terms(terms, result)
+            instantiate_terms(terms, result, raw)
     return result
 
 
@@ -489,19 +993,49 @@ def _find_terms_from_data_descriptor_in_project(data_descriptor_id: str,
     """Settings only apply on the term_id comparison."""
     where_expression = create_str_comparison_expression(field=PTerm.id,
                                                         value=term_id,
-                                                        settings=settings)
+                                                        settings=settings,
+                                                        session=session)
     statement = select(PTerm).join(Collection).where(Collection.data_descriptor_id==data_descriptor_id,
-                                                     where_expression)
+                                                     where_expression) \
+                             .options(contains_eager(PTerm.collection))  # type: ignore[arg-type]
     results = session.exec(statement)
     result = results.all()    
     return result
 
 
+@overload
+def find_terms_from_data_descriptor_in_project(project_id: str,
+                                               data_descriptor_id: str,
+                                               term_id: str,
+                                               settings: SearchSettings|None = None,
+                                               raw: Literal[False] = False) \
+                                                  -> list[tuple[BaseModel, str]]: ...
+
+
+@overload
+def find_terms_from_data_descriptor_in_project(project_id: str,
+                                               data_descriptor_id: str,
+                                               term_id: str,
+                                               settings: SearchSettings|None = None,
+                                               *, raw: Literal[True]) \
+                                                  -> list[tuple[dict, str]]: ...
+
+
+@overload
 def find_terms_from_data_descriptor_in_project(project_id: str,
                                                data_descriptor_id: str,
                                                term_id: str,
-                                               settings: SearchSettings|None = None) \
-                                                  -> list[tuple[BaseModel, str]]:
+                                               settings: SearchSettings|None = None,
+                                               raw: bool = False) \
+                                                  -> list[tuple[BaseModel, str]]|list[tuple[dict, str]]: ...
+
+
+def find_terms_from_data_descriptor_in_project(project_id: str,
+                                               data_descriptor_id: str,
+                                               term_id: str,
+                                               settings: SearchSettings|None = None,
+                                               raw: bool = False) \
+                                                  -> list[tuple[BaseModel, str]]|list[tuple[dict, str]]:
     """
     Finds one or more terms in the given project which are instances of the given data descriptor
     in the universe, based on the specified search settings, in the given collection of a project.
@@ -527,28 +1061,59 @@ def find_terms_from_data_descriptor_in_project(project_id: str,
     :type term_id: str
     :param settings: The search settings
     :type settings: SearchSettings|None
-    :returns: A list of tuple of Pydantic term instances and related collection ids.
+    :param raw: If `True`, returns the specs of the terms
+    :type raw: bool
+    :returns: A list of tuple of Pydantic term instances (or specs) and related collection ids.
     Returns an empty list if no matches are found.
-    :rtype: list[tuple[BaseModel, str]]
+    :rtype: list[tuple[BaseModel, str]]|list[tuple[dict, str]]
     """
-    result = list()
-    if connection:=_get_project_connection(project_id):
-        with connection.create_session() as session:
+    result: list = list()
+    if project_session:=_get_project_session(project_id):
+        with project_session as session:
             terms = _find_terms_from_data_descriptor_in_project(data_descriptor_id,
                                                                 term_id,
                                                                 session,
                                                                 settings)
             for pterm in terms:
                 collection_id = pterm.collection.id
-                term = instantiate_pydantic_term(pterm)
+                term = instantiate_term(pterm, raw)
                 result.append((term, collection_id))
     return result
 
 
+@overload
+def find_terms_from_data_descriptor_in_all_projects(data_descriptor_id: str,
+                                                    term_id: str,
+                                                    settings: SearchSettings|None = None,
+                                                    max_workers: int = 1,
+                                                    raw: Literal[False] = False) \
+                                                       -> list[tuple[BaseModel, str]]: ...
+
+
+@overload
+def find_terms_from_data_descriptor_in_all_projects(data_descriptor_id: str,
+                                                    term_id: str,
+                                                    settings: SearchSettings|None = None,
+                                                    max_workers: int = 1,
+                                                    *, raw: Literal[True]) \
+                                                       -> list[tuple[dict, str]]: ...
+
+
+@overload
+def find_terms_from_data_descriptor_in_all_projects(data_descriptor_id: str,
+                                                    term_id: str,
+                                                    settings: SearchSettings|None = None,
+                                                    max_workers: int = 1,
+                                                    raw: bool = False) \
+                                                       -> list[tuple[BaseModel, str]]|list[tuple[dict, str]]: ...
+
+
 def find_terms_from_data_descriptor_in_all_projects(data_descriptor_id: str,
                                                     term_id: str,
-                                                    settings: SearchSettings|None = None) \
-                                                       -> list[tuple[BaseModel, str]]:
+                                                    settings: SearchSettings|None = None,
+                                                    max_workers: int = 1,
+                                                    raw: bool = False) \
+                                                       -> list[tuple[BaseModel, str]]|list[tuple[dict, str]]:
     """
     Finds one or more terms in all projects which are instances of the given data descriptor
     in the universe, based on the specified search settings, in the given collection of a project.
@@ -572,18 +1137,21 @@ def find_terms_from_data_descriptor_in_all_projects(data_descriptor_id: str,
     :type term_id: str
     :param settings: The search settings
     :type settings: SearchSettings|None
-    :returns: A list of tuple of Pydantic term instances and related collection ids.
+    :param max_workers: Number of threads processing the projects concurrently (1: sequentially)
+    :type max_workers: int
+    :param raw: If `True`, returns the specs of the terms
+    :type raw: bool
+    :returns: A list of tuple of Pydantic term instances (or specs) and related collection ids.
     Returns an empty list if no matches are found.
-    :rtype: list[tuple[BaseModel, str]]
+    :rtype: list[tuple[BaseModel, str]]|list[tuple[dict, str]]
     """
-    project_ids = get_all_projects()
-    result = list()
-    for project_id in project_ids:
-        result.extend(find_terms_from_data_descriptor_in_project(project_id,
-                                                                 data_descriptor_id,
-                                                                 term_id,
-                                                                 settings))
-    return result
+    return _map_all_projects(lambda project_id: \
+                                 find_terms_from_data_descriptor_in_project(project_id,
+                                                                            data_descriptor_id,
+                                                                            term_id,
+                                                                            settings,
+                                                                            raw),
+                             max_workers)
 
 
 def _find_terms_in_project(term_id: str,
@@ -591,15 +1159,38 @@ def _find_terms_in_project(term_id: str,
                            settings: SearchSettings|None) -> Sequence[PTerm]:
     where_expression = create_str_comparison_expression(field=PTerm.id,
                                                         value=term_id,
-                                                        settings=settings)
+                                                        settings=settings,
+                                                        session=session)
     statement = select(PTerm).where(where_expression)
     results = session.exec(statement).all()
     return results
 
 
+@overload
 def find_terms_in_all_projects(term_id: str,
-                               settings: SearchSettings|None = None) \
-                                  -> list[BaseModel]:
+                               settings: SearchSettings|None = None,
+                               max_workers: int = 1,
+                               raw: Literal[False] = False) -> list[BaseModel]: ...
+
+
+@overload
+def find_terms_in_all_projects(term_id: str,
+                               settings: SearchSettings|None = None,
+                               max_workers: int = 1,
+                               *, raw: Literal[True]) -> list[dict]: ...
+
+
+@overload
+def find_terms_in_all_projects(term_id: str,
+                               settings: SearchSettings|None = None,
+                               max_workers: int = 1,
+                               raw: bool = False) -> list[BaseModel]|list[dict]: ...
+
+
+def find_terms_in_all_projects(term_id: str,
+                               settings: SearchSettings|None = None,
+                               max_workers: int = 1,
+                               raw: bool = False) -> list[BaseModel]|list[dict]:
     """
     Finds one or more terms, based on the specified search settings, in all projects.
     The given `term_id` is searched according to the search type specified in the parameter `settings`,
@@ -612,20 +1203,44 @@ def find_terms_in_all_projects(term_id: str,
     :type term_id: str
     :param settings: The search settings
     :type settings: SearchSettings|None
-    :returns: A list of Pydantic term instances. Returns an empty list if no matches are found.
-    :rtype: list[BaseModel]
+    :param max_workers: Number of threads processing the projects concurrently (1: sequentially)
+    :type max_workers: int
+    :param raw: If `True`, returns the specs of the terms
+    :type raw: bool
+    :returns: A list of Pydantic term instances (or specs). Returns an empty list if no matches
+    are found.
+    :rtype: list[BaseModel]|list[dict]
     """
-    project_ids = get_all_projects()
-    result = list()
-    for project_id in project_ids:
-        result.extend(find_terms_in_project(project_id, term_id, settings))
-    return result
+    return _map_all_projects(lambda project_id: find_terms_in_project(project_id, term_id,
+                                                                      settings, raw),
+                             max_workers)
 
 
+@overload
 def find_terms_in_project(project_id: str,
                           term_id: str,
-                          settings: SearchSettings|None = None) \
-                            -> list[BaseModel]:
+                          settings: SearchSettings|None = None,
+                          raw: Literal[False] = False) -> list[BaseModel]: ...
+
+
+@overload
+def find_terms_in_project(project_id: str,
+                          term_id: str,
+                          settings: SearchSettings|None = None,
+                          *, raw: Literal[True]) -> list[dict]: ...
+
+
+@overload
+def find_terms_in_project(project_id: str,
+                          term_id: str,
+                          settings: SearchSettings|None = None,
+                          raw: bool = False) -> list[BaseModel]|list[dict]: ...
+
+
+def find_terms_in_project(project_id: str,
+                          term_id: str,
+                          settings: SearchSettings|None = None,
+                          raw: bool = False) -> list[BaseModel]|list[dict]:
     """
     Finds one or more terms, based on the specified search settings, in a project.
     This function performs an exact match on the `project_id` and 
@@ -643,20 +1258,41 @@ def find_terms_in_project(project_id: str,
     :type term_id: str
     :param settings: The search settings
     :type settings: SearchSettings|None
-    :returns: A list of Pydantic term instances. Returns an empty list if no matches are found.
-    :rtype: list[BaseModel]
+    :param raw: If `True`, returns the specs of the terms
+    :type raw: bool
+    :returns: A list of Pydantic term instances (or specs). Returns an empty list if no matches
+    are found.
+    :rtype: list[BaseModel]|list[dict]
     """
-    result: list[BaseModel] = list()
-    if connection:=_get_project_connection(project_id):
-        with connection.create_session() as session:
+    result: list = list()
+    if project_session:=_get_project_session(project_id):
+        with project_session as session:
             terms = _find_terms_in_project(term_id, session, settings)
-            instantiate_pydantic_terms(terms, result)
+            instantiate_terms(terms, result, raw)
     return result
 
 
+@overload
+def get_all_terms_in_collection(project_id: str,
+                                collection_id: str,
+                                raw: Literal[False] = False) -> list[BaseModel]: ...
+
+
+@overload
 def get_all_terms_in_collection(project_id: str,
-                                collection_id: str)\
-                                   -> list[BaseModel]:
+                                collection_id: str,
+                                *, raw: Literal[True]) -> list[dict]: ...
+
+
+@overload
+def get_all_terms_in_collection(project_id: str,
+                                collection_id: str,
+                                raw: bool = False) -> list[BaseModel]|list[dict]: ...
+
+
+def get_all_terms_in_collection(project_id: str,
+                                collection_id: str,
+                                raw: bool = False) -> list[BaseModel]|list[dict]:
     """
     Gets all terms of the given collection of a project.
     This function performs an exact match on the `project_id` and `collection_id`,
@@ -668,19 +1304,21 @@ def get_all_terms_in_collection(project_id: str,
     :type project_id: str
     :param collection_id: A collection id
     :type collection_id: str
-    :returns: a list of Pydantic term instances.
+    :param raw: If `True`, returns the specs of the terms
+    :type raw: bool
+    :returns: a list of Pydantic term instances (or specs).
     Returns an empty list if no matches are found.
-    :rtype: list[BaseModel]
+    :rtype: list[BaseModel]|list[dict]
     """
     result = list()
-    if connection:=_get_project_connection(project_id):
-        with connection.create_session() as session:
+    if project_session:=_get_project_session(project_id):
+        with project_session as session:
             collections = _find_collections_in_project(collection_id,
                                                        session,
                                                        None)
             if collections:
                 collection = collections[0]
-                result = _get_all_terms_in_collection(collection)
+                result = _get_all_terms_in_collection(collection, raw)
     return result
 
 
@@ -728,8 +1366,8 @@ def find_collections_in_project(project_id: str,
     :rtype: list[dict]
     """
     result = list()
-    if connection:=_get_project_connection(project_id):
-        with connection.create_session() as session:
+    if project_session:=_get_project_session(project_id):
+        with project_session as session:
             collections = _find_collections_in_project(collection_id,
                                                        session,
                                                        settings)
@@ -738,10 +1376,14 @@ def find_collections_in_project(project_id: str,
     return result
 
 
-def _get_all_collections_in_project(session: Session) -> list[Collection]:
-    project = session.get(Project, esgvoc.core.constants.SQLITE_FIRST_PK)
-    # Project can't be missing if session exists.
-    return project.collections # type: ignore
+def _get_all_collections_in_project(session: Session,
+                                    with_terms: bool = False) -> Sequence[Collection]:
+    # A project database has only one project.
+    statement = select(Collection).order_by(col(Collection.pk))
+    if with_terms:
+        # The terms of all the collections are loaded in one query.
+        statement = statement.options(selectinload(Collection.terms))  # type: ignore[arg-type]
+    return session.exec(statement).all()
 
 
 def get_all_collections_in_project(project_id: str) -> list[str]:
@@ -758,21 +1400,38 @@ def get_all_collections_in_project(project_id: str) -> list[str]:
     :rtype: list[str]
     """
     result = list()
-    if connection:=_get_project_connection(project_id):
-        with connection.create_session() as session:
+    if project_session:=_get_project_session(project_id):
+        with project_session as session:
             collections = _get_all_collections_in_project(session)
             for collection in collections:
                 result.append(collection.id)
     return result
 
 
-def _get_all_terms_in_collection(collection: Collection) -> list[BaseModel]:
-    result: list[BaseModel] = list()
-    instantiate_pydantic_terms(collection.terms, result)
+def _get_all_terms_in_collection(collection: Collection,
+                                 raw: bool = False) -> list[BaseModel]|list[dict]:
+    result: list = list()
+    instantiate_terms(collection.terms, result, raw)
     return result
 
 
-def get_all_terms_in_project(project_id: str) -> list[BaseModel]:
+@overload
+def get_all_terms_in_project(project_id: str,
+                             raw: Literal[False] = False) -> list[BaseModel]: ...
+
+
+@overload
+def get_all_terms_in_project(project_id: str,
+                             *, raw: Literal[True]) -> list[dict]: ...
+
+
+@overload
+def get_all_terms_in_project(project_id: str,
+                             raw: bool = False) -> list[BaseModel]|list[dict]: ...
+
+
+def get_all_terms_in_project(project_id: str,
+                             raw: bool = False) -> list[BaseModel]|list[dict]:
     """
     Gets all terms of the given project.
     This function performs an exact match on the `project_id` and 
@@ -782,32 +1441,56 @@ def get_all_terms_in_project(project_id: str) -> list[BaseModel]:
 
     :param project_id: A project id
     :type project_id: str
-    :returns: A list of Pydantic term instances.
+    :param raw: If `True`, returns the specs of the terms
+    :type raw: bool
+    :returns: A list of Pydantic term instances (or specs).
     Returns an empty list if no matches are found.
-    :rtype: list[BaseModel]
+    :rtype: list[BaseModel]|list[dict]
     """
-    result = list()
-    if connection:=_get_project_connection(project_id):
-        with connection.create_session() as session:
-            collections = _get_all_collections_in_project(session)
-            for collection in collections:
-                # Term may have some synonyms in a project.
-                result.extend(_get_all_terms_in_collection(collection))
+    result: list = list()
+    if project_session:=_get_project_session(project_id):
+        with project_session as session:
+            # One query for all the terms, in the order of the collections.
+            order_by = (col(PTerm.collection_pk), col(PTerm.pk))
+            # Term may have some synonyms in a project.
+            if raw:
+                # Only the specs column is loaded: no ORM object is built.
+                result.extend(session.exec(select(PTerm.specs).order_by(*order_by)).all())
+            else:
+                statement = select(PTerm).order_by(*order_by)
+                instantiate_terms(session.exec(statement).all(), result, raw)
     return result
 
 
-def get_all_terms_in_all_projects() -> list[BaseModel]:
+@overload
+def get_all_terms_in_all_projects(max_workers: int = 1,
+                                  raw: Literal[False] = False) -> list[BaseModel]: ...
+
+
+@overload
+def get_all_terms_in_all_projects(max_workers: int = 1,
+                                  *, raw: Literal[True]) -> list[dict]: ...
+
+
+@overload
+def get_all_terms_in_all_projects(max_workers: int = 1,
+                                  raw: bool = False) -> list[BaseModel]|list[dict]: ...
+
+
+def get_all_terms_in_all_projects(max_workers: int = 1,
+                                  raw: bool = False) -> list[BaseModel]|list[dict]:
     """
     Gets all terms of all projects.
 
-    :returns: A list of Pydantic term instances.
-    :rtype: list[BaseModel]
+    :param max_workers: Number of threads processing the projects concurrently (1: sequentially)
+    :type max_workers: int
+    :param raw: If `True`, returns the specs of the terms
+    :type raw: bool
+    :returns: A list of Pydantic term instances (or specs).
+    :rtype: list[BaseModel]|list[dict]
     """
-    project_ids = get_all_projects()
-    result = list()
-    for project_id in project_ids:
-        result.extend(get_all_terms_in_project(project_id))
-    return result
+    return _map_all_projects(lambda project_id: get_all_terms_in_project(project_id, raw),
+                             max_workers)
 
 
 def find_project(project_id: str) -> dict|None:
@@ -824,14 +1507,39 @@ def find_project(project_id: str) -> dict|None:
     :rtype: dict|None
     """
     result = None
-    if connection:=_get_project_connection(project_id):
-        with connection.create_session() as session:
+    if project_session:=_get_project_session(project_id):
+        with project_session as session:
             project = session.get(Project, esgvoc.core.constants.SQLITE_FIRST_PK)
             # Project can't be missing if session exists.
             result = project.specs # type: ignore
     return result
 
 
+def _apply_to_all_projects(function: Callable[[str], T], max_workers: int) -> list[T]:
+    '''
+    Applies the function to all the projects and returns the results in the order of
+    the projects. With more than one worker, the projects are processed by a thread pool: the
+    SQLite queries release the GIL and every call opens its own sessions.
+    '''
+    project_ids = get_all_projects()
+    if max_workers > 1 and len(project_ids) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(function, project_ids))
+    else:
+        return [function(project_id) for project_id in project_ids]
+
+
+def _map_all_projects(function: Callable[[str], list], max_workers: int) -> list:
+    '''
+    Applies the function to all the projects (see `_apply_to_all_projects`) and concatenates
+    the results in the order of the projects.
+    '''
+    result: list = list()
+    for project_result in _apply_to_all_projects(function, max_workers):
+        result.extend(project_result)
+    return result
+
+
 def get_all_projects() -> list[str]:
     """
     Gets all projects.
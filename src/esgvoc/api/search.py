@@ -2,8 +2,20 @@ from dataclasses import dataclass
 from enum import Enum
 
 from pydantic import BaseModel
-from sqlalchemy import ColumnElement, func
-from sqlmodel import col
+from sqlalchemy import ColumnElement, and_, column, func, literal_column, table, text
+from sqlmodel import Session, col, select
+
+from esgvoc.api._cache import DBCache
+from esgvoc.api._utils import get_db_version
+from esgvoc.core.db.fts import FTS_COLUMNS, FTS_MIN_QUERY_LENGTH, get_fts_table_name
+
+# Whether the full text search table of a table exists, keyed by table name.
+_FTS_TABLES_CACHE = DBCache()
+_REGEX_SPECIAL_CHARACTERS = frozenset('.^$*+?{}[]\\|()')
+# The quantifiers that make the preceding character optional.
+_REGEX_OPTIONAL_QUANTIFIERS = frozenset('*?{')
+_MAX_CODE_POINT = 0x10FFFF
+_SURROGATES = range(0xD800, 0xE000)
 
 
 @dataclass
@@ -27,17 +39,111 @@ class SearchSettings(BaseModel):
     not_operator: bool = False
 
 
+def _is_literal(value: str) -> bool:
+    return _REGEX_SPECIAL_CHARACTERS.isdisjoint(value)
+
+
+def _get_regex_literal_prefix(pattern: str) -> str:
+    '''
+    Returns the literal prefix of the strings that the regex matches (searched from the
+    beginning of the strings, like regexp_match does), or an empty string if there isn't any:
+    the regex is not anchored at the beginning, it has alternatives or begins with a special
+    character.
+    '''
+    if not pattern.startswith('^') or '|' in pattern:
+        return ''
+    result: list[str] = list()
+    index = 1
+    while index < len(pattern):
+        character = pattern[index]
+        if character == '\\':
+            # Only the escaped special characters are literals (e.g., \d is a class).
+            if index + 1 < len(pattern) and not pattern[index + 1].isalnum():
+                character = pattern[index + 1]
+                length = 2
+            else:
+                break
+        elif character in _REGEX_SPECIAL_CHARACTERS:
+            break
+        else:
+            length = 1
+        index += length
+        next_character = pattern[index] if index < len(pattern) else ''
+        if next_character and next_character in _REGEX_OPTIONAL_QUANTIFIERS:
+            break
+        result.append(character)
+        if next_character == '+':
+            break
+    return ''.join(result)
+
+
+def _create_prefix_range_expression(field: str, prefix: str) -> ColumnElement:
+    '''
+    Returns an expression that selects the strings that start with the given prefix, with
+    a range of the index of the field: prefix <= field < upper bound, where the upper bound
+    is the prefix whose last character is incremented (SQLite compares the strings
+    byte per byte, in the order of the code points).
+    '''
+    result = col(field) >= prefix
+    code_point = ord(prefix[-1]) + 1
+    if code_point in _SURROGATES:  # Can't be encoded in UTF-8.
+        code_point = _SURROGATES.stop
+    if code_point <= _MAX_CODE_POINT:
+        result = and_(result, col(field) < prefix[:-1] + chr(code_point))
+    return result
+
+
+def _has_fts_table(table_name: str, session: Session) -> bool:
+    fts_table_name = get_fts_table_name(table_name)
+
+    def exists() -> bool:
+        statement = text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name")
+        return session.connection().execute(statement, {'name': fts_table_name}).first() \
+               is not None
+    return _FTS_TABLES_CACHE.get(get_db_version(session), table_name, exists)
+
+
+def _create_fts_expression(field: str, value: str, session: Session|None) -> ColumnElement|None:
+    '''
+    Returns an expression that selects the rows whose field contains the value, regardless
+    of the case, through the full text search table of the table of the field. Returns None
+    if the table doesn't have one.
+    '''
+    if session is None or len(value) < FTS_MIN_QUERY_LENGTH:
+        return None
+    column_name = col(field).key
+    table_name = col(field).class_.__tablename__  # type: ignore[attr-defined]
+    if column_name not in FTS_COLUMNS or not _has_fts_table(table_name, session):
+        return None
+    fts_table_name = get_fts_table_name(table_name)
+    fts_table = table(fts_table_name, column('rowid'))
+    # A phrase of trigrams, restricted to the column.
+    phrase = value.replace('"', '""')
+    query = f'{column_name} : "{phrase}"'
+    fts_statement = select(fts_table.c.rowid) \
+                        .where(literal_column(fts_table_name).op('MATCH')(query))
+    return col(field).class_.pk.in_(fts_statement)  # type: ignore[attr-defined]
+
+
 def create_str_comparison_expression(field: str,
                                      value: str,
-                                     settings: SearchSettings|None) -> ColumnElement:
+                                     settings: SearchSettings|None,
+                                     session: Session|None = None) -> ColumnElement:
     '''
     SQLite LIKE is case insensitive (and so STARTS/ENDS_WITH which are implemented with LIKE).
-    So the case sensitive LIKE is implemented with REGEX.
+    So the case sensitive LIKE is implemented with REGEX, or with the native SQLite string
+    functions when the value doesn't have any regex special character.
+    The case sensitive STARTS_WITH and REGEX searches with a literal prefix are restricted to
+    the range of the index of the field that starts with this prefix, before any regex runs.
     The i versions of SQLAlchemy operators (icontains, etc.) are not useful
     (but other dbs than SQLite should use them).
+    If the `session` is provided and the table of the field has a full text search table
+    (see esgvoc.core.db.fts), the LIKE, STARTS_WITH and ENDS_WITH searches first select
+    the rows through it.
     If the provided `settings` is None, this functions returns an exact search expression.
     '''
     does_wild_cards_in_value_have_to_be_interpreted = False
+    is_prefix_range = False
     # Shortcut.
     if settings is None:
         return col(field).is_(other=value)
@@ -51,12 +157,15 @@ def create_str_comparison_expression(field: str,
                     else:
                         return col(field).is_(other=value)
                 else:
+                    # The NOCASE collation is the one of the case insensitive indexes.
                     if settings.not_operator:
-                        return func.lower(field) != func.lower(value)
+                        return col(field).collate('NOCASE') != value
                     else:
-                        return func.lower(field) == func.lower(value)
+                        return col(field).collate('NOCASE') == value
             case SearchType.LIKE:
-                if settings.case_sensitive:
+                if settings.case_sensitive and _is_literal(value):
+                    result = func.instr(field, value) > 0
+                elif settings.case_sensitive:
                     result = col(field).regexp_match(pattern=f".*{value}.*")
                 else:
                     result = col(field).contains(
@@ -64,15 +173,25 @@ def create_str_comparison_expression(field: str,
                         autoescape=not does_wild_cards_in_value_have_to_be_interpreted,
                     )
             case SearchType.STARTS_WITH:
-                if settings.case_sensitive:
+                if settings.case_sensitive and _is_literal(value):
+                    result = _create_prefix_range_expression(field, value) if value \
+                             else col(field).is_not(None)
+                    is_prefix_range = True
+                elif settings.case_sensitive:
                     result = col(field).regexp_match(pattern=f"^{value}.*")
+                    if prefix:=_get_regex_literal_prefix(f"^{value}"):
+                        result = and_(_create_prefix_range_expression(field, prefix), result)
                 else:
                     result = col(field).startswith(
                         other=value,
                         autoescape=not does_wild_cards_in_value_have_to_be_interpreted,
                     )
             case SearchType.ENDS_WITH:
-                if settings.case_sensitive:
+                if settings.case_sensitive and _is_literal(value):
+                    # substr(field, 0) is the whole field: an empty suffix matches any value.
+                    result = func.substr(field, -len(value)) == value if value \
+                             else col(field).is_not(None)
+                elif settings.case_sensitive:
                     result = col(field).regexp_match(pattern=f"{value}$")
                 else:
                     result = col(field).endswith(
@@ -82,11 +201,20 @@ def create_str_comparison_expression(field: str,
             case SearchType.REGEX:
                 if settings.case_sensitive:
                     result = col(field).regexp_match(pattern=value)
+                    # The regex only runs on the range of the index of its literal prefix.
+                    if prefix:=_get_regex_literal_prefix(value):
+                        result = and_(_create_prefix_range_expression(field, prefix), result)
                 else:
                     raise NotImplementedError(
                         "regex string comparison case insensitive is not implemented"
                     )
         if settings.not_operator:
             return ~result
-        else:
-            return result
\ No newline at end of file
+        # The value may contain regex special characters (e.g., a dot), that the regex
+        # expressions interpret: the full text search is restricted to literal values.
+        # A range of the index is more selective than the full text search.
+        if settings.type != SearchType.REGEX and not is_prefix_range and \
+           (not settings.case_sensitive or _is_literal(value)) and \
+           (fts_expression:=_create_fts_expression(field, value, session)) is not None:
+            return and_(fts_expression, result)
+        return result
\ No newline at end of file
@@ -1,11 +1,11 @@
-from typing import Sequence
+from typing import Literal, Sequence, overload
 
-from esgvoc.api._utils import (get_universe_session,
-                               instantiate_pydantic_terms)
+from esgvoc.api._utils import get_universe_session, instantiate_terms
 from esgvoc.api.search import SearchSettings, create_str_comparison_expression
 from esgvoc.core.db.models.universe import DataDescriptor, UTerm
 from pydantic import BaseModel
-from sqlmodel import Session, select
+from sqlalchemy.orm import contains_eager
+from sqlmodel import Session, col, select
 
 
 def _find_terms_in_data_descriptor(data_descriptor_id: str,
@@ -15,18 +15,42 @@ def _find_terms_in_data_descriptor(data_descriptor_id: str,
     """Settings only apply on the term_id comparison."""
     where_expression = create_str_comparison_expression(field=UTerm.id,
                                                         value=term_id,
-                                                        settings=settings)
+                                                        settings=settings,
+                                                        session=session)
+    # The data descriptor is loaded with the terms (e.g., for the validation errors).
     statement = select(UTerm).join(DataDescriptor).where(DataDescriptor.id==data_descriptor_id,
-                                                         where_expression)
+                                                         where_expression) \
+                             .options(contains_eager(UTerm.data_descriptor))  # type: ignore[arg-type]
     results = session.exec(statement)
     result = results.all()
     return result
 
 
+@overload
+def find_terms_in_data_descriptor(data_descriptor_id: str,
+                                  term_id: str,
+                                  settings: SearchSettings|None = None,
+                                  raw: Literal[False] = False) -> list[BaseModel]: ...
+
+
+@overload
+def find_terms_in_data_descriptor(data_descriptor_id: str,
+                                  term_id: str,
+                                  settings: SearchSettings|None = None,
+                                  *, raw: Literal[True]) -> list[dict]: ...
+
+
+@overload
+def find_terms_in_data_descriptor(data_descriptor_id: str,
+                                  term_id: str,
+                                  settings: SearchSettings|None = None,
+                                  raw: bool = False) -> list[BaseModel]|list[dict]: ...
+
+
 def find_terms_in_data_descriptor(data_descriptor_id: str,
                                   term_id: str,
-                                  settings: SearchSettings|None = None) \
-                                     -> list[BaseModel]:
+                                  settings: SearchSettings|None = None,
+                                  raw: bool = False) -> list[BaseModel]|list[dict]:
     """
     Finds one or more terms in the given data descriptor based on the specified search settings.
     This function performs an exact match on the `data_descriptor_id` and 
@@ -49,14 +73,17 @@ def find_terms_in_data_descriptor(data_descriptor_id: str,
     :type term_id: str
     :param settings: The search settings
     :type settings: SearchSettings|None
-    :returns: A list of Pydantic model term instances.
+    :param raw: If `True`, returns the specs (dict) of the terms instead of their Pydantic
+      instances, without validating them
+    :type raw: bool
+    :returns: A list of Pydantic model term instances (or specs).
     Returns an empty list if no matches are found.
-    :rtype: list[BaseModel]
+    :rtype: list[BaseModel]|list[dict]
     """
-    result: list[BaseModel] = list()
+    result: list = list()
     with get_universe_session() as session:
         terms = _find_terms_in_data_descriptor(data_descriptor_id, term_id, session, settings)
-        instantiate_pydantic_terms(terms, result)
+        instantiate_terms(terms, result, raw)
     return result
 
 
@@ -65,15 +92,34 @@ def _find_terms_in_universe(term_id: str,
                             settings: SearchSettings|None) -> Sequence[UTerm]:
     where_expression = create_str_comparison_expression(field=UTerm.id,
                                                         value=term_id,
-                                                        settings=settings)
+                                                        settings=settings,
+                                                        session=session)
     statement = select(UTerm).where(where_expression)
     results = session.exec(statement).all()
     return results
 
 
+@overload
+def find_terms_in_universe(term_id: str,
+                           settings: SearchSettings|None = None,
+                           raw: Literal[False] = False) -> list[BaseModel]: ...
+
+
+@overload
+def find_terms_in_universe(term_id: str,
+                           settings: SearchSettings|None = None,
+                           *, raw: Literal[True]) -> list[dict]: ...
+
+
+@overload
 def find_terms_in_universe(term_id: str,
-                           settings: SearchSettings|None = None) \
-                              -> list[BaseModel]:
+                           settings: SearchSettings|None = None,
+                           raw: bool = False) -> list[BaseModel]|list[dict]: ...
+
+
+def find_terms_in_universe(term_id: str,
+                           settings: SearchSettings|None = None,
+                           raw: bool = False) -> list[BaseModel]|list[dict]:
     """
     Finds one or more terms of the universe.
     The given `term_id` is searched according to the search type specified in 
@@ -87,19 +133,23 @@ def find_terms_in_universe(term_id: str,
     :type term_id: str
     :param settings: The search settings
     :type settings: SearchSettings|None
-    :returns: A list of Pydantic term instances. Returns an empty list if no matches are found.
-    :rtype: list[BaseModel]
+    :param raw: If `True`, returns the specs of the terms
+    :type raw: bool
+    :returns: A list of Pydantic term instances (or specs). Returns an empty list if no matches
+    are found.
+    :rtype: list[BaseModel]|list[dict]
     """
-    result: list[BaseModel] = list()
+    result: list = list()
     with get_universe_session() as session:
         terms = _find_terms_in_universe(term_id, session, settings)
-        instantiate_pydantic_terms(terms, result)
+        instantiate_terms(terms, result, raw)
     return result
 
 
-def _get_all_terms_in_data_descriptor(data_descriptor: DataDescriptor) -> list[BaseModel]:
-    result: list[BaseModel] = list()
-    instantiate_pydantic_terms(data_descriptor.terms, result)
+def _get_all_terms_in_data_descriptor(data_descriptor: DataDescriptor,
+                                      raw: bool = False) -> list[BaseModel]|list[dict]:
+    result: list = list()
+    instantiate_terms(data_descriptor.terms, result, raw)
     return result
 
 
@@ -115,8 +165,23 @@ def _find_data_descriptors_in_universe(data_descriptor_id: str,
     return result
 
 
-def get_all_terms_in_data_descriptor(data_descriptor_id: str) \
-                                        -> list[BaseModel]:
+@overload
+def get_all_terms_in_data_descriptor(data_descriptor_id: str,
+                                     raw: Literal[False] = False) -> list[BaseModel]: ...
+
+
+@overload
+def get_all_terms_in_data_descriptor(data_descriptor_id: str,
+                                     *, raw: Literal[True]) -> list[dict]: ...
+
+
+@overload
+def get_all_terms_in_data_descriptor(data_descriptor_id: str,
+                                     raw: bool = False) -> list[BaseModel]|list[dict]: ...
+
+
+def get_all_terms_in_data_descriptor(data_descriptor_id: str,
+                                     raw: bool = False) -> list[BaseModel]|list[dict]:
     """
     Gets all the terms of the given data descriptor.
     This function performs an exact match on the `data_descriptor_id` and does **not** search 
@@ -125,8 +190,11 @@ def get_all_terms_in_data_descriptor(data_descriptor_id: str) \
 
     :param data_descriptor_id: A data descriptor id
     :type data_descriptor_id: str
-    :returns: a list of Pydantic term instances. Returns an empty list if no matches are found.
-    :rtype: list[BaseModel]
+    :param raw: If `True`, returns the specs of the terms
+    :type raw: bool
+    :returns: a list of Pydantic term instances (or specs). Returns an empty list if no matches
+    are found.
+    :rtype: list[BaseModel]|list[dict]
     """
     with get_universe_session() as session:
         data_descriptors = _find_data_descriptors_in_universe(data_descriptor_id,
@@ -134,7 +202,7 @@ def get_all_terms_in_data_descriptor(data_descriptor_id: str) \
                                                               None)
         if data_descriptors:
             data_descriptor = data_descriptors[0]
-            result = _get_all_terms_in_data_descriptor(data_descriptor)
+            result = _get_all_terms_in_data_descriptor(data_descriptor, raw)
         else:
             result = list()
     return result
@@ -196,21 +264,39 @@ def get_all_data_descriptors_in_universe() -> list[str]:
     return result
 
 
-def get_all_terms_in_universe() -> list[BaseModel]:
+@overload
+def get_all_terms_in_universe(raw: Literal[False] = False) -> list[BaseModel]: ...
+
+
+@overload
+def get_all_terms_in_universe(*, raw: Literal[True]) -> list[dict]: ...
+
+
+@overload
+def get_all_terms_in_universe(raw: bool = False) -> list[BaseModel]|list[dict]: ...
+
+
+def get_all_terms_in_universe(raw: bool = False) -> list[BaseModel]|list[dict]:
     """
     Gets all the terms of the universe.
     Terms are unique within a data descriptor but may have some synonyms in the universe.
 
-    :returns: A list of Pydantic term instances.
-    :rtype: list[BaseModel]
+    :param raw: If `True`, returns the specs of the terms
+    :type raw: bool
+    :returns: A list of Pydantic term instances (or specs).
+    :rtype: list[BaseModel]|list[dict]
     """
-    result = list()
+    result: list = list()
     with get_universe_session() as session:
-        data_descriptors = _get_all_data_descriptors_in_universe(session)
-        for data_descriptor in data_descriptors:
-            # Term may have some synonyms within the whole universe.
-            terms = _get_all_terms_in_data_descriptor(data_descriptor)
-            result.extend(terms)
+        # One query for all the terms, in the order of the data descriptors.
+        order_by = (col(UTerm.data_descriptor_pk), col(UTerm.pk))
+        # Term may have some synonyms within the whole universe.
+        if raw:
+            # Only the specs column is loaded: no ORM object is built.
+            result.extend(session.exec(select(UTerm.specs).order_by(*order_by)).all())
+        else:
+            statement = select(UTerm).order_by(*order_by)
+            instantiate_terms(session.exec(statement).all(), result, raw)
     return result
 
 
@@ -5,6 +5,15 @@ from esgvoc.apps.drs.models import (DrsType,
                                     DrsPart,
                                     DrsSpecification,
                                     ProjectSpecs)
+from esgvoc.apps.drs.report import (DrsIssueKind,
+                                    DrsIssue,
+                                    DrsValidationReport,
+                                    DrsGenerationReport)
+from esgvoc.apps.drs.validator import DrsValidator
+from esgvoc.apps.drs.generator import DrsGenerator, generate_drs, generate_drs_many
+from esgvoc.apps.drs.scanner import (DrsScanIssueKind, DrsScanIssue, DrsScanSummary, DrsScanner,
+                                     scan_drs_tree)
+from esgvoc.apps.drs.catalog import CatalogFormat, DrsCatalogSummary, DrsCatalogBuilder
                                     
 
 __all__ = ["DrsType",
@@ -13,4 +22,20 @@ __all__ = ["DrsType",
            "DrsCollection",
            "DrsPart",
            "DrsSpecification",
-           "ProjectSpecs"]
\ No newline at end of file
+           "ProjectSpecs",
+           "DrsIssueKind",
+           "DrsIssue",
+           "DrsValidationReport",
+           "DrsGenerationReport",
+           "DrsValidator",
+           "DrsGenerator",
+           "generate_drs",
+           "generate_drs_many",
+           "DrsScanIssueKind",
+           "DrsScanIssue",
+           "DrsScanSummary",
+           "DrsScanner",
+           "scan_drs_tree",
+           "CatalogFormat",
+           "DrsCatalogSummary",
+           "DrsCatalogBuilder"]
\ No newline at end of file
@@ -0,0 +1,112 @@
+'''
+Compiled form of the DRS specifications of a project, shared by the DRS applications.
+'''
+import logging
+from dataclasses import dataclass
+
+import esgvoc.api.projects as projects
+import esgvoc.core.service as service
+from esgvoc.api._cache import DBCache
+from esgvoc.api._utils import get_state_db_version
+from esgvoc.apps.drs.models import DrsCollection, DrsConstant, DrsSpecification, DrsType
+from esgvoc.apps.drs.parser import parse_project_specs
+
+_LOGGER = logging.getLogger("drs")
+
+_EXTENSION_PROPERTY_KEY = 'extension'
+# The tokens of the DRS expressions are highly repetitive: the term ids found for them are
+# memoized, up to this number of tokens.
+_TOKEN_CACHE_MAX_SIZE = 100_000
+# The compiled projects, bound to the version of the project database and keyed by
+# project id and the version of the universe database (the composites may be resolved in it).
+_COMPILED_PROJECT_CACHE = DBCache()
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledPart:
+    collection_id: str|None
+    """None for a constant."""
+    constant: str|None
+    is_required: bool
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledDrsSpecification:
+    drs_type: DrsType
+    separator: str
+    extension: str|None
+    parts: tuple[CompiledPart, ...]
+    is_required: tuple[bool, ...]
+
+
+def compile_drs_specification(drs_spec: DrsSpecification) -> CompiledDrsSpecification:
+    parts = list()
+    for part in drs_spec.parts:
+        match part:
+            case DrsConstant():
+                parts.append(CompiledPart(None, part.value, True))
+            case DrsCollection():
+                parts.append(CompiledPart(part.collection_id, None, part.is_required))
+    extension = None
+    if drs_spec.type == DrsType.filename and drs_spec.properties:
+        extension = drs_spec.properties.get(_EXTENSION_PROPERTY_KEY)
+    return CompiledDrsSpecification(drs_spec.type, drs_spec.separator, extension, tuple(parts),
+                                    tuple(part.is_required for part in parts))
+
+
+class CompiledDrsProject:
+    '''
+    The compiled DRS specifications of a project and the in-memory index of its terms,
+    so as to match the tokens without any database access.
+    '''
+    def __init__(self, project_id: str) -> None:
+        self.project_id = project_id
+        project_specs = parse_project_specs(project_id)
+        self._index = projects._load_project_index(project_id)
+        # The git hashes of the project and universe databases the index is built from.
+        self.db_versions = (service.state_service.projects[project_id].db_version,
+                            service.state_service.universe.db_version)
+        self.specs: dict[DrsType, CompiledDrsSpecification] = dict()
+        # (collection id, token) -> id of the first matching term or None.
+        self._token_cache: dict[tuple[str, str], str|None] = dict()
+        for drs_spec in project_specs.drs_specs:
+            for part in drs_spec.parts:
+                if isinstance(part, DrsCollection) and \
+                   not self._index.has_collection(part.collection_id):
+                    msg = f'Unable to find collection {part.collection_id} of the ' + \
+                          f'{drs_spec.type.value} specification in project {project_id}'
+                    _LOGGER.fatal(msg)
+                    raise RuntimeError(msg)
+            self.specs[drs_spec.type] = compile_drs_specification(drs_spec)
+
+    def get_spec(self, drs_type: DrsType|str) -> CompiledDrsSpecification:
+        try:
+            return self.specs[DrsType(drs_type)]
+        except (KeyError, ValueError) as e:
+            raise ValueError(f'project {self.project_id} has no {drs_type} ' +
+                             'DRS specification') from e
+
+    def find_term_id(self, token: str, collection_id: str) -> str|None:
+        key = (collection_id, token)
+        if key in self._token_cache:
+            return self._token_cache[key]
+        matching_terms = self._index.match_in_collection(token, collection_id)
+        result = matching_terms[0].term_id if matching_terms else None
+        if len(self._token_cache) >= _TOKEN_CACHE_MAX_SIZE:
+            self._token_cache.clear()
+        self._token_cache[key] = result
+        return result
+
+
+def get_compiled_drs_project(project_id: str) -> CompiledDrsProject:
+    '''
+    Returns the compiled DRS specifications of the given project, compiled once per version
+    of the databases.
+    '''
+    db_version = get_state_db_version(service.state_service.projects[project_id])
+    if db_version is None:
+        return CompiledDrsProject(project_id)  # Raises the missing project error.
+    return _COMPILED_PROJECT_CACHE.get(db_version,
+                                       (project_id,
+                                        get_state_db_version(service.state_service.universe)),
+                                       lambda: CompiledDrsProject(project_id))
@@ -0,0 +1,284 @@
+"""
+Catalog of the files of a directory tree laid out by the DRS of a project: one row per valid
+file, one column per collection of the directory and filename specifications.
+
+A small state file records the modification time and the link count of the scanned
+directories. On the next runs, the rows of the unchanged directories are copied from the
+previous catalog instead of scanning and parsing their files again (adding, removing or
+renaming an entry of a directory changes its modification time).
+The catalogs are written in the same depth first order (the sub directories sorted by name),
+so the previous catalog is merged in one pass while the tree is walked: only the rows of one
+directory are held in memory.
+"""
+import csv
+import json
+import os
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any, Iterator
+
+from esgvoc.apps.drs.models import DrsCollection, DrsType
+from esgvoc.apps.drs.parser import parse_project_specs
+from esgvoc.apps.drs.scanner import _DirectoryScanner
+
+PATH_COLUMN = 'path'
+"""The column of the path of the files, relative to the root of the catalog."""
+_STATE_VERSION = 1
+_PARQUET_BATCH_SIZE = 100_000
+
+# Path of a directory relative to the root -> (mtime ns, link count, valid sub directory names,
+# number of files).
+_DirectoryStates = dict[str, tuple[int, int, list[str], int]]
+
+
+class CatalogFormat(str, Enum):
+    csv = "csv"
+    parquet = "parquet"
+
+
+@dataclass(slots=True)
+class DrsCatalogSummary:
+    nb_directories: int = 0
+    nb_reused_directories: int = 0
+    """The unchanged directories, whose rows are copied from the previous catalog."""
+    nb_files: int = 0
+    nb_rows: int = 0
+    nb_invalid_files: int = 0
+    """The files that are not cataloged."""
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow
+        import pyarrow.parquet
+        return pyarrow
+    except ImportError as e:
+        raise ImportError('the parquet format requires pyarrow: ' +
+                          'pip install esgvoc[parquet]') from e
+
+
+def _read_catalog(catalog_path: Path, catalog_format: CatalogFormat) -> Iterator[dict[str, str]]:
+    match catalog_format:
+        case CatalogFormat.csv:
+            with open(catalog_path, newline='') as catalog_file:
+                yield from csv.DictReader(catalog_file)
+        case CatalogFormat.parquet:
+            pyarrow = _import_pyarrow()
+            parquet_file = pyarrow.parquet.ParquetFile(catalog_path)
+            for batch in parquet_file.iter_batches():
+                yield from batch.to_pylist()
+
+
+def _get_directory_order_key(path: str) -> tuple[str, ...]:
+    # The order of the directories in the catalogs: a directory comes before its sub
+    # directories, which come in the order of their names.
+    return tuple(path.split(os.sep)) if path else ()
+
+
+class _PreviousCatalog:
+    '''
+    Reads the rows of the previous catalog directory by directory. The directories must be
+    requested in the order of the catalog: the rows of the directories that are skipped
+    (e.g., scanned again or removed) are discarded.
+    '''
+    def __init__(self, rows: Iterator[dict[str, str]]) -> None:
+        self._rows = rows
+        self._next_row = next(self._rows, None)
+
+    def get_rows(self, path: str) -> list[dict[str, str]]:
+        key = _get_directory_order_key(path)
+        result = list()
+        while self._next_row is not None:
+            row_key = _get_directory_order_key(os.path.dirname(self._next_row[PATH_COLUMN]))
+            if row_key > key:
+                break
+            if row_key == key:
+                result.append(self._next_row)
+            self._next_row = next(self._rows, None)
+        return result
+
+    def close(self) -> None:
+        self._rows.close()  # type: ignore[attr-defined]
+
+
+class _CatalogWriter:
+    def __init__(self, catalog_path: Path, catalog_format: CatalogFormat,
+                 columns: list[str]) -> None:
+        self.columns = columns
+        self.catalog_format = catalog_format
+        match catalog_format:
+            case CatalogFormat.csv:
+                self._file = open(catalog_path, 'w', newline='')
+                self._writer = csv.DictWriter(self._file, columns)
+                self._writer.writeheader()
+            case CatalogFormat.parquet:
+                self._pyarrow = _import_pyarrow()
+                self._schema = self._pyarrow.schema([(column, self._pyarrow.string())
+                                                     for column in columns])
+                self._writer = self._pyarrow.parquet.ParquetWriter(catalog_path, self._schema)
+                self._rows: list[dict[str, str]] = list()
+
+    def write(self, rows: list[dict[str, str]]) -> None:
+        if self.catalog_format == CatalogFormat.csv:
+            self._writer.writerows(rows)
+        else:
+            self._rows.extend(rows)
+            if len(self._rows) >= _PARQUET_BATCH_SIZE:
+                self._flush()
+
+    def _flush(self) -> None:
+        if self._rows:
+            table = self._pyarrow.Table.from_pylist(self._rows, schema=self._schema)
+            self._writer.write_table(table)
+            self._rows = list()
+
+    def close(self) -> None:
+        if self.catalog_format == CatalogFormat.csv:
+            self._file.close()
+        else:
+            self._flush()
+            self._writer.close()
+
+
+class DrsCatalogBuilder:
+    """
+    Builds the catalog of a directory tree laid out by the DRS of a project.
+    The root of the tree is the root of the DRS directories (i.e., the parent directory of
+    the first DRS directory level).
+    """
+    def __init__(self, project_id: str) -> None:
+        self.project_id = project_id
+        self._scanner = _DirectoryScanner(project_id)
+        project_specs = parse_project_specs(project_id)
+        collection_ids: list[str] = list()
+        for drs_type in (DrsType.directory, DrsType.filename):
+            for drs_spec in project_specs.drs_specs:
+                if drs_spec.type == drs_type:
+                    collection_ids.extend(part.collection_id for part in drs_spec.parts
+                                          if isinstance(part, DrsCollection) and
+                                             part.collection_id not in collection_ids)
+        self.columns = [PATH_COLUMN] + collection_ids
+
+    def _load_state(self, root: str, catalog_path: Path, catalog_format: CatalogFormat,
+                    state_path: Path|None) -> tuple[_DirectoryStates, _PreviousCatalog|None]:
+        if state_path is None or not state_path.exists() or not catalog_path.exists():
+            return dict(), None
+        state = json.loads(state_path.read_text())
+        # The state is discarded when the databases have changed: new terms may validate
+        # directories that have been pruned.
+        if state.get('version') != _STATE_VERSION or \
+           state.get('project_id') != self.project_id or \
+           state.get('root') != root or \
+           state.get('columns') != self.columns or \
+           state.get('db_versions') != list(self._scanner.project.db_versions):
+            return dict(), None
+        directories: _DirectoryStates = {path: tuple(directory_state)
+                                         for path, directory_state
+                                         in state['directories'].items()}
+        return directories, _PreviousCatalog(_read_catalog(catalog_path, catalog_format))
+
+    def build(self, root: str|os.PathLike, catalog_path: str|os.PathLike,
+              state_path: str|os.PathLike|None = None,
+              catalog_format: CatalogFormat|str|None = None) -> DrsCatalogSummary:
+        """
+        Builds the catalog of the given tree. The catalog is written in a temporary file
+        that replaces the given catalog file once completed.
+
+        :param root: The root of the DRS directories
+        :type root: str|os.PathLike
+        :param catalog_path: The catalog file
+        :type catalog_path: str|os.PathLike
+        :param state_path: The state file. If it is given and matches the previous catalog, \
+        the unchanged directories are not scanned again.
+        :type state_path: str|os.PathLike|None
+        :param catalog_format: The format of the catalog (default: the suffix of the file)
+        :type catalog_format: CatalogFormat|str|None
+        :returns: The summary of the build.
+        :rtype: DrsCatalogSummary
+        :raises ValueError: If the format is unknown
+        :raises ImportError: If the format is parquet and pyarrow is not installed
+        """
+        root = os.path.abspath(root)
+        catalog_path = Path(catalog_path)
+        state_path = Path(state_path) if state_path is not None else None
+        catalog_format = CatalogFormat(catalog_format or catalog_path.suffix.lstrip('.'))
+        previous_directories, previous_catalog = self._load_state(root, catalog_path,
+                                                                  catalog_format, state_path)
+        summary = DrsCatalogSummary()
+        directories: _DirectoryStates = dict()
+        tmp_catalog_path = catalog_path.with_name(catalog_path.name + '.tmp')
+        writer = _CatalogWriter(tmp_catalog_path, catalog_format, self.columns)
+        try:
+            stack: list[tuple[str, frozenset[int]]] = [('', frozenset([0]))]
+            while stack:
+                path, states = stack.pop()
+                try:
+                    stat = os.stat(os.path.join(root, path))
+                except OSError:
+                    continue
+                summary.nb_directories += 1
+                previous = previous_directories.get(path)
+                if previous is not None and previous[:2] == (stat.st_mtime_ns, stat.st_nlink):
+                    summary.nb_reused_directories += 1
+                    _, _, sub_directory_names, nb_files = previous
+                    rows = previous_catalog.get_rows(path)  # type: ignore[union-attr]
+                else:
+                    sub_directory_names, nb_files, rows = self._scan_directory(root, path,
+                                                                               states)
+                summary.nb_files += nb_files
+                summary.nb_rows += len(rows)
+                summary.nb_invalid_files += nb_files - len(rows)
+                writer.write(rows)
+                directories[path] = (stat.st_mtime_ns, stat.st_nlink, sub_directory_names,
+                                     nb_files)
+                for name in reversed(sub_directory_names):
+                    stack.append((os.path.join(path, name) if path else name,
+                                  self._scanner.advance(states, name)))
+        except BaseException:
+            writer.close()
+            tmp_catalog_path.unlink()
+            raise
+        finally:
+            if previous_catalog is not None:
+                previous_catalog.close()
+        writer.close()
+        os.replace(tmp_catalog_path, catalog_path)
+        if state_path is not None:
+            state = {'version': _STATE_VERSION, 'project_id': self.project_id, 'root': root,
+                     'columns': self.columns,
+                     'db_versions': list(self._scanner.project.db_versions),
+                     'directories': directories}
+            tmp_state_path = state_path.with_name(state_path.name + '.tmp')
+            tmp_state_path.write_text(json.dumps(state))
+            os.replace(tmp_state_path, state_path)
+        return summary
+
+    def _scan_directory(self, root: str, path: str,
+                        states: frozenset[int]) -> tuple[list[str], int, list[dict[str, str]]]:
+        sub_directory_names = list()
+        nb_files = 0
+        rows = list()
+        directory_values: dict[str, str]|None = None
+        is_complete = self._scanner.is_complete(states)
+        with os.scandir(os.path.join(root, path)) as iterator:
+            entries = sorted(iterator, key=lambda entry: entry.name)
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if self._scanner.advance(states, entry.name):
+                    sub_directory_names.append(entry.name)
+                continue
+            nb_files += 1
+            if not is_complete:
+                continue
+            report = self._scanner.validator.validate_file_name(entry.name)
+            if not report.validated:
+                continue
+            if directory_values is None:
+                directory_values = self._scanner.validator.validate_directory(path).values
+            row = dict.fromkeys(self.columns, '')
+            row.update(directory_values)
+            row.update(report.values)
+            row[PATH_COLUMN] = os.path.join(path, entry.name)
+            rows.append(row)
+        return sub_directory_names, nb_files, rows
@@ -0,0 +1,119 @@
+from typing import Iterable, Iterator, Mapping
+
+from esgvoc.apps.drs._compiled import CompiledDrsSpecification, get_compiled_drs_project
+from esgvoc.apps.drs.models import DrsType
+from esgvoc.apps.drs.report import DrsGenerationReport, DrsIssue, DrsIssueKind
+
+
+class DrsGenerator:
+    """
+    Generates DRS expressions (directories, filenames and dataset ids) from facets, following
+    the DRS specifications of a project.
+    The facets are mappings of collection ids to values (e.g., {'institution_id': 'IPSL'}).
+    The values are checked against an in-memory index of the terms of the project: the
+    generation of an expression doesn't query the database.
+    The facets of the collections that are not part of the specification are ignored.
+    """
+    def __init__(self, project_id: str) -> None:
+        self.project_id = project_id
+        self._project = get_compiled_drs_project(project_id)
+
+    def generate(self, facets: Mapping[str, str],
+                 drs_type: DrsType|str) -> DrsGenerationReport:
+        """
+        Generates the expression of the given type from the given facets.
+
+        :param facets: The values of the facets, by collection id
+        :type facets: Mapping[str, str]
+        :param drs_type: The type of the expression
+        :type drs_type: DrsType|str
+        :returns: A report that holds the generated expression (if the facets are valid) \
+        and the errors.
+        :rtype: DrsGenerationReport
+        :raises ValueError: If the project has no DRS specification of the given type
+        """
+        return self._generate(facets, self._project.get_spec(drs_type))
+
+    def generate_many(self, facets: Iterable[Mapping[str, str]],
+                      drs_type: DrsType|str) -> Iterator[DrsGenerationReport]:
+        """
+        Generates the expressions of the given type from the given facets.
+        This function returns an iterator of reports, in the order of the facets.
+
+        :param facets: The facets of the expressions
+        :type facets: Iterable[Mapping[str, str]]
+        :param drs_type: The type of the expressions
+        :type drs_type: DrsType|str
+        :returns: An iterator of reports.
+        :rtype: Iterator[DrsGenerationReport]
+        :raises ValueError: If the project has no DRS specification of the given type
+        """
+        spec = self._project.get_spec(drs_type)
+        for expression_facets in facets:
+            yield self._generate(expression_facets, spec)
+
+    def _generate(self, facets: Mapping[str, str],
+                  spec: CompiledDrsSpecification) -> DrsGenerationReport:
+        report = DrsGenerationReport(dict(facets), spec.drs_type)
+        tokens = list()
+        for part in spec.parts:
+            if part.collection_id is None:
+                tokens.append(part.constant)
+                continue
+            value = facets.get(part.collection_id)
+            if value is None:
+                if part.is_required:
+                    report.errors.append(DrsIssue(DrsIssueKind.missing_facet,
+                                                  collection_id=part.collection_id))
+            elif self._project.find_term_id(value, part.collection_id) is None:
+                report.errors.append(DrsIssue(DrsIssueKind.invalid_facet, value,
+                                              collection_id=part.collection_id))
+            else:
+                tokens.append(value)
+        if not report.errors:
+            expression = spec.separator.join(tokens)
+            if spec.extension:
+                expression += spec.extension
+            report.generated_drs_expression = expression
+        return report
+
+
+def generate_drs(project_id: str, facets: Mapping[str, str],
+                 drs_type: DrsType|str) -> DrsGenerationReport:
+    """
+    Generates the expression of the given type from the given facets, following the DRS
+    specifications of the given project.
+
+    :param project_id: A project id
+    :type project_id: str
+    :param facets: The values of the facets, by collection id
+    :type facets: Mapping[str, str]
+    :param drs_type: The type of the expression
+    :type drs_type: DrsType|str
+    :returns: A report that holds the generated expression (if the facets are valid) \
+    and the errors.
+    :rtype: DrsGenerationReport
+    :raises ValueError: If the project or its DRS specification of the given type is not found
+    """
+    return DrsGenerator(project_id).generate(facets, drs_type)
+
+
+def generate_drs_many(project_id: str, facets: Iterable[Mapping[str, str]],
+                      drs_type: DrsType|str) -> Iterator[DrsGenerationReport]:
+    """
+    Generates the expressions of the given type from the given facets, following the DRS
+    specifications of the given project. The specifications are compiled once and
+    the facets are consumed lazily, so that millions of expressions can be streamed.
+    This function returns an iterator of reports, in the order of the facets.
+
+    :param project_id: A project id
+    :type project_id: str
+    :param facets: The facets of the expressions
+    :type facets: Iterable[Mapping[str, str]]
+    :param drs_type: The type of the expressions
+    :type drs_type: DrsType|str
+    :returns: An iterator of reports.
+    :rtype: Iterator[DrsGenerationReport]
+    :raises ValueError: If the project or its DRS specification of the given type is not found
+    """
+    return DrsGenerator(project_id).generate_many(facets, drs_type)
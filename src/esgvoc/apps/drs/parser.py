@@ -2,11 +2,17 @@ import logging
 
 from esgvoc.apps.drs.models import ProjectSpecs
 import esgvoc.api.projects as projects
+import esgvoc.core.service as service
+from esgvoc.api._cache import DBCache
+from esgvoc.api._utils import get_state_db_version
 
 _LOGGER = logging.getLogger("drs")
 
+# The parsed specs of the projects, bound to the version of their database.
+_PROJECT_SPECS_CACHE = DBCache()
 
-def parse_project_specs(project_id: str) -> ProjectSpecs:
+
+def _parse_project_specs(project_id: str) -> ProjectSpecs:
     project_specs = projects.find_project(project_id)
     if not project_specs:
         msg = f'Unable to find project {project_id}'
@@ -21,7 +27,18 @@ def parse_project_specs(project_id: str) -> ProjectSpecs:
     return result
 
 
+def parse_project_specs(project_id: str) -> ProjectSpecs:
+    """
+    Parses the specs of the given project. The result is cached until the database of
+    the project is rebuilt: it is shared and must not be modified.
+    """
+    db_version = get_state_db_version(service.state_service.projects[project_id])
+    if db_version is None:
+        return _parse_project_specs(project_id)  # Raises the missing project error.
+    return _PROJECT_SPECS_CACHE.get(db_version, project_id,
+                                    lambda: _parse_project_specs(project_id))
+
+
 if __name__ == "__main__":
     drs_specs = parse_project_specs('cmip6plus').drs_specs
     print(drs_specs[1])
-    
\ No newline at end of file
@@ -0,0 +1,112 @@
+from dataclasses import dataclass, field
+from enum import Enum
+
+from esgvoc.apps.drs.models import DrsType
+
+
+class DrsIssueKind(str, Enum):
+    missing_extension = "missing_extension"
+    """The filename doesn't end with the extension of the specification."""
+    invalid_constant = "invalid_constant"
+    """The token doesn't equal the constant of the specification."""
+    invalid_token = "invalid_token"
+    """The token doesn't match any term of the collection."""
+    missing_token = "missing_token"
+    """The expression has no token left for a required part."""
+    extra_token = "extra_token"
+    """The token is not matched by any part of the specification."""
+    missing_facet = "missing_facet"
+    """No value is given for a required collection (generation)."""
+    invalid_facet = "invalid_facet"
+    """The value given for the collection doesn't match any of its terms (generation)."""
+
+
+@dataclass(slots=True)
+class DrsIssue:
+    kind: DrsIssueKind
+    token: str|None = None
+    position: int|None = None
+    """The position of the token in the expression (from 0)."""
+    collection_id: str|None = None
+
+    def __str__(self) -> str:
+        match self.kind:
+            case DrsIssueKind.missing_extension:
+                return "the extension is missing"
+            case DrsIssueKind.invalid_constant:
+                return f"token '{self.token}' at position {self.position} " + \
+                       "doesn't match the expected constant"
+            case DrsIssueKind.invalid_token:
+                return f"token '{self.token}' at position {self.position} " + \
+                       f"doesn't match any term of collection {self.collection_id}"
+            case DrsIssueKind.missing_token:
+                return f"token of collection {self.collection_id} is missing"
+            case DrsIssueKind.extra_token:
+                return f"token '{self.token}' at position {self.position} is unexpected"
+            case DrsIssueKind.missing_facet:
+                return f"facet of collection {self.collection_id} is missing"
+            case DrsIssueKind.invalid_facet:
+                return f"facet '{self.token}' doesn't match any term of " + \
+                       f"collection {self.collection_id}"
+
+
+@dataclass(slots=True)
+class DrsValidationReport:
+    expression: str
+    drs_type: DrsType
+    facets: dict[str, str] = field(default_factory=dict)
+    """The id of the term matched by the token of each collection, by collection id."""
+    values: dict[str, str] = field(default_factory=dict)
+    """The token of each collection, by collection id."""
+    errors: list[DrsIssue] = field(default_factory=list)
+
+    @property
+    def nb_errors(self) -> int:
+        return len(self.errors)
+
+    @property
+    def validated(self) -> bool:
+        return not self.errors
+
+    @property
+    def message(self) -> str:
+        return f"'{self.expression}' has {self.nb_errors} error(s)"
+
+    def __len__(self) -> int:
+        return self.nb_errors
+
+    def __bool__(self) -> bool:
+        return self.validated
+
+    def __repr__(self) -> str:
+        return self.message
+
+
+@dataclass(slots=True)
+class DrsGenerationReport:
+    facets: dict[str, str]
+    drs_type: DrsType
+    generated_drs_expression: str|None = None
+    """None if the facets have errors."""
+    errors: list[DrsIssue] = field(default_factory=list)
+
+    @property
+    def nb_errors(self) -> int:
+        return len(self.errors)
+
+    @property
+    def validated(self) -> bool:
+        return not self.errors
+
+    @property
+    def message(self) -> str:
+        return f"'{self.facets}' has {self.nb_errors} error(s)"
+
+    def __len__(self) -> int:
+        return self.nb_errors
+
+    def __bool__(self) -> bool:
+        return self.validated
+
+    def __repr__(self) -> str:
+        return self.message
@@ -0,0 +1,261 @@
+"""
+Audit of directory trees laid out by the DRS of a project.
+
+The directory levels are matched one at a time against the directory specification, so that
+the subtrees whose directory prefix is already invalid are pruned. The files of the complete
+DRS directories are validated against the filename specification.
+The directories are scanned by batches, by a pool of processes. A batch hands the directories
+it has not scanned back after a bounded number of entries (the budget), so that its memory
+doesn't grow with the size of the tree. A directory is listed once, into a sorted snapshot of its
+entries: if it exceeds the budget, the rest of its snapshot is handed back by chunks of the
+budget, which are scanned by any worker. The entries created after the listing of their
+directory are not scanned.
+The symbolic links are not followed: a link to a directory is validated as a directory, but
+its subtree is not scanned.
+"""
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Iterator
+
+import esgvoc.core.service as service
+from esgvoc.api._alignment import advance, skip_optional_parts
+from esgvoc.apps.drs.models import DrsType
+from esgvoc.apps.drs.validator import DrsValidator
+
+DEFAULT_BUDGET = 10_000
+"""The number of entries scanned by a batch before it hands its remaining directories back."""
+_BATCH_SIZE = 16
+
+# An entry of a directory: (name, is a directory, is a symbolic link).
+_Entry = tuple[str, bool, bool]
+# A directory to scan: (path relative to the root, states of the directory specification,
+# entries left to scan, None until the directory is listed).
+_Directory = tuple[str, frozenset[int], tuple[_Entry, ...]|None]
+
+
+class DrsScanIssueKind(str, Enum):
+    directory = "directory"
+    """The directory doesn't match the directory specification (or can't be read)."""
+    file = "file"
+    """The file doesn't match the filename specification or is misplaced."""
+
+
+@dataclass(slots=True)
+class DrsScanIssue:
+    path: str
+    """The path relative to the root of the scan."""
+    kind: DrsScanIssueKind
+    errors: list[str]
+
+
+@dataclass(slots=True)
+class DrsScanSummary:
+    nb_directories: int = 0
+    nb_files: int = 0
+    nb_invalid_directories: int = 0
+    """The invalid directories are not scanned."""
+    nb_invalid_files: int = 0
+
+    def add(self, other: "DrsScanSummary") -> None:
+        self.nb_directories += other.nb_directories
+        self.nb_files += other.nb_files
+        self.nb_invalid_directories += other.nb_invalid_directories
+        self.nb_invalid_files += other.nb_invalid_files
+
+
+@dataclass(slots=True)
+class _BatchResult:
+    issues: list[DrsScanIssue] = field(default_factory=list)
+    summary: DrsScanSummary = field(default_factory=DrsScanSummary)
+    pending: list[_Directory] = field(default_factory=list)
+
+
+class _DirectoryScanner:
+    def __init__(self, project_id: str) -> None:
+        self.validator = DrsValidator(project_id)
+        self.project = self.validator.project
+        self.spec = self.project.get_spec(DrsType.directory)
+        # Fails early if the project has no filename specification.
+        self.project.get_spec(DrsType.filename)
+
+    def _matches(self, part_index: int, token: str) -> bool:
+        part = self.spec.parts[part_index]
+        if part.collection_id is None:
+            return token == part.constant
+        return self.project.find_term_id(token, part.collection_id) is not None
+
+    def advance(self, states: frozenset[int], name: str) -> frozenset[int]:
+        return advance(self.spec.is_required, states, name, self._matches)
+
+    def is_complete(self, states: frozenset[int]) -> bool:
+        return len(self.spec.parts) in skip_optional_parts(self.spec.is_required, states)
+
+    def _get_directory_errors(self, name: str, states: frozenset[int]) -> list[str]:
+        expected = list()
+        for state in sorted(skip_optional_parts(self.spec.is_required, states)):
+            if state < len(self.spec.parts):
+                part = self.spec.parts[state]
+                expected.append(part.collection_id if part.collection_id is not None
+                                                   else f"'{part.constant}'")
+        if expected:
+            return [f"directory '{name}' doesn't match any of: {', '.join(expected)}"]
+        return [f"directory '{name}' is unexpected: the parent directory is a complete " +
+                "DRS directory"]
+
+    def _get_file_errors(self, name: str, is_complete: bool) -> list[str]:
+        if not is_complete:
+            return [f"file '{name}' is unexpected: the directory is not a complete " +
+                    "DRS directory"]
+        return [str(error) for error in self.validator.validate_file_name(name).errors]
+
+    def scan(self, root: str, directories: list[_Directory], budget: int) -> _BatchResult:
+        result = _BatchResult()
+        stack = list(reversed(directories))
+        nb_entries = 0
+        while stack and nb_entries < budget:
+            path, states, entries = stack.pop()
+            if entries is None:
+                try:
+                    entries = _list_directory(os.path.join(root, path))
+                except OSError as e:
+                    result.issues.append(DrsScanIssue(path, DrsScanIssueKind.directory,
+                                                      [str(e)]))
+                    result.summary.nb_invalid_directories += 1
+                    continue
+            is_complete = self.is_complete(states)
+            nb_scanned = min(len(entries), budget - nb_entries)
+            sub_directories: list[_Directory] = list()
+            for entry in entries[:nb_scanned]:
+                self._scan_entry(path, entry, states, is_complete, result, sub_directories)
+            nb_entries += nb_scanned
+            stack.extend(reversed(sub_directories))
+            # The rest of the snapshot is handed back by chunks, so that it is sent once to
+            # the workers and shared between them.
+            chunks = [entries[index:index + budget]
+                      for index in range(nb_scanned, len(entries), budget)]
+            stack.extend((path, states, chunk) for chunk in reversed(chunks))
+        result.pending = list(reversed(stack))
+        return result
+
+    def _scan_entry(self, path: str, entry: _Entry, states: frozenset[int],
+                    is_complete: bool, result: _BatchResult,
+                    sub_directories: list[_Directory]) -> None:
+        name, is_directory, is_link = entry
+        entry_path = os.path.join(path, name) if path else name
+        if is_directory:
+            result.summary.nb_directories += 1
+            next_states = self.advance(states, name)
+            if not next_states:
+                result.summary.nb_invalid_directories += 1
+                result.issues.append(DrsScanIssue(entry_path, DrsScanIssueKind.directory,
+                                                  self._get_directory_errors(name, states)))
+            elif not is_link:
+                sub_directories.append((entry_path, next_states, None))
+        else:
+            result.summary.nb_files += 1
+            errors = self._get_file_errors(name, is_complete)
+            if errors:
+                result.summary.nb_invalid_files += 1
+                result.issues.append(DrsScanIssue(entry_path, DrsScanIssueKind.file, errors))
+
+
+def _list_directory(directory_path: str) -> tuple[_Entry, ...]:
+    with os.scandir(directory_path) as iterator:
+        # is_dir follows the symbolic links (broken links are files).
+        return tuple(sorted((entry.name, entry.is_dir(), entry.is_symlink())
+                            for entry in iterator))
+
+
+_WORKER_SCANNER: _DirectoryScanner|None = None
+
+
+def _init_scan_worker(project_id: str) -> None:
+    global _WORKER_SCANNER
+    service.discard_db_connections()
+    _WORKER_SCANNER = _DirectoryScanner(project_id)
+
+
+def _scan_in_worker(root: str, directories: list[_Directory], budget: int) -> _BatchResult:
+    assert _WORKER_SCANNER is not None
+    return _WORKER_SCANNER.scan(root, directories, budget)
+
+
+class DrsScanner:
+    """
+    Scans directory trees laid out by the DRS of a project.
+    The root of the scan is the root of the DRS directories (i.e., the parent directory of
+    the first DRS directory level).
+    """
+    def __init__(self, project_id: str, max_workers: int|None = None,
+                 budget: int = DEFAULT_BUDGET) -> None:
+        self.project_id = project_id
+        self.max_workers = max_workers if max_workers is not None else os.cpu_count() or 1
+        self.budget = budget
+        self.summary = DrsScanSummary()
+        """The summary of the last scan, updated as the issues are yielded."""
+
+    def scan(self, root: str|os.PathLike) -> Iterator[DrsScanIssue]:
+        """
+        Scans the given tree and yields the issues of its invalid directories and files.
+        With more than one worker, the order of the issues is not deterministic.
+
+        :param root: The root of the DRS directories
+        :type root: str|os.PathLike
+        :returns: An iterator of issues.
+        :rtype: Iterator[DrsScanIssue]
+        :raises ValueError: If the project or its directory and filename specifications \
+        are not found
+        """
+        root = os.fspath(root)
+        self.summary = DrsScanSummary()
+        pending: list[_Directory] = [('', frozenset([0]), None)]
+        if self.max_workers == 1:
+            scanner = _DirectoryScanner(self.project_id)
+            while pending:
+                result = scanner.scan(root, pending, self.budget)
+                pending = result.pending
+                self.summary.add(result.summary)
+                yield from result.issues
+            return
+        # Fails early in the current process (e.g., unknown project).
+        _DirectoryScanner(self.project_id)
+        with ProcessPoolExecutor(max_workers=self.max_workers,
+                                 initializer=_init_scan_worker,
+                                 initargs=(self.project_id,)) as executor:
+            running: set[Future[_BatchResult]] = set()
+            while pending or running:
+                # The last directories are scanned first (depth first): pending stays small.
+                while pending and len(running) < 2 * self.max_workers:
+                    batch = pending[-_BATCH_SIZE:]
+                    del pending[-_BATCH_SIZE:]
+                    running.add(executor.submit(_scan_in_worker, root, batch, self.budget))
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    pending.extend(result.pending)
+                    self.summary.add(result.summary)
+                    yield from result.issues
+
+
+def scan_drs_tree(root: str|os.PathLike, project_id: str,
+                  max_workers: int|None = None) -> tuple[list[DrsScanIssue], DrsScanSummary]:
+    """
+    Scans the given tree laid out by the DRS of the given project.
+    For large trees, iterate over `DrsScanner.scan` instead, so as to stream the issues.
+
+    :param root: The root of the DRS directories
+    :type root: str|os.PathLike
+    :param project_id: A project id
+    :type project_id: str
+    :param max_workers: The number of processes (default: the number of CPUs)
+    :type max_workers: int|None
+    :returns: The issues of the invalid directories and files and the summary of the scan.
+    :rtype: tuple[list[DrsScanIssue], DrsScanSummary]
+    :raises ValueError: If the project or its directory and filename specifications \
+    are not found
+    """
+    scanner = DrsScanner(project_id, max_workers)
+    issues = list(scanner.scan(root))
+    return issues, scanner.summary
@@ -0,0 +1,126 @@
+from typing import Iterable, Iterator
+
+from esgvoc.api._alignment import Step, align
+from esgvoc.apps.drs._compiled import (CompiledDrsProject, CompiledDrsSpecification,
+                                      CompiledPart, get_compiled_drs_project)
+from esgvoc.apps.drs.models import DrsType
+from esgvoc.apps.drs.report import DrsIssue, DrsIssueKind, DrsValidationReport
+
+
+class DrsValidator:
+    """
+    Validates DRS expressions (directories, filenames and dataset ids) against the DRS
+    specifications of a project.
+    The specifications are compiled once and the tokens are matched against an in-memory index
+    of the terms of the project: the validation of an expression doesn't query the database.
+    """
+    def __init__(self, project_id: str) -> None:
+        self.project_id = project_id
+        self._project = get_compiled_drs_project(project_id)
+
+    @property
+    def project(self) -> CompiledDrsProject:
+        """The compiled DRS specifications of the project, shared by the DRS applications."""
+        return self._project
+
+    def validate(self, expression: str, drs_type: DrsType|str) -> DrsValidationReport:
+        """
+        Validates the given expression against the DRS specification of the given type.
+
+        :param expression: A directory, a filename or a dataset id
+        :type expression: str
+        :param drs_type: The type of the expression
+        :type drs_type: DrsType|str
+        :returns: A report that holds the term ids of the facets and the errors.
+        :rtype: DrsValidationReport
+        :raises ValueError: If the project has no DRS specification of the given type
+        """
+        return self._validate(expression, self._project.get_spec(drs_type))
+
+    def validate_many(self, expressions: Iterable[str],
+                      drs_type: DrsType|str) -> Iterator[DrsValidationReport]:
+        """
+        Validates the given expressions against the DRS specification of the given type.
+        This function returns an iterator of reports, in the order of the expressions.
+
+        :param expressions: Directories, filenames or dataset ids
+        :type expressions: Iterable[str]
+        :param drs_type: The type of the expressions
+        :type drs_type: DrsType|str
+        :returns: An iterator of reports.
+        :rtype: Iterator[DrsValidationReport]
+        :raises ValueError: If the project has no DRS specification of the given type
+        """
+        spec = self._project.get_spec(drs_type)
+        for expression in expressions:
+            yield self._validate(expression, spec)
+
+    def validate_directory(self, expression: str) -> DrsValidationReport:
+        return self.validate(expression, DrsType.directory)
+
+    def validate_file_name(self, expression: str) -> DrsValidationReport:
+        return self.validate(expression, DrsType.filename)
+
+    def validate_dataset_id(self, expression: str) -> DrsValidationReport:
+        return self.validate(expression, DrsType.dataset_id)
+
+    def _validate(self, expression: str,
+                  spec: CompiledDrsSpecification) -> DrsValidationReport:
+        report = DrsValidationReport(expression, spec.drs_type)
+        body = expression
+        if spec.extension:
+            if body.endswith(spec.extension):
+                body = body[:-len(spec.extension)]
+            else:
+                report.errors.append(DrsIssue(DrsIssueKind.missing_extension))
+        if spec.drs_type == DrsType.directory:
+            body = body.strip(spec.separator)
+        tokens = body.split(spec.separator)
+        self._match_tokens(tokens, spec, report)
+        return report
+
+    def _match_tokens(self, tokens: list[str], spec: CompiledDrsSpecification,
+                      report: DrsValidationReport) -> None:
+        parts = spec.parts
+        # Fast path: one token per part, all of them matching.
+        if len(tokens) == len(parts):
+            facets = report.facets
+            values = report.values
+            for part, token in zip(parts, tokens):
+                if part.collection_id is None:
+                    if token != part.constant:
+                        break
+                elif (term_id := self._project.find_term_id(token, part.collection_id)) is not None:
+                    facets[part.collection_id] = term_id
+                    values[part.collection_id] = token
+                else:
+                    break
+            else:
+                return
+            facets.clear()
+            values.clear()
+        # Otherwise, the tokens are aligned on the parts (the optional ones included) with
+        # the fewest errors, by dynamic programming.
+        def matches(part_index: int, token: str) -> bool:
+            part = parts[part_index]
+            if part.collection_id is None:
+                return token == part.constant
+            return self._project.find_term_id(token, part.collection_id) is not None
+        _, steps = align(spec.is_required, tokens, matches)
+        for step, part_index, position in steps:
+            part = parts[part_index] if part_index is not None else None
+            token = tokens[position] if position is not None else None
+            match step, part, token:
+                case Step.MATCH, CompiledPart(collection_id=str(collection_id)), str(token):
+                    report.facets[collection_id] = self._project.find_term_id(token, collection_id)
+                    report.values[collection_id] = token
+                case Step.MISMATCH, CompiledPart(collection_id=None), _:
+                    report.errors.append(DrsIssue(DrsIssueKind.invalid_constant, token, position))
+                case Step.MISMATCH, CompiledPart(collection_id=collection_id), _:
+                    report.errors.append(DrsIssue(DrsIssueKind.invalid_token, token, position,
+                                                  collection_id))
+                case Step.MISSING, CompiledPart(collection_id=collection_id), _:
+                    report.errors.append(DrsIssue(DrsIssueKind.missing_token,
+                                                  collection_id=collection_id))
+                case Step.EXTRA, _, _:
+                    report.errors.append(DrsIssue(DrsIssueKind.extra_token, token, position))
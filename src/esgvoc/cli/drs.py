@@ -0,0 +1,95 @@
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from esgvoc.apps.drs.catalog import DrsCatalogBuilder
+from esgvoc.apps.drs.scanner import DrsScanner
+
+app = typer.Typer()
+console = Console(stderr=True)
+
+
+@app.command()
+def scan(
+    root: Path = typer.Argument(..., exists=True, file_okay=False, dir_okay=True,
+                                help="Root of the DRS directories."),
+    project: str = typer.Option(..., "--project", "-p", help="Project id (e.g. cmip6plus)."),
+    output: str = typer.Option("-", "--output", "-o",
+                               help="NDJSON file of the issues and the summary ('-' for stdout)."),
+    workers: int|None = typer.Option(None, "--workers", "-w",
+                                     help="Number of processes (default: number of CPUs)."),
+):
+    """
+    Audits a directory tree laid out by the DRS of a project.
+
+    The directories are validated level by level against the directory specification of the
+    project: the subtrees of the invalid directories are not scanned. The files of the
+    complete DRS directories are validated against the filename specification.
+    One JSON object is written per invalid path, followed by a summary object.
+
+    Example:
+
+    esgvoc drs scan /data/CMIP6Plus --project cmip6plus --output issues.ndjson
+    """
+    scanner = DrsScanner(project, workers)
+    output_stream = sys.stdout if output == "-" else open(output, "w")
+    try:
+        for issue in scanner.scan(root):
+            output_stream.write(json.dumps(asdict(issue)) + "\n")
+        output_stream.write(json.dumps({"summary": asdict(scanner.summary)}) + "\n")
+    finally:
+        if output_stream is not sys.stdout:
+            output_stream.close()
+    table = Table(title=f"DRS scan of {root}")
+    table.add_column("Kind")
+    table.add_column("Scanned", justify="right")
+    table.add_column("Invalid", justify="right")
+    table.add_row("directories", str(scanner.summary.nb_directories),
+                  str(scanner.summary.nb_invalid_directories))
+    table.add_row("files", str(scanner.summary.nb_files), str(scanner.summary.nb_invalid_files))
+    console.print(table)
+    if scanner.summary.nb_invalid_directories or scanner.summary.nb_invalid_files:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def catalog(
+    root: Path = typer.Argument(..., exists=True, file_okay=False, dir_okay=True,
+                                help="Root of the DRS directories."),
+    project: str = typer.Option(..., "--project", "-p", help="Project id (e.g. cmip6plus)."),
+    out: Path = typer.Option(..., "--out", "-o",
+                             help="Catalog file: .csv or .parquet (requires pyarrow)."),
+    state: Path|None = typer.Option(None, "--state", "-s",
+                                    help="State file of the incremental builds " +
+                                         "(default: the catalog file suffixed by .state.json)."),
+    full: bool = typer.Option(False, "--full", help="Ignore the state file and rescan the tree."),
+):
+    """
+    Builds a catalog of the files of a directory tree laid out by the DRS of a project:
+    one row per valid file, one column per collection.
+
+    A state file records the modification time of the directories: the next builds only
+    rescan the changed directories and copy the other rows from the previous catalog.
+
+    Example:
+
+    esgvoc drs catalog /data/CMIP6Plus --project cmip6plus --out catalog.parquet
+    """
+    state_path = state if state is not None else out.with_name(out.name + ".state.json")
+    if full and state_path.exists():
+        state_path.unlink()
+    summary = DrsCatalogBuilder(project).build(root, out, state_path)
+    table = Table(title=f"DRS catalog of {root}")
+    table.add_column("Directories", justify="right")
+    table.add_column("Unchanged", justify="right")
+    table.add_column("Files", justify="right")
+    table.add_column("Cataloged", justify="right")
+    table.add_column("Invalid", justify="right")
+    table.add_row(str(summary.nb_directories), str(summary.nb_reused_directories),
+                  str(summary.nb_files), str(summary.nb_rows), str(summary.nb_invalid_files))
+    console.print(table)
@@ -1,15 +1,23 @@
 
-from typing import List
+import itertools
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from typing import Iterable, Iterator, List, TextIO
 from esgvoc.api.projects import (
     valid_term, 
     valid_term_in_collection, 
     valid_term_in_project, 
-    valid_term_in_all_projects
+    valid_term_in_all_projects,
+    valid_terms,
+    valid_terms_in_collection,
+    valid_terms_in_project,
+    valid_terms_in_all_projects
 )
 from esgvoc.api import BasicValidationErrorVisitor
 from requests import logging
 from rich.table import Table
-from sqlmodel import except_
 import typer
 import re
 from rich.console import Console
@@ -19,10 +27,96 @@ console = Console()
 
 _LOGGER = logging.getLogger(__name__)
 
+_KEY_REGEX = re.compile(r"^([^:]*):([^:]*):([^:]*)$")
+_DEFAULT_CHUNK_SIZE = 10_000
+
+
+def _read_validation_lines(stream: TextIO) -> Iterator[tuple[int, str, str]]:
+    for line_number, line in enumerate(stream, start=1):
+        line = line.rstrip("\n\r")
+        if line:
+            value, _, key = line.partition("\t")
+            yield line_number, value, key
+
+
+def _valid_group(values: list[str], project: str, collection: str, term: str) -> list[dict]:
+    """Validates values that share the same key, with the batch functions."""
+    if project and collection and term:
+        visitor = BasicValidationErrorVisitor()
+        reports = valid_terms(values, project, collection, term)
+        return [{"valid": bool(report), "errors": [error.accept(visitor) for error in report.errors]}
+                for report in reports]
+    if project and collection:
+        results = valid_terms_in_collection(values, project, collection)
+    elif project:
+        results = valid_terms_in_project(values, project)
+    else:
+        results = valid_terms_in_all_projects(values)
+    return [{"valid": bool(matching_terms),
+             "matching_terms": [asdict(matching_term) for matching_term in matching_terms]}
+            for matching_terms in results]
+
+
+def _valid_chunk(chunk: list[tuple[int, str, str]]) -> Iterator[dict]:
+    results: dict[int, dict] = dict()
+    groups: dict[tuple[str, str, str], list[tuple[int, str]]] = dict()
+    for line_number, value, key in chunk:
+        match = _KEY_REGEX.match(key)
+        if match:
+            groups.setdefault(match.groups(), list()).append((line_number, value))
+        else:
+            results[line_number] = {"valid": False, "errors": ["Invalid input format"]}
+    for (project, collection, term), lines in groups.items():
+        values = [value for _, value in lines]
+        try:
+            group_results = _valid_group(values, project, collection, term)
+        except Exception:
+            try:
+                # Checks the key without any value (e.g., unknown project).
+                _valid_group([], project, collection, term)
+            except Exception as e:
+                group_results = [{"valid": False, "errors": [repr(e)]} for _ in values]
+            else:
+                # The key is valid: isolate the faulty values.
+                group_results = list()
+                for value in values:
+                    try:
+                        group_results.extend(_valid_group([value], project, collection, term))
+                    except Exception as e:
+                        group_results.append({"valid": False, "errors": [repr(e)]})
+        for (line_number, _), result in zip(lines, group_results):
+            results[line_number] = result
+    for line_number, value, key in chunk:
+        yield {"line": line_number, "value": value, "key": key, **results[line_number]}
+
+
+def valid_stream(input_stream: TextIO,
+                 output_stream: TextIO,
+                 chunk_size: int = _DEFAULT_CHUNK_SIZE) -> tuple[int, int]:
+    """
+    Validates the lines `<StringToValidate><TAB><Project:Collection:Term>` of the input stream
+    and writes one JSON result per line to the output stream (NDJSON), in the order of the input.
+    Lines are processed by chunks so that memory stays bounded.
+    Returns the number of validated lines and the number of invalid ones.
+    Raises ValueError if the chunk size is not positive.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"the chunk size must be positive, got {chunk_size}")
+    nb_lines = 0
+    nb_invalid_lines = 0
+    lines: Iterable = _read_validation_lines(input_stream)
+    while chunk:=list(itertools.islice(lines, chunk_size)):
+        for result in _valid_chunk(chunk):
+            nb_lines += 1
+            nb_invalid_lines += 0 if result["valid"] else 1
+            output_stream.write(json.dumps(result) + "\n")
+        output_stream.flush()
+    return nb_lines, nb_invalid_lines
+
 @app.command()
 def valid(
-    strings_targets: List[str] = typer.Argument(
-        ..., 
+    strings_targets: List[str]|None = typer.Argument(
+        None, 
         help=(
             "Pairs of strings to validate against a key in the form '<StringToValidate> <Project:Collection:Term>'.\n"
             "Multiple pairs can be provided. The key '<Project:Collection:Term>' consists of three parts:\n"
@@ -37,7 +131,12 @@ def valid(
             "The function validates based on the provided parts."
         )
     ),
-    verbose: bool = typer.Option(False, "-v", "--verbose", help="Provide detailed validation results")
+    verbose: bool = typer.Option(False, "-v", "--verbose", help="Provide detailed validation results"),
+    input_file: str|None = typer.Option(None, "-i", "--input",
+                                   help=("File of lines '<StringToValidate><TAB><Project:Collection:Term>' "
+                                         "to validate ('-' for stdin). Results are streamed as NDJSON.")),
+    chunk_size: int = typer.Option(_DEFAULT_CHUNK_SIZE, "--chunk-size", min=1,
+                                   help="Number of lines validated at once in --input mode")
 ):
     """
     Validates one or more strings against specified Project:Collection:Term configurations.
@@ -77,9 +176,26 @@ def valid(
             │ IPS    │ ::  │ ❌ Invalid │ did not found matching term │
             │ IPSL   │ ::  │ ✅ Valid   │ None                        │
             └────────┴─────┴────────────┴─────────────────────────────┘
+
+        Streaming validation of a file (or stdin with '-'), one JSON result per line:
+        esgvocab valid --input values.tsv > results.ndjson
+        cut -f 1,2 listing.tsv | esgvocab valid --input - | grep '"valid": false'
+        The exit code is 1 if any line is invalid.
     Returns:
         List[bool]: Validation results for each pair in the input.
     """
+    if input_file is not None:
+        if input_file == "-":
+            _, nb_invalid_lines = valid_stream(sys.stdin, sys.stdout, chunk_size)
+        else:
+            with Path(input_file).open() as input_stream:
+                _, nb_invalid_lines = valid_stream(input_stream, sys.stdout, chunk_size)
+        if nb_invalid_lines:
+            raise typer.Exit(code=1)
+        return None
+    if not strings_targets:
+        raise typer.BadParameter("Provide pairs of strings to validate or an input file.")
+
     results = []
     detailed_results = []
 
@@ -145,7 +261,6 @@ def valid(
             string = validation_parts[0]
             key = validation_parts[1] if len(validation_parts) > 1 else "::"
             result = "✅ Valid" if detail["errors"] == [] else "❌ Invalid"
-            print(detail)
             errors = "\n".join(detail["errors"]) if detail["errors"] else "None"
             table.add_row(string, key, result, errors)
 
@@ -6,8 +6,12 @@ CONTEXT_JSON_KEY = "@context"
 TERM_ID_JSON_KEY = 'id'
 COMPOSITE_PARTS_JSON_KEY = 'parts'
 COMPOSITE_SEPARATOR_JSON_KEY = 'separator'
+COMPOSITE_REQUIRED_PART_JSON_KEY = 'is_required'
 PATTERN_JSON_KEY = 'regex'
 TERM_TYPE_JSON_KEY = 'type'
 DRS_SPECS_JSON_KEY = 'drs_name'
 SQLITE_FIRST_PK = 1
+# Version of the schema of the databases, stored in their universe or project row. Increment it
+# when the schema changes: the databases of another version are rebuilt by the synchronization.
+DB_SCHEMA_VERSION = 2
 DATA_DESCRIPTOR_JSON_KEY = "@base"
\ No newline at end of file
@@ -1,15 +1,71 @@
 from pathlib import Path
 import json
-from sqlalchemy import Engine
+from urllib.parse import quote
+
+from sqlalchemy import Engine, event, text
 from sqlmodel import Session, create_engine
 
+# The pragmas that the connections may set, with their allowed values (None: any integer).
+_PRAGMAS: dict[str, frozenset[str]|None] = {
+    'mmap_size': None,
+    'cache_size': None,
+    'temp_store': frozenset(('DEFAULT', 'FILE', 'MEMORY')),
+    'query_only': frozenset(('ON', 'OFF')),
+}
+
+
+def _check_pragma(name: str, value: int|str) -> None:
+    if name not in _PRAGMAS:
+        raise ValueError(f'unsupported pragma {name}')
+    allowed_values = _PRAGMAS[name]
+    if allowed_values is None:
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise ValueError(f'the value of the pragma {name} must be an integer, not {value!r}')
+    elif value not in allowed_values:
+        raise ValueError(f'the value of the pragma {name} must be one of ' +
+                         f'{", ".join(sorted(allowed_values))}, not {value!r}')
+
 
 class DBConnection:
     SQLITE_URL_PREFIX = 'sqlite://'
-    def __init__(self, db_file_path: Path, echo: bool = False) -> None:
-        self.engine = create_engine(f'{DBConnection.SQLITE_URL_PREFIX}/{db_file_path}', echo=echo)
+    def __init__(self,
+                 db_file_path: Path,
+                 echo: bool = False,
+                 read_only: bool = False,
+                 immutable: bool = False,
+                 pragmas: dict[str, int|str]|None = None,
+                 pool_size: int|None = None) -> None:
+        '''
+        Connects to a SQLite database. By default, the database is opened in read-write mode
+        with the SQLite and SQLAlchemy defaults (e.g., ingestion).
+        A read only connection opens the file with a `mode=ro` URI, and `immutable=1` if
+        the file is never modified while the connection is opened: SQLite doesn't lock it then.
+        The pragmas are set on every new SQLite connection of the pool. Only the pragmas of
+        the connection profiles are supported (see DBSettings), any other raises a ValueError.
+        '''
+        if read_only:
+            url = f'{DBConnection.SQLITE_URL_PREFIX}/file:{quote(str(db_file_path.absolute()))}' + \
+                  f'?mode=ro{"&immutable=1" if immutable else ""}&uri=true'
+        else:
+            url = f'{DBConnection.SQLITE_URL_PREFIX}/{db_file_path}'
+        # The default pool (QueuePool) holds one SQLite connection per concurrent session.
+        engine_args = dict() if pool_size is None else {'pool_size': pool_size,
+                                                        'max_overflow': pool_size}
+        self.engine = create_engine(url, echo=echo, **engine_args)
+        if pragmas:
+            for name, value in pragmas.items():
+                _check_pragma(name, value)
+            statements = [f'PRAGMA {name} = {value}' for name, value in pragmas.items()]
+
+            def set_pragmas(dbapi_connection, _) -> None:
+                cursor = dbapi_connection.cursor()
+                for statement in statements:
+                    cursor.execute(statement)
+                cursor.close()
+            event.listen(self.engine, 'connect', set_pragmas)
         self.name = db_file_path.stem
         self.file_path = db_file_path.absolute()
+        self.read_only = read_only
 
     def set_echo(self, echo: bool) -> None:
         self.engine.echo = echo
@@ -20,6 +76,14 @@ class DBConnection:
     def create_session(self) -> Session:
         return Session(self.engine)
 
+    def analyze(self) -> None:
+        '''
+        Gathers the statistics of the tables and the indexes, so that the query planner of
+        SQLite picks the most selective indexes. Run once the database is populated.
+        '''
+        with self.engine.begin() as connection:
+            connection.execute(text('ANALYZE'))
+
     def get_name(self) -> str|None:
         return self.name
 
@@ -28,4 +92,4 @@ class DBConnection:
 
 
 def read_json_file(json_file_path: Path) -> dict:
-    return json.loads(json_file_path.read_text())
\ No newline at end of file
+    return json.loads(json_file_path.read_text())
@@ -0,0 +1,59 @@
+"""
+Full text search tables of the terms: FTS5 tables with the trigram tokenizer, that index the
+substrings of the term ids, drs_names and descriptions. They are created at ingestion, if the
+SQLite library supports them, and the search layer finds the terms whose ids contain, start or
+end with a given value through them instead of scanning the term tables.
+"""
+import logging
+import sqlite3
+from functools import cache
+
+from sqlalchemy import text
+
+from esgvoc.core.db.connection import DBConnection
+
+_LOGGER = logging.getLogger(__name__)
+
+FTS_TABLE_NAME_SUFFIX = '_fts'
+FTS_COLUMNS = ('id', 'drs_name', 'description')
+FTS_MIN_QUERY_LENGTH = 3
+"""The trigram tokenizer can't look up less than 3 characters."""
+
+
+def get_fts_table_name(table_name: str) -> str:
+    return f'{table_name}{FTS_TABLE_NAME_SUFFIX}'
+
+
+@cache
+def is_fts_supported() -> bool:
+    """Tells if the SQLite library supports FTS5 and its trigram tokenizer (SQLite >= 3.34)."""
+    try:
+        with sqlite3.connect(':memory:') as connection:
+            connection.execute("CREATE VIRTUAL TABLE test USING fts5(x, tokenize='trigram')")
+        return True
+    except sqlite3.Error:
+        return False
+
+
+def create_fts_table(connection: DBConnection, table_name: str) -> bool:
+    """
+    Creates and fills the full text search table of the given term table (pterms or uterms).
+    The table is contentless: it only returns the pk (rowid) of the terms.
+
+    :returns: `False` if the SQLite library doesn't support it.
+    :rtype: bool
+    """
+    if not is_fts_supported():
+        _LOGGER.warning('SQLite does not support the FTS5 trigram tokenizer: ' +
+                        f'{table_name} searches scan the table')
+        return False
+    fts_table_name = get_fts_table_name(table_name)
+    columns = ', '.join(FTS_COLUMNS)
+    with connection.get_engine().begin() as db_connection:
+        db_connection.execute(text(f'DROP TABLE IF EXISTS {fts_table_name}'))
+        db_connection.execute(text(f"CREATE VIRTUAL TABLE {fts_table_name} USING " +
+                                   f"fts5({columns}, content='', tokenize='trigram')"))
+        db_connection.execute(text(f"INSERT INTO {fts_table_name}(rowid, {columns}) " +
+                                   "SELECT pk, id, drs_name, " +
+                                   f"json_extract(specs, '$.description') FROM {table_name}"))
+    return True
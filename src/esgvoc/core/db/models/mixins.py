@@ -2,6 +2,8 @@ from enum import Enum
 
 from sqlmodel import Field
 
+import esgvoc.core.constants
+
 
 class TermKind(Enum):
     PLAIN = "plain"
@@ -16,3 +18,22 @@ class PkMixin:
 
 class IdMixin:
     id: str = Field(index=True)
+
+
+class TermSpecsMixin:
+    """
+    The fields of the specs of the terms that the API reads on every term, copied into
+    columns at ingestion so that they are read without decoding the specs.
+    """
+    type: str | None = Field(default=None)
+    drs_name: str | None = Field(default=None)
+    regex: str | None = Field(default=None)
+    separator: str | None = Field(default=None)
+
+
+def get_term_specs_columns(json_specs: dict) -> dict[str, str | None]:
+    """Returns the values of the TermSpecsMixin columns, extracted from the given specs."""
+    return {'type': json_specs.get(esgvoc.core.constants.TERM_TYPE_JSON_KEY),
+            'drs_name': json_specs.get(esgvoc.core.constants.DRS_SPECS_JSON_KEY),
+            'regex': json_specs.get(esgvoc.core.constants.PATTERN_JSON_KEY),
+            'separator': json_specs.get(esgvoc.core.constants.COMPOSITE_SEPARATOR_JSON_KEY)}
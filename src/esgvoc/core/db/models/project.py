@@ -6,7 +6,7 @@ from sqlalchemy.dialects.sqlite import JSON
 from sqlmodel import Column, Field, Relationship, SQLModel
 
 import esgvoc.core.db.connection as db
-from esgvoc.core.db.models.mixins import IdMixin, PkMixin, TermKind
+from esgvoc.core.db.models.mixins import IdMixin, PkMixin, TermKind, TermSpecsMixin
 
 _LOGGER = logging.getLogger("project_db_creation")
 
@@ -15,7 +15,9 @@ class Project(SQLModel, PkMixin, IdMixin, table=True):
     __tablename__ = "projects"
     specs: dict = Field(sa_column=sa.Column(JSON))
     git_hash: str
-    collections: list["Collection"] = Relationship(back_populates="project")
+    schema_version: int | None = None  # None: built before the schema was versioned.
+    collections: list["Collection"] = Relationship(back_populates="project",
+                                                   sa_relationship_kwargs={"order_by": "Collection.pk"})
 
 
 class Collection(SQLModel, PkMixin, IdMixin, table=True):
@@ -24,11 +26,12 @@ class Collection(SQLModel, PkMixin, IdMixin, table=True):
     context: dict = Field(sa_column=sa.Column(JSON))
     project_pk: int | None = Field(default=None, foreign_key="projects.pk")
     project: Project = Relationship(back_populates="collections")
-    terms: list["PTerm"] = Relationship(back_populates="collection")
+    terms: list["PTerm"] = Relationship(back_populates="collection",
+                                        sa_relationship_kwargs={"order_by": "PTerm.pk"})
     term_kind: TermKind = Field(sa_column=Column(sa.Enum(TermKind)))
 
 
-class PTerm(SQLModel, PkMixin, IdMixin, table=True):
+class PTerm(SQLModel, PkMixin, IdMixin, TermSpecsMixin, table=True):
     __tablename__ = "pterms"
     specs: dict = Field(sa_column=sa.Column(JSON))
     kind: TermKind = Field(sa_column=Column(sa.Enum(TermKind)))
@@ -36,10 +39,22 @@ class PTerm(SQLModel, PkMixin, IdMixin, table=True):
     collection: Collection = Relationship(back_populates="terms")
 
 
-def create_drs_name_index():
-    PTerm.__table_args__ = sa.Index(
-        "drs_name_index", PTerm.__table__.c.specs["drs_name"]
-    )
+# The indexes are bound to the tables, so they are created with them.
+# Lookups of a term by id in a collection.
+sa.Index("ix_pterms_collection_pk_id",
+         PTerm.__table__.c.collection_pk, PTerm.__table__.c.id)  # type: ignore[attr-defined]
+# Lookups of a term by drs_name in a collection.
+sa.Index("ix_pterms_collection_pk_drs_name",
+         PTerm.__table__.c.collection_pk, PTerm.__table__.c.drs_name)  # type: ignore[attr-defined]
+# Case insensitive lookups (the NOCASE collation matches the ASCII characters regardless of
+# their case, as the lower function of SQLite).
+sa.Index("ix_collections_id_nocase",
+         Collection.__table__.c.id.collate("NOCASE"))  # type: ignore[attr-defined]
+sa.Index("ix_pterms_id_nocase",
+         PTerm.__table__.c.id.collate("NOCASE"))  # type: ignore[attr-defined]
+sa.Index("ix_pterms_collection_pk_id_nocase",
+         PTerm.__table__.c.collection_pk,  # type: ignore[attr-defined]
+         PTerm.__table__.c.id.collate("NOCASE"))  # type: ignore[attr-defined]
 
 
 def project_create_db(db_file_path: Path):
@@ -53,7 +68,6 @@ def project_create_db(db_file_path: Path):
         tables_to_be_created = [SQLModel.metadata.tables['projects'],
                                 SQLModel.metadata.tables['collections'],
                                 SQLModel.metadata.tables['pterms']]
-        create_drs_name_index()
         SQLModel.metadata.create_all(connection.get_engine(), tables=tables_to_be_created)
     except Exception as e:
         msg = f'Unable to create tables in SQLite database at {db_file_path}. Abort.'
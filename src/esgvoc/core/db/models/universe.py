@@ -6,7 +6,7 @@ from sqlalchemy.dialects.sqlite import JSON
 from sqlmodel import Column, Field, Relationship, SQLModel
 
 import esgvoc.core.db.connection as db
-from esgvoc.core.db.models.mixins import IdMixin, PkMixin, TermKind
+from esgvoc.core.db.models.mixins import IdMixin, PkMixin, TermKind, TermSpecsMixin
 
 _LOGGER = logging.getLogger("universe_db_creation")
 
@@ -14,6 +14,7 @@ _LOGGER = logging.getLogger("universe_db_creation")
 class Universe(SQLModel, PkMixin, table=True):
     __tablename__ = "universes"
     git_hash: str
+    schema_version: int | None = None  # None: built before the schema was versioned.
     data_descriptors: list["DataDescriptor"] = Relationship(back_populates="universe")
 
 
@@ -22,11 +23,12 @@ class DataDescriptor(SQLModel, PkMixin, IdMixin, table=True):
     context: dict = Field(sa_column=sa.Column(JSON))
     universe_pk: int | None = Field(default=None, foreign_key="universes.pk")
     universe: Universe = Relationship(back_populates="data_descriptors")
-    terms: list["UTerm"] = Relationship(back_populates="data_descriptor")
+    terms: list["UTerm"] = Relationship(back_populates="data_descriptor",
+                                        sa_relationship_kwargs={"order_by": "UTerm.pk"})
     term_kind: TermKind = Field(sa_column=Column(sa.Enum(TermKind)))
 
 
-class UTerm(SQLModel, PkMixin, IdMixin, table=True):
+class UTerm(SQLModel, PkMixin, IdMixin, TermSpecsMixin, table=True):
     __tablename__ = "uterms"
     specs: dict = Field(sa_column=sa.Column(JSON))
     kind: TermKind = Field(sa_column=Column(sa.Enum(TermKind)))
@@ -36,6 +38,24 @@ class UTerm(SQLModel, PkMixin, IdMixin, table=True):
     data_descriptor: DataDescriptor = Relationship(back_populates="terms")
 
 
+# The indexes are bound to the table, so they are created with it.
+# Lookups of a term by id in a data descriptor.
+sa.Index("ix_uterms_data_descriptor_pk_id",
+         UTerm.__table__.c.data_descriptor_pk, UTerm.__table__.c.id)  # type: ignore[attr-defined]
+# Lookups of a term by drs_name in a data descriptor.
+sa.Index("ix_uterms_data_descriptor_pk_drs_name",
+         UTerm.__table__.c.data_descriptor_pk, UTerm.__table__.c.drs_name)  # type: ignore[attr-defined]
+# Case insensitive lookups (the NOCASE collation matches the ASCII characters regardless of
+# their case, as the lower function of SQLite).
+sa.Index("ix_data_descriptors_id_nocase",
+         DataDescriptor.__table__.c.id.collate("NOCASE"))  # type: ignore[attr-defined]
+sa.Index("ix_uterms_id_nocase",
+         UTerm.__table__.c.id.collate("NOCASE"))  # type: ignore[attr-defined]
+sa.Index("ix_uterms_data_descriptor_pk_id_nocase",
+         UTerm.__table__.c.data_descriptor_pk,  # type: ignore[attr-defined]
+         UTerm.__table__.c.id.collate("NOCASE"))  # type: ignore[attr-defined]
+
+
 def universe_create_db(db_file_path: Path) -> None:
     try:
         connection = db.DBConnection(db_file_path)
@@ -5,11 +5,12 @@ import esgvoc.core.constants
 from esgvoc.core.data_handler import JsonLdResource
 from esgvoc.core.db.connection import DBConnection
 from esgvoc.core.service.data_merger import DataMerger
-from esgvoc.core.db.models.mixins import TermKind
+from esgvoc.core.db.models.mixins import TermKind, get_term_specs_columns
 from pydantic import BaseModel
 
 import esgvoc.core.db.connection as db
 from esgvoc.core.db.connection import read_json_file
+from esgvoc.core.db.fts import create_fts_table
 from esgvoc.core.db.models.project import Collection, Project, PTerm
 
 
@@ -26,7 +27,8 @@ def infer_term_kind(json_specs: dict) -> TermKind:
 
 def ingest_metadata_project(connection:DBConnection,git_hash):
     with connection.create_session() as session:
-        project = Project(id=str(connection.file_path.stem), git_hash=git_hash,specs={})
+        project = Project(id=str(connection.file_path.stem), git_hash=git_hash,specs={},
+                          schema_version=esgvoc.core.constants.DB_SCHEMA_VERSION)
         session.add(project)    
         session.commit()
 
@@ -90,6 +92,7 @@ def ingest_collection(collection_dir_path: Path,
                     specs=json_specs,
                     collection=collection,
                     kind=term_kind,
+                    **get_term_specs_columns(json_specs),
                 )
                 project_db_session.add(term)
             except Exception as e:
@@ -123,7 +126,8 @@ def ingest_project(project_dir_path: Path,
             _LOGGER.fatal(msg)
             raise RuntimeError(msg) from e
         
-        project = Project(id=project_id, specs=project_json_specs,git_hash=git_hash)
+        project = Project(id=project_id, specs=project_json_specs,git_hash=git_hash,
+                          schema_version=esgvoc.core.constants.DB_SCHEMA_VERSION)
         project_db_session.add(project)
         
 
@@ -139,6 +143,8 @@ def ingest_project(project_dir_path: Path,
                     _LOGGER.fatal(msg)
                     raise RuntimeError(msg) from e
         project_db_session.commit()
+    create_fts_table(project_connection, PTerm.__tablename__)
+    project_connection.analyze()
 
 
 
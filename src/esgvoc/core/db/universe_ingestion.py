@@ -8,7 +8,8 @@ from sqlmodel import Session, select
 
 import esgvoc.core.db.connection as db
 from esgvoc.core.db.connection import read_json_file
-from esgvoc.core.db.models.mixins import TermKind
+from esgvoc.core.db.fts import create_fts_table
+from esgvoc.core.db.models.mixins import TermKind, get_term_specs_columns
 from esgvoc.core.db.models.universe import DataDescriptor, UTerm, Universe
 from esgvoc.core.db.models.universe import universe_create_db
 
@@ -39,10 +40,13 @@ def ingest_universe(universe_repo_dir_path: Path, universe_db_file_path: Path) -
                 msg = f'Unexpected error while processing data descriptor {data_descriptor_dir_path}. Abort.'
                 _LOGGER.fatal(msg)
                 raise RuntimeError(msg) from e
-        
+    create_fts_table(connection, UTerm.__tablename__)
+    connection.analyze()
+
 def ingest_metadata_universe(connection,git_hash):
     with connection.create_session() as session:
-        universe = Universe(git_hash=git_hash)
+        universe = Universe(git_hash=git_hash,
+                            schema_version=esgvoc.core.constants.DB_SCHEMA_VERSION)
         session.add(universe)    
         session.commit()
 
@@ -91,6 +95,7 @@ def ingest_data_descriptor(data_descriptor_path: Path,
                         specs=json_specs,
                         data_descriptor=data_descriptor,
                         kind=term_kind,
+                        **get_term_specs_columns(json_specs),
                     )
                     session.add(term)
         if term_kind_dd is not None:
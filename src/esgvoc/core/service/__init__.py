@@ -1,8 +1,38 @@
+import threading
+from pathlib import Path
+
 from esgvoc.core.service.settings import ServiceSettings
 from esgvoc.core.service.state import StateService
-from pathlib import Path
 
 settings_path = Path(__file__).parent / "settings.toml"
-service_settings = ServiceSettings.load_from_file(str(settings_path))
-state_service = StateService(service_settings)
 
+_LOCK = threading.RLock()
+
+
+def __getattr__(name: str):
+    # The settings and the state service are built on first access (PEP 562), so that importing
+    # esgvoc doesn't read the settings, open any database or run any git command.
+    global service_settings, state_service
+    with _LOCK:
+        match name:
+            case "service_settings":
+                if "service_settings" not in globals():
+                    service_settings = ServiceSettings.load_from_file(str(settings_path))
+                return service_settings
+            case "state_service":
+                if "state_service" not in globals():
+                    state_service = StateService(__getattr__("service_settings"))
+                return state_service
+            case _:
+                raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def discard_db_connections() -> None:
+    """
+    Forgets the database connections inherited from a parent process (fork), e.g., in the
+    initializer of the workers of a process pool: the pooled SQLite connections of the parent
+    must not be shared across processes. The worker opens its own connections on first use.
+    """
+    state_service = globals().get("state_service")
+    if state_service is not None:
+        state_service.discard_db_connections()
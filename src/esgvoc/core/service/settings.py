@@ -1,5 +1,6 @@
-from pydantic import BaseModel, Field
-from typing import Dict, Optional
+from enum import Enum
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Dict, Literal, Optional
 from pathlib import Path
 import toml
 
@@ -19,20 +20,56 @@ class UniverseSettings(BaseModel):
     local_path: Optional[str] = None
     db_path: Optional[str] = None
 
+class TempStore(str, Enum):
+    DEFAULT = "DEFAULT"
+    FILE = "FILE"
+    MEMORY = "MEMORY"
+
+class DBSettings(BaseModel):
+    """Profile of the connections of the API to the databases (read only at runtime)."""
+    # The settings are turned into SQLite pragmas: unknown keys are rejected.
+    model_config = ConfigDict(extra="forbid")
+    read_only: bool = True
+    immutable: bool = False  # No locking: only if the databases are never rebuilt while in use.
+    mmap_size: int = Field(268435456, ge=0)  # Bytes.
+    cache_size: int = -65536  # Pages if positive, KiB if negative.
+    temp_store: TempStore = TempStore.MEMORY
+    pool_size: int = Field(16, ge=1)  # Concurrent SQLite connections per database.
+
+    def get_pragmas(self) -> Dict[str, int|str]:
+        pragmas: Dict[str, int|str] = {"mmap_size": self.mmap_size,
+                                       "cache_size": self.cache_size,
+                                       "temp_store": self.temp_store.value}
+        if self.read_only:
+            pragmas["query_only"] = "ON"
+        return pragmas
+
+class CacheSettings(BaseModel):
+    """Caches of the API."""
+    term_cache_size: int = Field(4096, ge=0)  # Instantiated terms. 0 disables the cache.
+    # lru: least recently used first, fifo: oldest first.
+    term_cache_eviction: Literal["lru", "fifo"] = "lru"
+
 class ServiceSettings(BaseModel):
     universe: UniverseSettings
     projects: Dict[str, ProjectSettings] = Field(default_factory=dict)
+    db: DBSettings = Field(default_factory=DBSettings)
+    cache: CacheSettings = Field(default_factory=CacheSettings)
 
     @classmethod
     def load_from_file(cls, file_path: str) -> "ServiceSettings":
         data = toml.load(file_path)
         projects = {p['project_name']: ProjectSettings(**p) for p in data.pop('projects', [])}
-        return cls(universe=UniverseSettings(**data['universe']), projects=projects)
+        return cls(universe=UniverseSettings(**data['universe']), projects=projects,
+                   db=DBSettings(**data.get('db', {})),
+                   cache=CacheSettings(**data.get('cache', {})))
 
     def save_to_file(self, file_path: str):
         data = {
             "universe": self.universe.model_dump(),
-            "projects": [p.model_dump() for p in self.projects.values()]
+            "projects": [p.model_dump() for p in self.projects.values()],
+            "db": self.db.model_dump(mode="json"),
+            "cache": self.cache.model_dump()
         }
         with open(file_path, "w") as f:
             toml.dump(data, f)
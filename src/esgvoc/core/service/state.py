@@ -1,14 +1,17 @@
 import logging
 import os
+import threading
 from pathlib import Path
 from typing import Optional
 
 from esgvoc.core.repo_fetcher import RepoFetcher
-from esgvoc.core.service.settings import UniverseSettings, ProjectSettings, ServiceSettings
+from esgvoc.core.service.settings import (DBSettings, UniverseSettings, ProjectSettings,
+                                          ServiceSettings)
 from esgvoc.core.db.connection import DBConnection
 
+from esgvoc.core.constants import DB_SCHEMA_VERSION
 from rich.table import Table
-from sqlalchemy.exc import NoResultFound
+from sqlalchemy.exc import NoResultFound, OperationalError
 from sqlmodel import select
 from esgvoc.core.db.models.universe import Universe
 from esgvoc.core.db.models.project import Project
@@ -16,7 +19,8 @@ from esgvoc.core.db.models.project import Project
 logger = logging.getLogger(__name__)
 
 class BaseState:
-    def __init__(self, github_repo: str, branch: str = "main", local_path: Optional[str] = None, db_path: Optional[str] = None):
+    def __init__(self, github_repo: str, branch: str = "main", local_path: Optional[str] = None, db_path: Optional[str] = None,
+                 db_settings: Optional[DBSettings] = None):
     
         self.github_repo = github_repo
         self.branch = branch
@@ -30,11 +34,76 @@ class BaseState:
         self.db_path = db_path
         self.db_access = True  # False if we cant access the db for some reason
         self.db_version = None
+        # Version of the schema of the database (None if built before it was versioned).
+        self.db_schema_version: int|None = None
+        # Identity of the database file when it was opened (see refresh_db_connection).
+        self.db_file_id: str|None = None
+        # Profile of the connection of the API (the ingestion uses its own connections).
+        self.db_settings = db_settings if db_settings is not None else DBSettings()
         
         self.rf = RepoFetcher()
-        self.db_connection:DBConnection|None = None
+        # Serializes the opening, refresh, closing and discarding of the connection, which are
+        # run by the threads of the API (e.g., the workers of the all projects functions).
+        self.db_lock = threading.RLock()
+        self._db_connection:DBConnection|None = None
+        # Set when the lazy opening of the database failed (e.g., missing file): it is not
+        # retried until the next sync or build of the database.
+        self._db_connection_failed = False
         self.db_sqlmodel = None
+
+    @property
+    def db_connection(self) -> DBConnection|None:
+        # The connection is opened on first use. Only the database is read, git is never called.
+        with self.db_lock:
+            if self._db_connection is None and not self._db_connection_failed:
+                self.fetch_version_db()
+                self._db_connection_failed = self._db_connection is None
+            return self._db_connection
+
+    def close_db_connection(self):
+        # The sessions in use keep their SQLite connection: the disposed engine closes the
+        # pooled connections only.
+        with self.db_lock:
+            if self._db_connection is not None:
+                self._db_connection.get_engine().dispose()
+                self._db_connection = None
+            self.db_file_id = None
+
+    def _get_db_file_id(self) -> str|None:
+        # Changes when the file is replaced or modified (e.g., rebuilt by another process).
+        try:
+            stat = os.stat(self.db_path)
+        except (OSError, TypeError):
+            return None
+        return f"{stat.st_dev}:{stat.st_ino}:{stat.st_mtime_ns}"
+
+    def refresh_db_connection(self):
+        # Reopens the database if its file has been replaced or modified since it was opened
+        # (e.g., rebuilt by esgvoc install in another process): the opened connections would
+        # still read the former file.
+        with self.db_lock:
+            if self._db_connection is not None and self._get_db_file_id() != self.db_file_id:
+                logger.debug(f"{self.db_path} has changed: the database is reopened")
+                self.close_db_connection()
+                self.fetch_version_db()
+
+    def discard_db_connection(self):
+        # Forgets a connection inherited from a parent process (fork): the pooled SQLite
+        # connections belong to the parent, so they are neither closed nor reused. The lock is
+        # replaced too, as a thread of the parent may have held it during the fork.
+        self.db_lock = threading.RLock()
+        if self._db_connection is not None:
+            self._db_connection.get_engine().dispose(close=False)
+            self._db_connection = None
+        self.db_file_id = None
     
+    def _create_db_connection(self) -> DBConnection:
+        return DBConnection(db_file_path=Path(self.db_path),
+                            read_only=self.db_settings.read_only,
+                            immutable=self.db_settings.read_only and self.db_settings.immutable,
+                            pragmas=self.db_settings.get_pragmas(),
+                            pool_size=self.db_settings.pool_size)
+
     def fetch_version_local(self):
          if self.local_path:
             try:
@@ -61,25 +130,46 @@ class BaseState:
                 self.github_access = False
 
     def fetch_version_db(self):
-        if self.db_path:
-            if not os.path.exists(self.db_path):
+        with self.db_lock:
+            if self.db_path:
+                if not os.path.exists(self.db_path):
+                    self.close_db_connection()
+                    self.db_version = None
+                    self.db_schema_version = None
+                    self.db_access = False
+                else:
+                    try:
+                        if self._db_connection is None:
+                            self.db_file_id = self._get_db_file_id()
+                            self._db_connection = self._create_db_connection()
+                        with self._db_connection.create_session() as session:
+                            self.db_version = session.exec(select(self.db_sqlmodel.git_hash)).one()
+                            self.db_access = True
+                        self.db_schema_version = self._fetch_db_schema_version()
+                    except NoResultFound :
+                        logger.debug(f"Unable to find git_hash in {self.db_path}")
+                    except Exception as e:
+                        logger.debug(f"Unable to find git_has in {self.db_path} cause {e}" )
+
+            else:
                 self.db_version = None
+                self.db_schema_version = None
                 self.db_access = False
-            else:
-                try:
-                    self.db_connection =DBConnection(db_file_path= Path(self.db_path)) 
-                    with self.db_connection.create_session() as session:
-                        self.db_version = session.exec(select(self.db_sqlmodel.git_hash)).one()
-                        self.db_access = True
-                except NoResultFound :
-                    logger.debug(f"Unable to find git_hash in {self.db_path}")
-                except Exception as e:
-                    logger.debug(f"Unable to find git_has in {self.db_path} cause {e}" )
 
-        else:
-            self.db_version = None
-            self.db_access = False
 
+    def _fetch_db_schema_version(self) -> int|None:
+        try:
+            with self._db_connection.create_session() as session:
+                schema_version = session.exec(select(self.db_sqlmodel.schema_version)).one()
+        except OperationalError:  # No such column: built before the schema was versioned.
+            schema_version = None
+        if schema_version != DB_SCHEMA_VERSION:
+            logger.warning(f"{self.db_path} has the schema version {schema_version} instead of " +
+                           f"{DB_SCHEMA_VERSION}: it must be rebuilt (see esgvoc install)")
+        return schema_version
+
+    def is_db_schema_outdated(self) -> bool:
+        return self.db_version is not None and self.db_schema_version != DB_SCHEMA_VERSION
 
     def fetch_versions(self):
         self.fetch_version_remote()
@@ -88,11 +178,13 @@ class BaseState:
               
     def check_sync_status(self):
         self.fetch_versions()
+        # A database of another schema version is out of sync whatever its git hash.
+        schema_outdated = self.is_db_schema_outdated()
         return {
             "github_local_sync": self.github_version == self.local_version if self.github_access and self.github_version and self.local_version else None,
-            "local_db_sync": self.local_version == self.db_version if self.local_access and self.local_version and self.db_version else None,
+            "local_db_sync": self.local_version == self.db_version and not schema_outdated if self.local_access and self.local_version and self.db_version else None,
 
-            "github_db_sync": self.github_version == self.db_version if self.github_access and self.github_version and self.db_version else None
+            "github_db_sync": self.github_version == self.db_version and not schema_outdated if self.github_access and self.github_version and self.db_version else None
         }
 
     def clone_remote(self):
@@ -109,7 +201,9 @@ class BaseState:
         from esgvoc.core.db.models.universe import universe_create_db 
         from esgvoc.core.db.universe_ingestion import ingest_universe
 
+        self._db_connection_failed = False
         if self.db_path :
+            self.close_db_connection()
             if os.path.exists(self.db_path):
                 os.remove(self.db_path)
             else:
@@ -131,6 +225,7 @@ class BaseState:
         
 
     def sync(self):
+        self._db_connection_failed = False
         summary = self.check_sync_status()
         if self.github_access and summary["github_db_sync"] is None and summary["local_db_sync"]is None and summary["github_local_sync"] is None:
             self.clone_remote()
@@ -159,22 +254,23 @@ class BaseState:
             pass
         """
 class StateUniverse(BaseState):
-    def __init__(self, settings: UniverseSettings):
-        super().__init__(**settings.model_dump())
+    def __init__(self, settings: UniverseSettings, db_settings: Optional[DBSettings] = None):
+        super().__init__(**settings.model_dump(), db_settings=db_settings)
         self.db_sqlmodel=Universe
 
 class StateProject(BaseState):
-    def __init__(self, settings: ProjectSettings):
+    def __init__(self, settings: ProjectSettings, db_settings: Optional[DBSettings] = None):
         mdict = settings.model_dump()
         self.project_name = mdict.pop("project_name")
-        super().__init__(**mdict)
+        super().__init__(**mdict, db_settings=db_settings)
         self.db_sqlmodel = Project
 
 class StateService:
     def __init__(self, service_settings: ServiceSettings):
-        self.universe= StateUniverse(service_settings.universe)
-        self.projects = {name: StateProject(proj) for name, proj in service_settings.projects.items()}
-        self.connect_db()
+        self.universe= StateUniverse(service_settings.universe, service_settings.db)
+        self.projects = {name: StateProject(proj, service_settings.db) for name, proj in service_settings.projects.items()}
+        # Versions are fetched (git included) only on demand: see connect_db, get_state_summary
+        # and synchronize_all. The database connections are lazily opened by the states.
         
     def get_state_summary(self):
         universe_status = self.universe.check_sync_status()
@@ -186,6 +282,11 @@ class StateService:
         for _,proj_state in self.projects.items():
             proj_state.fetch_versions()
 
+    def discard_db_connections(self):
+        self.universe.discard_db_connection()
+        for project in self.projects.values():
+            project.discard_db_connection()
+
     def synchronize_all(self):
         self.universe.sync()
         for project in self.projects.values():
@@ -0,0 +1,98 @@
+import json
+from pathlib import Path
+from typing import Generator
+
+import pytest
+
+import esgvoc.core.service as service
+from esgvoc.api import clear_term_cache
+from esgvoc.core.constants import DB_SCHEMA_VERSION, PROJECT_ID_JSON_KEY
+from esgvoc.core.db.connection import DBConnection
+from esgvoc.core.db.fts import create_fts_table
+from esgvoc.core.db.models.mixins import get_term_specs_columns
+from esgvoc.core.db.models.project import Collection, Project, PTerm, project_create_db
+from esgvoc.core.db.models.universe import DataDescriptor, Universe, UTerm, universe_create_db
+from esgvoc.core.db.universe_ingestion import infer_term_kind
+from esgvoc.core.service.settings import ProjectSettings, ServiceSettings, UniverseSettings
+
+# The terms of the fixture databases: {data descriptor id: [term specs]} for the universe,
+# the project specs and {collection id: {data descriptor id, [term specs]}} for the project.
+_DATA_DIR_PATH = Path(__file__).parent / 'data'
+_UNIVERSE_FILE_PATH = _DATA_DIR_PATH / 'universe.json'
+_PROJECT_FILE_PATH = _DATA_DIR_PATH / 'cmip6plus.json'
+
+
+def _build_universe_db(db_file_path: Path) -> None:
+    universe_create_db(db_file_path)
+    connection = DBConnection(db_file_path)
+    with connection.create_session() as session:
+        universe = Universe(git_hash='fixture', schema_version=DB_SCHEMA_VERSION)
+        session.add(universe)
+        for data_descriptor_id, terms in json.loads(_UNIVERSE_FILE_PATH.read_text()).items():
+            data_descriptor = DataDescriptor(id=data_descriptor_id, context={}, universe=universe,
+                                             term_kind=infer_term_kind(terms[0]))
+            for specs in terms:
+                session.add(UTerm(id=specs['id'], specs=specs, kind=infer_term_kind(specs),
+                                  data_descriptor=data_descriptor,
+                                  **get_term_specs_columns(specs)))
+            session.add(data_descriptor)
+        session.commit()
+    create_fts_table(connection, UTerm.__tablename__)
+    connection.analyze()
+    connection.get_engine().dispose()
+
+
+def _build_project_db(db_file_path: Path) -> str:
+    project_data = json.loads(_PROJECT_FILE_PATH.read_text())
+    project_id = project_data['specs'][PROJECT_ID_JSON_KEY]
+    project_create_db(db_file_path)
+    connection = DBConnection(db_file_path)
+    with connection.create_session() as session:
+        project = Project(id=project_id, specs=project_data['specs'], git_hash='fixture',
+                          schema_version=DB_SCHEMA_VERSION)
+        session.add(project)
+        for collection_id, collection_data in project_data['collections'].items():
+            terms = collection_data['terms']
+            collection = Collection(id=collection_id, context={}, project=project,
+                                    data_descriptor_id=collection_data['data_descriptor_id'],
+                                    term_kind=infer_term_kind(terms[0]))
+            for specs in terms:
+                session.add(PTerm(id=specs['id'], specs=specs, kind=infer_term_kind(specs),
+                                  collection=collection, **get_term_specs_columns(specs)))
+            session.add(collection)
+        session.commit()
+    create_fts_table(connection, PTerm.__tablename__)
+    connection.analyze()
+    connection.get_engine().dispose()
+    return project_id
+
+
+@pytest.fixture(scope='session', autouse=True)
+def fixture_service_settings(tmp_path_factory) -> Generator[ServiceSettings, None, None]:
+    """
+    Builds the fixture databases in a temporary directory and points the service at them,
+    instead of the databases of the settings file.
+    """
+    db_dir_path = tmp_path_factory.mktemp('dbs')
+    universe_db_file_path = db_dir_path / 'universe.sqlite'
+    _build_universe_db(universe_db_file_path)
+    project_db_file_path = db_dir_path / 'cmip6plus.sqlite'
+    project_id = _build_project_db(project_db_file_path)
+    settings_file_settings = service.service_settings
+    settings = ServiceSettings(
+        universe=UniverseSettings(github_repo='https://github.com/example/universe',
+                                  local_path=str(db_dir_path / 'repos' / 'universe'),
+                                  db_path=str(universe_db_file_path)),
+        projects={project_id: ProjectSettings(project_name=project_id,
+                                              github_repo='https://github.com/example/project',
+                                              local_path=str(db_dir_path / 'repos' / project_id),
+                                              db_path=str(project_db_file_path))},
+        db=settings_file_settings.db,
+        cache=settings_file_settings.cache)
+    service.service_settings = settings
+    vars(service).pop('state_service', None)  # Rebuilt from the fixture settings.
+    clear_term_cache()
+    yield settings
+    if state_service := vars(service).pop('state_service', None):
+        for state in [state_service.universe, *state_service.projects.values()]:
+            state.close_db_connection()
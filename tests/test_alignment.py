@@ -0,0 +1,58 @@
+import itertools
+import random
+
+from esgvoc.api._alignment import Step, align, fully_matches
+
+
+def _backtrack(is_required, tokens, matches, part_index=0, token_index=0):
+    # Exhaustive search, trying to consume the token, to skip the part then to discard the token.
+    nb_parts, nb_tokens = len(is_required), len(tokens)
+    if part_index == nb_parts and token_index == nb_tokens:
+        return 0, []
+    best = None
+    candidates = list()
+    if part_index < nb_parts and token_index < nb_tokens:
+        matched = matches(part_index, tokens[token_index])
+        candidates.append(((Step.MATCH if matched else Step.MISMATCH, part_index, token_index),
+                           0 if matched else 1, part_index + 1, token_index + 1))
+    if part_index < nb_parts:
+        required = is_required[part_index]
+        candidates.append(((Step.MISSING if required else Step.SKIP, part_index, None),
+                           1 if required else 0, part_index + 1, token_index))
+    if token_index < nb_tokens:
+        candidates.append(((Step.EXTRA, None, token_index), 1, part_index, token_index + 1))
+    for step, cost, next_part_index, next_token_index in candidates:
+        next_cost, next_steps = _backtrack(is_required, tokens, matches,
+                                           next_part_index, next_token_index)
+        if best is None or cost + next_cost < best[0]:
+            best = (cost + next_cost, [step] + next_steps)
+    return best
+
+
+def test_align_as_backtracking() -> None:
+    rand = random.Random(42)
+    for _ in range(500):
+        nb_parts = rand.randint(0, 6)
+        is_required = [rand.random() < 0.5 for _ in range(nb_parts)]
+        # Each part accepts some of the letters.
+        accepted = [set(rand.sample('abcd', rand.randint(1, 3))) for _ in range(nb_parts)]
+        tokens = rand.choices('abcd', k=rand.randint(0, 7))
+
+        def matches(part_index: int, token: str) -> bool:
+            return token in accepted[part_index]
+        expected = _backtrack(is_required, tokens, matches)
+        assert align(is_required, tokens, matches) == expected
+        assert fully_matches(is_required, tokens, matches) == (expected[0] == 0)
+
+
+def test_align_optional_parts() -> None:
+    is_required = [True, False, False, True]
+    def matches(part_index: int, token: str) -> bool:
+        return token == str(part_index)
+    for tokens in itertools.product('0123', repeat=3):
+        cost, steps = align(is_required, tokens, matches)
+        assert (cost == 0) == (tokens in [('0', '1', '3'), ('0', '2', '3')])
+    assert align(is_required, ['0', '3'], matches) == (0, [(Step.MATCH, 0, 0),
+                                                           (Step.SKIP, 1, None),
+                                                           (Step.SKIP, 2, None),
+                                                           (Step.MATCH, 3, 1)])
@@ -132,6 +132,25 @@ def test_find_terms_from_data_descriptor_in_all_projects(data_descriptor_id,
                                                              _SETTINGS)
 
 
+def test_raw_terms(project_id, collection_id) -> None:
+    terms = projects.get_all_terms_in_project(project_id)
+    raw_terms = projects.get_all_terms_in_project(project_id, raw=True)
+    assert [raw_term['id'] for raw_term in raw_terms] == [term.id for term in terms]
+    assert len(projects.get_all_terms_in_all_projects(raw=True)) == len(raw_terms)
+    terms = projects.get_all_terms_in_collection(project_id, collection_id)
+    raw_terms = projects.get_all_terms_in_collection(project_id, collection_id, raw=True)
+    assert [raw_term['id'] for raw_term in raw_terms] == [term.id for term in terms]
+    raw_terms = projects.find_terms_in_collection(project_id, collection_id, '', _SETTINGS,
+                                                  raw=True)
+    assert sorted(raw_term['id'] for raw_term in raw_terms) == sorted(term.id for term in terms)
+    raw_terms = projects.find_terms_in_all_projects('ipsl', raw=True)
+    assert [raw_term['id'] for raw_term in raw_terms] == ['ipsl']
+    result = projects.find_terms_from_data_descriptor_in_all_projects('institution', 'ipsl',
+                                                                      raw=True)
+    assert [(raw_term['id'], collection_id) for raw_term, collection_id in result] == \
+           [('ipsl', 'institution_id')]
+
+
 def test_valid_term() -> None:
     validation_requests = [
     (0, ('IPSL', 'cmip6plus', 'institution_id', 'ipsl')),
@@ -176,3 +195,208 @@ def test_valid_term_in_project() -> None:
         assert len(matching_terms) == nb_matching_terms
         if nb_matching_terms == 1:
             assert matching_terms[0].term_id == term_id
+
+
+def test_pattern_cache() -> None:
+    projects._PATTERN_CACHE.clear()
+    vr = projects.valid_term('20241206-20241207', 'cmip6plus', 'time_range', 'daily')
+    assert len(vr) == 0
+    info = projects._PATTERN_CACHE.info()
+    assert info.misses > 0
+    vr = projects.valid_term('0241206-0241207', 'cmip6plus', 'time_range', 'daily')
+    assert len(vr) == 2
+    new_info = projects._PATTERN_CACHE.info()
+    assert new_info.misses == info.misses
+    assert new_info.hits > info.hits
+
+
+def test_composite_pattern_cache() -> None:
+    projects._COMPOSITE_PATTERN_CACHE.clear()
+    for _ in range(3):
+        vr = projects.valid_term('r1i1p1f1', 'cmip6plus', 'member_id', 'ripf')
+        assert len(vr) == 0
+        vr = projects.valid_term('r1i1p1f111', 'cmip6plus', 'member_id', 'ripf')
+        assert len(vr) == 1
+    info = projects._COMPOSITE_PATTERN_CACHE.info()
+    assert info.misses == 1
+    assert info.hits == 5
+
+
+def test_drs_name_index() -> None:
+    projects._DRS_NAME_INDEX_CACHE.clear()
+    for _ in range(3):
+        matching_terms = projects.valid_term_in_collection('IPSL', 'cmip6plus', 'institution_id')
+        assert len(matching_terms) == 1
+        assert matching_terms[0].term_id == 'ipsl'
+        assert not projects.valid_term_in_collection('ipsl', 'cmip6plus', 'institution_id')
+    info = projects._DRS_NAME_INDEX_CACHE.info()
+    assert info.misses == 1
+    assert info.hits == 5
+
+
+def test_valid_terms() -> None:
+    values = ['IPSL', 'IPL', 'IPSL', ' IPSL ']
+    reports = projects.valid_terms(values, 'cmip6plus', 'institution_id', 'ipsl')
+    assert [len(report) for report in reports] == [0, 1, 0, 0]
+    assert [report.expression for report in reports] == ['IPSL', 'IPL', 'IPSL', 'IPSL']
+
+
+def test_valid_terms_in_collection() -> None:
+    values = ['20241206-20241207', '0241206-0241207', '20241206-20241207']
+    results = projects.valid_terms_in_collection(values, 'cmip6plus', 'time_range')
+    assert len(results) == len(values)
+    for value, matching_terms in zip(values, results):
+        assert matching_terms == projects.valid_term_in_collection(value, 'cmip6plus', 'time_range')
+
+
+def test_valid_terms_in_project() -> None:
+    values = ['IPSL', 'r1i1p1f1', 'IPL', 'r1i1p1f11', '20241206-20241207', 'IPSL']
+    results = projects.valid_terms_in_project(values, 'cmip6plus')
+    assert len(results) == len(values)
+    for value, matching_terms in zip(values, results):
+        assert matching_terms == projects.valid_term_in_project(value, 'cmip6plus')
+
+
+def test_valid_terms_in_all_projects() -> None:
+    values = ['IPSL', 'IPL', 'r1i1p1f1']
+    results = projects.valid_terms_in_all_projects(values)
+    assert len(results) == len(values)
+    for value, matching_terms in zip(values, results):
+        assert matching_terms == projects.valid_term_in_all_projects(value)
+
+
+def test_resolved_terms_cache(mocker) -> None:
+    spy = mocker.spy(projects, '_find_term_to_resolve')
+    values = [f'2024120{day}-2024120{day + 1}' for day in range(1, 9)]
+    results = projects.valid_terms_in_collection(values, 'cmip6plus', 'time_range')
+    assert all(matching_terms for matching_terms in results)
+    # One resolution per distinct part, whatever the number of values.
+    assert spy.call_count == len({(part['type'], part['id'])
+                                  for term in projects.get_all_terms_in_collection('cmip6plus',
+                                                                                   'time_range')
+                                  for part in term.model_dump()['parts']})
+
+
+def test_valid_term_in_project_of_all_collections() -> None:
+    values = ['IPSL', 'IPL', 'r1i1p1f1', 'r1i1p1f11', 'r10i2p3f4', '20241206-20241207',
+              '202412-202501', '0241206-0241207', 'v20240101', 'tas', 'Amon', 'gn', 'CMIP-gn',
+              'CMIP-Amon-gn']
+    collection_ids = projects.get_all_collections_in_project('cmip6plus')
+    for value in values:
+        expected = [matching_term for collection_id in collection_ids
+                                  for matching_term
+                                  in projects.valid_term_in_collection(value, 'cmip6plus',
+                                                                       collection_id)]
+        assert projects.valid_term_in_project(value, 'cmip6plus') == expected, value
+
+
+def test_project_index_combined_regex(mocker) -> None:
+    values = ['IPSL', 'r1i1p1f1', 'r1i1p1f11', '20241206-20241207', '202412-202501',
+              '0241206-0241207', 'v20240101', 'gn', 'CMIP-Amon']
+    projects._PROJECT_INDEX_CACHE.clear()
+    expected = projects.valid_terms_in_project(values, 'cmip6plus')
+    # An inline flag can't be in the middle of the alternation: the terms are matched one by one.
+    get_combinable_pattern = projects._get_combinable_pattern
+    mocker.patch.object(projects, '_get_combinable_pattern',
+                        lambda *args: None if (pattern:=get_combinable_pattern(*args)) is None
+                                      else f'(?i){pattern}')
+    logger = mocker.patch.object(projects, '_LOGGER')
+    projects._PROJECT_INDEX_CACHE.clear()
+    try:
+        assert projects.valid_terms_in_project(values, 'cmip6plus') == expected
+        logger.debug.assert_called_once()
+    finally:
+        projects._PROJECT_INDEX_CACHE.clear()
+
+
+@pytest.mark.parametrize('term_id, valid_values, invalid_values', [
+    ('all_optional', ['CMIP', 'Amon', 'gn', 'CMIP-Amon', 'CMIP-gn', 'Amon-gn', 'CMIP-Amon-gn'],
+     ['-Amon', '-gn', 'Amon-', 'CMIP-', 'Amon-CMIP', 'CMIP--gn', 'CMIP-Amon-gn-']),
+    ('middle_required', ['Amon', 'CMIP-Amon', 'Amon-gn', 'CMIP-Amon-gn'],
+     ['CMIP', '-Amon', 'CMIP-gn', 'Amon-']),
+    ('ends_required', ['CMIP-gn', 'CMIP-Amon-gn'], ['CMIP', 'gn', 'CMIP-Amon', 'Amon-gn']),
+])
+@pytest.mark.parametrize('collection_id, term_id_suffix', [('optional_parts', ''),
+                                                           ('optional_parts_regex', '_regex')])
+def test_optional_composite_parts(collection_id, term_id_suffix, term_id, valid_values,
+                                  invalid_values) -> None:
+    # The composites with a separator and the separator less composites made of them.
+    term_id = f'{term_id}{term_id_suffix}'
+    for value in valid_values:
+        assert projects.valid_term(value, 'cmip6plus', collection_id, term_id).validated, value
+    for value in invalid_values:
+        assert not projects.valid_term(value, 'cmip6plus', collection_id, term_id).validated, \
+               value
+
+
+def test_optional_composite_part_errors() -> None:
+    def validate(value: str) -> list:
+        report = projects.valid_term(value, 'cmip6plus', 'optional_parts', 'ends_required')
+        return [(error.value, error.term['id']) for error in report.errors]
+    # The part gn doesn't validate its split.
+    assert validate('CMIP-Amon-gr') == [('gr', 'gn')]
+    # The split gr is extra.
+    assert validate('CMIP-Amon-gr-gn') == [('CMIP-Amon-gr-gn', 'ends_required')]
+
+
+def test_changed_db(mocker, tmp_path) -> None:
+    import os
+    import shutil
+    import sqlite3
+    import esgvoc.core.service as service
+    state = service.state_service.projects['cmip6plus']
+    db_file_path = tmp_path / 'project.sqlite'
+    shutil.copy(state.db_path, db_file_path)
+    state.close_db_connection()
+    mocker.patch.object(state, 'db_path', str(db_file_path))
+    values = ['IPSL', 'IPSL-V2', 'v20240101', 'V20240101']
+
+    def find_term_ids() -> list[list[str]]:
+        return [[matching_term.term_id for matching_term in matching_terms]
+                for matching_terms in projects.valid_terms_in_project(values, 'cmip6plus')]
+    try:
+        assert find_term_ids() == [['ipsl'], [], ['version'], []]
+        assert projects.valid_term('IPSL', 'cmip6plus', 'institution_id', 'ipsl').validated
+        assert projects.valid_term('v20240101', 'cmip6plus', 'version', 'version').validated
+        # Another process installs a new version of the project.
+        changed_db_file_path = tmp_path / 'changed.sqlite'
+        shutil.copy(db_file_path, changed_db_file_path)
+        connection = sqlite3.connect(changed_db_file_path)
+        with connection:
+            connection.execute("UPDATE pterms SET drs_name = 'IPSL-V2' WHERE id = 'ipsl'")
+            connection.execute(r"UPDATE pterms SET regex = '^V\d{8}$' WHERE id = 'version'")
+        connection.close()
+        os.replace(changed_db_file_path, db_file_path)
+        assert find_term_ids() == [[], ['ipsl'], [], ['version']]
+        assert not projects.valid_term('IPSL', 'cmip6plus', 'institution_id', 'ipsl').validated
+        assert not projects.valid_term('v20240101', 'cmip6plus', 'version', 'version').validated
+    finally:
+        state.close_db_connection()
+
+
+def test_all_projects_with_workers() -> None:
+    assert projects.valid_term_in_all_projects('IPSL', max_workers=4) == \
+           projects.valid_term_in_all_projects('IPSL')
+    assert projects.valid_terms_in_all_projects(['IPSL', 'IPL'], max_workers=4) == \
+           projects.valid_terms_in_all_projects(['IPSL', 'IPL'])
+    assert projects.find_terms_in_all_projects('ipsl', max_workers=4) == \
+           projects.find_terms_in_all_projects('ipsl')
+    assert projects.get_all_terms_in_all_projects(max_workers=4) == \
+           projects.get_all_terms_in_all_projects()
+
+
+def test_validate_many() -> None:
+    from esgvoc.api.bulk import validate_many
+    values = ['IPSL', 'IPL', 'r1i1p1f1', 'r1i1p1f111'] * 5
+    expected = projects.valid_terms_in_project(values, 'cmip6plus')
+    assert list(validate_many(values, 'cmip6plus', max_workers=2, chunk_size=3)) == expected
+    assert list(validate_many(values, 'cmip6plus', max_workers=1, chunk_size=3)) == expected
+    expected = projects.valid_terms(values, 'cmip6plus', 'institution_id', 'ipsl')
+    reports = list(validate_many(values, 'cmip6plus', 'institution_id', 'ipsl', max_workers=2))
+    assert [bool(report) for report in reports] == [bool(report) for report in expected]
+    with pytest.raises(ValueError):
+        list(validate_many(values, 'cmip6plus', 'nonexistent_collection', max_workers=2))
+    # The arguments are checked when the function is called.
+    for kwargs in [{'max_workers': 0}, {'chunk_size': 0}, {'term_id': 'ipsl'}]:
+        with pytest.raises(ValueError):
+            validate_many(values, 'cmip6plus', **kwargs)
@@ -0,0 +1,79 @@
+from contextlib import contextmanager
+from typing import Generator
+
+from sqlalchemy import event
+
+import esgvoc.api.projects as projects
+import esgvoc.api.universe as universe
+import esgvoc.core.service as service
+from esgvoc.api import SearchSettings, SearchType
+
+_PROJECT_ID = 'cmip6plus'
+
+
+@contextmanager
+def _count_queries() -> Generator[list[str], None, None]:
+    """Records the statements executed on the universe and project databases."""
+    statements: list[str] = list()
+
+    def capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+    engines = [service.state_service.universe.db_connection.get_engine(),
+               service.state_service.projects[_PROJECT_ID].db_connection.get_engine()]
+    for engine in engines:
+        event.listen(engine, 'before_cursor_execute', capture)
+    try:
+        yield statements
+    finally:
+        for engine in engines:
+            event.remove(engine, 'before_cursor_execute', capture)
+
+
+def test_get_all_terms_in_universe_queries() -> None:
+    with _count_queries() as statements:
+        terms = universe.get_all_terms_in_universe()
+    assert len(terms) > len(universe.get_all_data_descriptors_in_universe())
+    assert len(statements) == 1
+
+
+def test_get_all_terms_in_project_queries() -> None:
+    with _count_queries() as statements:
+        terms = projects.get_all_terms_in_project(_PROJECT_ID)
+    assert len(terms) > len(projects.get_all_collections_in_project(_PROJECT_ID))
+    assert len(statements) == 1
+
+
+def test_find_terms_from_data_descriptor_in_project_queries() -> None:
+    settings = SearchSettings(type=SearchType.STARTS_WITH)
+    with _count_queries() as statements:
+        result = projects.find_terms_from_data_descriptor_in_project(_PROJECT_ID, 'time_range',
+                                                                     '', settings)
+    assert [collection_id for _, collection_id in result] == ['time_range', 'time_range']
+    assert len(statements) == 1
+
+
+def test_validation_error_queries() -> None:
+    with _count_queries() as statements:
+        report = projects.valid_term('IPSL-CM6A-LR', _PROJECT_ID, 'institution_id', 'ipsl')
+    assert report.errors[0].collection_id == 'institution_id'  # type: ignore[attr-defined]
+    assert len(statements) == 1
+    # The parts of the composite are resolved, but the errors don't load their collection
+    # or data descriptor.
+    with _count_queries() as statements:
+        report = projects.valid_term('r1i1p1f111', _PROJECT_ID, 'member_id', 'ripf')
+    assert report.errors[0].collection_id == 'member_id'  # type: ignore[attr-defined]
+    assert not any('collections.pk = ?' in statement or 'data_descriptors.pk = ?' in statement
+                   for statement in statements)
+
+
+def test_project_index_queries() -> None:
+    projects._PROJECT_INDEX_CACHE.clear()
+    # The terms of all the collections are loaded at once, only the parts of the composites
+    # are resolved one by one.
+    with _count_queries() as statements:
+        projects.valid_term_in_project('IPSL', _PROJECT_ID)
+    assert sum('FROM collections' in statement for statement in statements) == 1
+    assert sum('FROM pterms' in statement and 'pterms.collection_pk IN' in statement
+               for statement in statements) == 1
+    assert all(statement.endswith(('uterms.id IS ?', 'pterms.id IS ?'))
+               for statement in statements[2:])
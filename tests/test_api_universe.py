@@ -1,9 +1,18 @@
 from typing import Generator
 
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+from pydantic import ValidationError
+from sqlalchemy import event
 
 import esgvoc.api.universe as universe
-from esgvoc.api import SearchSettings, SearchType
+import esgvoc.core.service as service
+from esgvoc.api import (SearchSettings, SearchType, clear_term_cache, configure_term_cache,
+                        get_term_cache_info)
+from esgvoc.api._cache import BoundedCache, DBCache
+from esgvoc.api.data_descriptors.institution import Institution
 
 _SOME_DATA_DESCRIPTOR_IDS = ['institution', 'product', 'variable']
 _SOME_TERM_IDS = ['ipsl', 'observations', 'airmass']
@@ -35,6 +44,20 @@ def test_get_all_terms_in_universe() -> None:
     assert len(terms) > 0
 
 
+def test_raw_terms(data_descriptor_id, term_id) -> None:
+    terms = universe.get_all_terms_in_universe()
+    raw_terms = universe.get_all_terms_in_universe(raw=True)
+    assert [raw_term['id'] for raw_term in raw_terms] == [term.id for term in terms]
+    terms = universe.get_all_terms_in_data_descriptor(data_descriptor_id)
+    raw_terms = universe.get_all_terms_in_data_descriptor(data_descriptor_id, raw=True)
+    assert [raw_term['id'] for raw_term in raw_terms] == [term.id for term in terms]
+    raw_terms = universe.find_terms_in_data_descriptor(data_descriptor_id, term_id, _SETTINGS,
+                                                       raw=True)
+    assert all(isinstance(raw_term, dict) for raw_term in raw_terms)
+    raw_terms = universe.find_terms_in_universe(term_id, raw=True)
+    assert [raw_term['id'] for raw_term in raw_terms] == [term_id]
+
+
 def test_get_all_data_descriptors_in_universe() -> None:
     data_descriptors = universe.get_all_data_descriptors_in_universe()
     assert len(data_descriptors) > 0
@@ -65,4 +88,86 @@ def test_find_data_descriptor_in_universe(data_descriptor_id) -> None:
     data_descriptors = universe.find_data_descriptors_in_universe(data_descriptor_id)
     assert len(data_descriptors) == 1
     universe.find_data_descriptors_in_universe(data_descriptor_id, settings=_SETTINGS)
-    assert len(data_descriptors) > 0
\ No newline at end of file
+    assert len(data_descriptors) > 0
+
+_SUBSTRING_SEARCHES = {SearchType.LIKE: lambda term_id, value: value in term_id,
+                       SearchType.STARTS_WITH: lambda term_id, value: term_id.startswith(value),
+                       SearchType.ENDS_WITH: lambda term_id, value: term_id.endswith(value)}
+
+
+@pytest.mark.parametrize('search_type', _SUBSTRING_SEARCHES.keys())
+@pytest.mark.parametrize('case_sensitive', [True, False])
+@pytest.mark.parametrize('value', ['ips', 'IPS', 'lr', 'ipsl-cm', 'mass', 'a"b', ''])
+def test_substring_search(search_type, case_sensitive, value) -> None:
+    all_term_ids = {term.id for term in universe.get_all_terms_in_universe()}
+    search = _SUBSTRING_SEARCHES[search_type]
+    if case_sensitive:
+        expected = {term_id for term_id in all_term_ids if search(term_id, value)}
+    else:
+        expected = {term_id for term_id in all_term_ids
+                    if search(term_id.lower(), value.lower())}
+    settings = SearchSettings(type=search_type, case_sensitive=case_sensitive)
+    terms = universe.find_terms_in_universe(value, settings)
+    assert {term.id for term in terms} == expected
+
+
+def test_substring_search_uses_fts() -> None:
+    statements = list()
+
+    def capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+    engine = service.state_service.universe.db_connection.get_engine()
+    event.listen(engine, 'before_cursor_execute', capture)
+    try:
+        terms = universe.find_terms_in_universe('ipsl', SearchSettings(type=SearchType.LIKE))
+    finally:
+        event.remove(engine, 'before_cursor_execute', capture)
+    assert 'ipsl' in {term.id for term in terms}
+    assert any('uterms_fts MATCH' in statement for statement in statements)
+
+
+def test_term_cache() -> None:
+    clear_term_cache()
+    term = universe.find_terms_in_universe('ipsl')[0]
+    assert universe.find_terms_in_universe('ipsl')[0] is term
+    info = get_term_cache_info()
+    assert (info.hits, info.misses, info.size) == (1, 1, 1)
+    assert type(term) is Institution
+    assert Institution(**term.model_dump()) == term
+    # The cached terms are shared, so the term models are frozen.
+    with pytest.raises(ValidationError):
+        term.name = 'other'  # type: ignore[misc]
+    copy = pickle.loads(pickle.dumps(term))
+    assert copy == term and type(copy) is Institution
+    try:
+        configure_term_cache(1)
+        universe.find_terms_in_universe('cnrm-cerfacs')
+        info = get_term_cache_info()
+        assert (info.size, info.max_size, info.evictions) == (1, 1, 1)
+        assert universe.find_terms_in_universe('ipsl')[0] is not term
+    finally:
+        configure_term_cache(service.service_settings.cache.term_cache_size)
+
+
+@pytest.mark.parametrize('eviction, evicted_key', [('lru', 'b'), ('fifo', 'a')])
+def test_bounded_cache_eviction(eviction, evicted_key) -> None:
+    cache = BoundedCache(2, eviction)
+    cache.get('a', lambda: 1)
+    cache.get('b', lambda: 2)
+    cache.get('a', lambda: 0)  # Hit.
+    cache.get('c', lambda: 3)
+    assert cache.get(evicted_key, lambda: None) is None
+    assert cache.info().evictions == 2
+
+
+def test_db_cache_concurrent_stats() -> None:
+    cache = DBCache()
+    nb_calls = 2000
+
+    def get(index: int) -> None:
+        cache.get(('db', str(index % 2)), index % 50, lambda: index)
+        cache.info()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(get, range(nb_calls)))
+    info = cache.info()
+    assert info.hits + info.misses == nb_calls
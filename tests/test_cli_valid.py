@@ -0,0 +1,86 @@
+import io
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+import esgvoc.cli.valid as valid
+
+_LINES = ['IPSL\tcmip6plus:institution_id:ipsl',
+          'IPSL\tcmip6plus:institution_id:',
+          'IPSL\tcmip6plus::',
+          'IPSL\t::',
+          'IPS\tcmip6plus:institution_id:ipsl',
+          'IPSL\tno key']
+
+
+def _valid_lines(lines: list[str], chunk_size: int = 10) -> tuple[list[dict], int, int]:
+    output_stream = io.StringIO()
+    nb_lines, nb_invalid_lines = valid.valid_stream(io.StringIO('\n'.join(lines) + '\n'),
+                                                    output_stream, chunk_size)
+    results = [json.loads(line) for line in output_stream.getvalue().splitlines()]
+    return results, nb_lines, nb_invalid_lines
+
+
+def test_valid_stream() -> None:
+    results, nb_lines, nb_invalid_lines = _valid_lines(_LINES)
+    assert (nb_lines, nb_invalid_lines) == (6, 2)
+    assert [result['line'] for result in results] == [1, 2, 3, 4, 5, 6]
+    assert [result['valid'] for result in results] == [True, True, True, True, False, False]
+    assert results[0]['errors'] == []
+    assert results[1]['matching_terms'] == [{'project_id': 'cmip6plus',
+                                             'collection_id': 'institution_id',
+                                             'term_id': 'ipsl'}]
+    assert len(results[4]['errors']) == 1
+    assert results[5]['errors'] == ['Invalid input format']
+
+
+def test_valid_stream_chunks(mocker) -> None:
+    valid_chunk = mocker.spy(valid, '_valid_chunk')
+    results, nb_lines, _ = _valid_lines(_LINES, chunk_size=4)
+    assert valid_chunk.call_count == 2
+    assert nb_lines == len(_LINES)
+    assert results == _valid_lines(_LINES)[0]
+
+
+def test_valid_stream_isolates_bad_values(mocker) -> None:
+    valid_group = mocker.spy(valid, '_valid_group')
+    results, _, nb_invalid_lines = _valid_lines(['IPSL\tcmip6plus:institution_id:ipsl',
+                                                 '  \tcmip6plus:institution_id:ipsl',
+                                                 'IPS\tcmip6plus:institution_id:ipsl'])
+    assert nb_invalid_lines == 2
+    assert [result['valid'] for result in results] == [True, False, False]
+    assert 'ValueError' in results[1]['errors'][0]
+    # The batch, the key and each value.
+    assert valid_group.call_count == 5
+
+
+def test_valid_stream_invalid_key(mocker) -> None:
+    valid_group = mocker.spy(valid, '_valid_group')
+    results, _, nb_invalid_lines = _valid_lines(['IPSL\tcmip6plus:institution_id:unknown',
+                                                 'IPS\tcmip6plus:institution_id:unknown',
+                                                 'CNRM\tcmip6plus:institution_id:unknown'])
+    assert nb_invalid_lines == 3
+    assert len({result['errors'][0] for result in results}) == 1
+    # The values are not validated one by one.
+    assert valid_group.call_count == 2
+
+
+@pytest.mark.parametrize('chunk_size', [0, -1])
+def test_valid_chunk_size(chunk_size) -> None:
+    result = CliRunner().invoke(valid.app, ['--input', '-', '--chunk-size', str(chunk_size)],
+                                input='\n'.join(_LINES) + '\n')
+    assert result.exit_code == 2
+    assert result.stdout == ''
+    with pytest.raises(ValueError):
+        valid.valid_stream(io.StringIO(''), io.StringIO(), chunk_size)
+
+
+def test_valid_exit_code() -> None:
+    runner = CliRunner()
+    result = runner.invoke(valid.app, ['--input', '-'], input='\n'.join(_LINES[:4]) + '\n')
+    assert result.exit_code == 0
+    assert len(result.stdout.splitlines()) == 4
+    result = runner.invoke(valid.app, ['--input', '-'], input='\n'.join(_LINES) + '\n')
+    assert result.exit_code == 1
+    assert len(result.stdout.splitlines()) == len(_LINES)
@@ -0,0 +1,157 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import select
+
+from esgvoc.api.projects import (_find_collections_in_project, _find_terms_in_collection,
+                                 _find_terms_in_project)
+from esgvoc.api.search import SearchSettings
+from esgvoc.api.universe import (_find_data_descriptors_in_universe,
+                                 _find_terms_in_data_descriptor, _find_terms_in_universe)
+from esgvoc.core.db.connection import DBConnection
+from esgvoc.core.db.models.mixins import TermKind, get_term_specs_columns
+from esgvoc.core.db.models.project import Collection, Project, PTerm, project_create_db
+from esgvoc.core.db.models.universe import DataDescriptor, UTerm, universe_create_db
+
+_CASE_INSENSITIVE = SearchSettings(case_sensitive=False)
+# The term ids are shared between the collections (resp. data descriptors), so that the id
+# alone is not selective.
+_NB_CONTAINERS = 20
+_NB_TERMS = 50
+
+
+@pytest.fixture(scope='module')
+def project_connection(tmp_path_factory) -> DBConnection:
+    db_file_path: Path = tmp_path_factory.mktemp('dbs') / 'project.sqlite'
+    project_create_db(db_file_path)
+    connection = DBConnection(db_file_path)
+    with connection.create_session() as session:
+        project = Project(id='project', specs={}, git_hash='hash')
+        for collection_index in range(_NB_CONTAINERS):
+            collection = Collection(id=f'collection_{collection_index}', context={},
+                                    project=project, data_descriptor_id=f'dd_{collection_index}',
+                                    term_kind=TermKind.PLAIN)
+            for term_index in range(_NB_TERMS):
+                term_id = f'term_{term_index}'
+                drs_name = f'TERM_{collection_index}_{term_index}'
+                specs = {'id': term_id, 'type': 'type', 'drs_name': drs_name}
+                session.add(PTerm(id=term_id, specs=specs, kind=TermKind.PLAIN,
+                                  collection=collection, **get_term_specs_columns(specs)))
+            session.add(collection)
+        session.commit()
+    connection.analyze()
+    return connection
+
+
+@pytest.fixture(scope='module')
+def universe_connection(tmp_path_factory) -> DBConnection:
+    db_file_path: Path = tmp_path_factory.mktemp('dbs') / 'universe.sqlite'
+    universe_create_db(db_file_path)
+    connection = DBConnection(db_file_path)
+    with connection.create_session() as session:
+        for data_descriptor_index in range(_NB_CONTAINERS):
+            data_descriptor = DataDescriptor(id=f'dd_{data_descriptor_index}', context={},
+                                             term_kind=TermKind.PLAIN)
+            for term_index in range(_NB_TERMS):
+                term_id = f'term_{term_index}'
+                session.add(UTerm(id=term_id, specs={'id': term_id}, kind=TermKind.PLAIN,
+                                  data_descriptor=data_descriptor))
+            session.add(data_descriptor)
+        session.commit()
+    connection.analyze()
+    return connection
+
+
+def _explain(connection: DBConnection, query) -> str:
+    """Returns the query plans of the statements executed by the given query."""
+    statements = list()
+
+    def capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append((statement, parameters))
+    engine = connection.get_engine()
+    event.listen(engine, 'before_cursor_execute', capture)
+    try:
+        with connection.create_session() as session:
+            query(session)
+    finally:
+        event.remove(engine, 'before_cursor_execute', capture)
+    plans = list()
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            rows = conn.exec_driver_sql('EXPLAIN QUERY PLAN ' + statement, parameters)
+            plans.extend(row[-1] for row in rows)
+    return '\n'.join(plans)
+
+
+def test_indexes_created(project_connection, universe_connection) -> None:
+    with project_connection.get_engine().connect() as conn:
+        names = {row[0] for row in conn.exec_driver_sql(
+                 "SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {'ix_pterms_collection_pk_id', 'ix_pterms_collection_pk_drs_name',
+            'ix_collections_id'} <= names
+    with universe_connection.get_engine().connect() as conn:
+        names = {row[0] for row in conn.exec_driver_sql(
+                 "SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {'ix_uterms_data_descriptor_pk_id', 'ix_uterms_data_descriptor_pk_drs_name',
+            'ix_data_descriptors_id'} <= names
+
+
+def test_find_terms_in_collection_plan(project_connection) -> None:
+    plan = _explain(project_connection,
+                    lambda session: _find_terms_in_collection('collection_3', 'term_7',
+                                                              session))
+    assert 'ix_collections_id' in plan
+    assert 'ix_pterms_collection_pk_id' in plan
+    assert 'SCAN' not in plan
+
+
+def test_find_terms_in_data_descriptor_plan(universe_connection) -> None:
+    plan = _explain(universe_connection,
+                    lambda session: _find_terms_in_data_descriptor('dd_3', 'term_7',
+                                                                   session, None))
+    assert 'ix_data_descriptors_id' in plan
+    assert 'ix_uterms_data_descriptor_pk_id' in plan
+    assert 'SCAN' not in plan
+
+
+def test_drs_name_plan(project_connection) -> None:
+    def query(session) -> None:
+        statement = select(PTerm).join(Collection).where(Collection.id == 'collection_3',
+                                                         PTerm.drs_name == 'TERM_3_7')
+        terms = session.exec(statement).all()
+        assert [(term.id, term.type, term.drs_name) for term in terms] == \
+               [('term_7', 'type', 'TERM_3_7')]
+    plan = _explain(project_connection, query)
+    assert 'ix_pterms_collection_pk_drs_name' in plan
+    assert 'SCAN' not in plan
+
+
+def test_term_specs_columns() -> None:
+    columns = get_term_specs_columns({'id': 'daily', 'type': 'time_range', 'separator': '-',
+                                      'parts': []})
+    assert columns == {'type': 'time_range', 'drs_name': None, 'regex': None, 'separator': '-'}
+
+
+def test_case_insensitive_plans(project_connection, universe_connection) -> None:
+    queries = [
+        (project_connection, 'ix_pterms_collection_pk_id_nocase',
+         lambda session: _find_terms_in_collection('collection_3', 'TERM_7', session,
+                                                   _CASE_INSENSITIVE)),
+        (project_connection, 'ix_pterms_id_nocase',
+         lambda session: _find_terms_in_project('TERM_7', session, _CASE_INSENSITIVE)),
+        (project_connection, 'ix_collections_id_nocase',
+         lambda session: _find_collections_in_project('COLLECTION_3', session,
+                                                      _CASE_INSENSITIVE)),
+        (universe_connection, 'ix_uterms_data_descriptor_pk_id_nocase',
+         lambda session: _find_terms_in_data_descriptor('dd_3', 'TERM_7', session,
+                                                        _CASE_INSENSITIVE)),
+        (universe_connection, 'ix_uterms_id_nocase',
+         lambda session: _find_terms_in_universe('TERM_7', session, _CASE_INSENSITIVE)),
+        (universe_connection, 'ix_data_descriptors_id_nocase',
+         lambda session: _find_data_descriptors_in_universe('DD_3', session,
+                                                            _CASE_INSENSITIVE))]
+    for connection, index_name, query in queries:
+        plan = _explain(connection, query)
+        assert index_name in plan
+        assert 'SCAN' not in plan
@@ -0,0 +1,88 @@
+import csv
+from pathlib import Path
+
+import pytest
+
+import esgvoc.apps.drs.catalog as catalog
+from esgvoc.apps.drs import DrsCatalogBuilder
+
+_PROJECT_ID = 'cmip6plus'
+_DIRECTORY = 'CMIP6Plus/CMIP/IPSL/MIROC6/historical/r{}i1p1f1/Amon/tas/gn/v20240101'
+_FILE_NAME = 'tas_Amon_MIROC6_historical_r{}i1p1f1_gn_2000010{}-2000123{}.nc'
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    root = tmp_path / 'root'
+    for index in range(1, 4):
+        directory = root / _DIRECTORY.format(index)
+        directory.mkdir(parents=True)
+        (directory / _FILE_NAME.format(index, 1, 1)).touch()
+    (root / _DIRECTORY.format(1) / 'invalid.nc').touch()
+    return root
+
+
+def _read_csv(catalog_path: Path) -> list[dict]:
+    with open(catalog_path, newline='') as catalog_file:
+        return list(csv.DictReader(catalog_file))
+
+
+def test_catalog(tree: Path, tmp_path: Path) -> None:
+    builder = DrsCatalogBuilder(_PROJECT_ID)
+    catalog_path = tmp_path / 'catalog.csv'
+    state_path = tmp_path / 'catalog.state.json'
+    summary = builder.build(tree, catalog_path, state_path)
+    assert summary.nb_files == 4
+    assert summary.nb_rows == 3
+    assert summary.nb_reused_directories == 0
+    rows = _read_csv(catalog_path)
+    assert list(rows[0].keys())[:3] == ['path', 'mip_era', 'activity_id']
+    assert rows[0]['path'] == f'{_DIRECTORY.format(1)}/{_FILE_NAME.format(1, 1, 1)}'
+    assert rows[0]['institution_id'] == 'IPSL'
+    assert rows[0]['member_id'] == 'r1i1p1f1'
+    assert rows[0]['time_range'] == '20000101-20001231'
+    # Incremental build: only the changed directory is scanned again.
+    (tree / _DIRECTORY.format(2) / _FILE_NAME.format(2, 2, 2)).touch()
+    summary = builder.build(tree, catalog_path, state_path)
+    assert summary.nb_reused_directories == summary.nb_directories - 1
+    assert summary.nb_files == 5
+    assert summary.nb_rows == 4
+    assert len(_read_csv(catalog_path)) == 4
+    full_catalog_path = tmp_path / 'full.csv'
+    builder.build(tree, full_catalog_path)
+    assert _read_csv(full_catalog_path) == _read_csv(catalog_path)
+
+
+def test_catalog_merge(tree: Path, tmp_path: Path, mocker) -> None:
+    builder = DrsCatalogBuilder(_PROJECT_ID)
+    catalog_path = tmp_path / 'catalog.csv'
+    state_path = tmp_path / 'catalog.state.json'
+    builder.build(tree, catalog_path, state_path)
+    # The first directory changes, the second one is removed and a fourth one is added:
+    # the rows of the third one are found after those of the removed one.
+    (tree / _DIRECTORY.format(1) / _FILE_NAME.format(1, 2, 2)).touch()
+    for file_path in (tree / _DIRECTORY.format(2)).iterdir():
+        file_path.unlink()
+    (tree / _DIRECTORY.format(2)).rmdir()
+    (tree / _DIRECTORY.format(4)).mkdir(parents=True)
+    (tree / _DIRECTORY.format(4) / _FILE_NAME.format(4, 1, 1)).touch()
+    get_rows = mocker.spy(catalog._PreviousCatalog, 'get_rows')
+    summary = builder.build(tree, catalog_path, state_path)
+    assert get_rows.call_count == summary.nb_reused_directories > 0
+    assert summary.nb_rows == 4
+    full_catalog_path = tmp_path / 'full.csv'
+    builder.build(tree, full_catalog_path)
+    assert _read_csv(full_catalog_path) == _read_csv(catalog_path)
+
+
+def test_parquet_catalog(tree: Path, tmp_path: Path) -> None:
+    parquet = pytest.importorskip('pyarrow.parquet')
+    builder = DrsCatalogBuilder(_PROJECT_ID)
+    catalog_path = tmp_path / 'catalog.parquet'
+    state_path = tmp_path / 'catalog.state.json'
+    builder.build(tree, catalog_path, state_path)
+    summary = builder.build(tree, catalog_path, state_path)
+    assert summary.nb_reused_directories == summary.nb_directories
+    table = parquet.read_table(catalog_path)
+    assert table.num_rows == 3
+    assert table.column('member_id').to_pylist() == ['r1i1p1f1', 'r2i1p1f1', 'r3i1p1f1']
@@ -0,0 +1,44 @@
+import pytest
+
+from esgvoc.apps.drs import (DrsIssueKind, DrsType, DrsValidator, generate_drs,
+                             generate_drs_many)
+
+_PROJECT_ID = 'cmip6plus'
+_FACETS = {'mip_era': 'CMIP6Plus', 'activity_id': 'CMIP', 'institution_id': 'IPSL',
+           'source_id': 'MIROC6', 'experiment_id': 'historical', 'member_id': 'r1i1p1f1',
+           'table_id': 'Amon', 'variable_id': 'tas', 'grid_label': 'gn',
+           'version': 'v20240101', 'time_range': '20000101-20001231'}
+
+
+def test_generate_drs() -> None:
+    report = generate_drs(_PROJECT_ID, _FACETS, DrsType.dataset_id)
+    assert report.generated_drs_expression == \
+           'CMIP6Plus.CMIP.IPSL.MIROC6.historical.r1i1p1f1.Amon.tas.gn'
+    report = generate_drs(_PROJECT_ID, _FACETS, DrsType.filename)
+    assert report.generated_drs_expression == \
+           'tas_Amon_MIROC6_historical_r1i1p1f1_gn_20000101-20001231.nc'
+    facets = dict(_FACETS)
+    del facets['time_range']
+    report = generate_drs(_PROJECT_ID, facets, 'filename')
+    assert report.generated_drs_expression == 'tas_Amon_MIROC6_historical_r1i1p1f1_gn.nc'
+
+
+def test_generate_drs_errors() -> None:
+    facets = dict(_FACETS, institution_id='IPL')
+    del facets['grid_label']
+    report = generate_drs(_PROJECT_ID, facets, DrsType.directory)
+    assert report.generated_drs_expression is None
+    assert [error.kind for error in report.errors] == [DrsIssueKind.invalid_facet,
+                                                       DrsIssueKind.missing_facet]
+    with pytest.raises(ValueError):
+        generate_drs(_PROJECT_ID, _FACETS, 'unknown')
+
+
+def test_generate_drs_many() -> None:
+    validator = DrsValidator(_PROJECT_ID)
+    facets = [dict(_FACETS, member_id=f'r{index}i1p1f1') for index in range(1, 10)]
+    for drs_type in DrsType:
+        reports = list(generate_drs_many(_PROJECT_ID, facets, drs_type))
+        assert len(reports) == len(facets)
+        for report in reports:
+            assert validator.validate(report.generated_drs_expression, drs_type)
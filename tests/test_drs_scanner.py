@@ -0,0 +1,93 @@
+from pathlib import Path
+
+import pytest
+
+from esgvoc.apps.drs import DrsScanIssueKind, DrsScanner, scan_drs_tree
+from esgvoc.apps.drs.scanner import _DirectoryScanner
+
+_PROJECT_ID = 'cmip6plus'
+_DIRECTORY = 'CMIP6Plus/CMIP/IPSL/MIROC6/historical/r{}i1p1f1/Amon/tas/gn/v20240101'
+_FILE_NAME = 'tas_Amon_MIROC6_historical_r{}i1p1f1_gn_20000101-20001231.nc'
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    for index in range(1, 4):
+        directory = tmp_path / _DIRECTORY.format(index)
+        directory.mkdir(parents=True)
+        (directory / _FILE_NAME.format(index)).touch()
+    leaf = tmp_path / _DIRECTORY.format(1)
+    (leaf / 'tas_Amon_MIROC6_historical_r1i1p1f111_gn.nc').touch()
+    (leaf.parent / 'misplaced.nc').touch()
+    (tmp_path / 'CMIP6Plus/CMIP/IPL/MIROC6').mkdir(parents=True)
+    (leaf / 'extra').mkdir()
+    return tmp_path
+
+
+def test_scan(tree: Path) -> None:
+    issues, summary = scan_drs_tree(tree, _PROJECT_ID, max_workers=1)
+    assert {(issue.path, issue.kind) for issue in issues} == {
+        (_DIRECTORY.format(1) + '/tas_Amon_MIROC6_historical_r1i1p1f111_gn.nc', 'file'),
+        (str(Path(_DIRECTORY.format(1)).parent / 'misplaced.nc'), 'file'),
+        ('CMIP6Plus/CMIP/IPL', 'directory'),
+        (_DIRECTORY.format(1) + '/extra', 'directory')}
+    assert all(isinstance(issue.kind, DrsScanIssueKind) for issue in issues)
+    assert summary.nb_files == 5
+    assert summary.nb_invalid_files == 2
+    assert summary.nb_invalid_directories == 2
+    # The subtree of the invalid directory is not scanned.
+    assert summary.nb_directories == 5 + 3 * 5 + 1 + 1
+
+
+def test_scan_with_workers(tree: Path) -> None:
+    expected_issues, expected_summary = scan_drs_tree(tree, _PROJECT_ID, max_workers=1)
+    scanner = DrsScanner(_PROJECT_ID, max_workers=2, budget=3)
+    issues = list(scanner.scan(tree))
+    assert sorted(issues, key=lambda issue: issue.path) == \
+           sorted(expected_issues, key=lambda issue: issue.path)
+    assert scanner.summary == expected_summary
+
+
+def test_scan_budget_per_entry(tree: Path) -> None:
+    leaf = tree / _DIRECTORY.format(2)
+    for index in range(10):
+        (leaf / f'invalid_{index}.nc').touch()
+    expected_issues, expected_summary = scan_drs_tree(tree, _PROJECT_ID, max_workers=1)
+    # A batch stops in the middle of the large directory and hands the rest of it back.
+    scanner = _DirectoryScanner(_PROJECT_ID)
+    pending = [('', frozenset([0]), None)]
+    issues = list()
+    is_modified = False
+    while pending:
+        result = scanner.scan(str(tree), pending, 3)
+        assert result.summary.nb_directories + result.summary.nb_files <= 3
+        pending = result.pending
+        issues.extend(result.issues)
+        if not is_modified and any(path == _DIRECTORY.format(2) and entries is not None
+                                   for path, _, entries in pending):
+            # The rest of the directory is scanned from its snapshot.
+            (leaf / 'invalid_0.nc').unlink()
+            (leaf / 'created.nc').touch()
+            is_modified = True
+    assert is_modified
+    assert sorted(issues, key=lambda issue: issue.path) == \
+           sorted(expected_issues, key=lambda issue: issue.path)
+    assert expected_summary.nb_invalid_files == 2 + 10
+
+
+def test_scan_symbolic_links(tree: Path) -> None:
+    gn = tree / _DIRECTORY.format(1)
+    (gn.parent / 'latest').symlink_to(gn, target_is_directory=True)
+    institution = tree / 'CMIP6Plus/CMIP/IPSL'
+    (institution.parent / 'CNRM-CERFACS').symlink_to(institution, target_is_directory=True)
+    (gn / 'link.nc').symlink_to(gn / _FILE_NAME.format(1))
+    issues, summary = scan_drs_tree(tree, _PROJECT_ID, max_workers=1)
+    # The links to directories are validated as directories but not followed.
+    assert (str(gn.parent.relative_to(tree) / 'latest'), 'directory') in \
+           {(issue.path, issue.kind) for issue in issues}
+    assert not any(issue.path.startswith('CMIP6Plus/CMIP/CNRM-CERFACS') for issue in issues)
+    assert summary.nb_directories == 5 + 3 * 5 + 1 + 1 + 2
+    assert summary.nb_invalid_directories == 2 + 1
+    # The links to files are validated as files.
+    assert summary.nb_files == 5 + 1
+    assert summary.nb_invalid_files == 2 + 1
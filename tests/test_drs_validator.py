@@ -0,0 +1,104 @@
+import pytest
+
+import esgvoc.api.projects as projects
+from esgvoc.apps.drs import DrsIssueKind, DrsType, DrsValidator
+
+_PROJECT_ID = 'cmip6plus'
+_DATASET_ID = 'CMIP6Plus.CMIP.IPSL.MIROC6.historical.r1i1p1f1.Amon.tas.gn'
+_DIRECTORY = 'CMIP6Plus/CMIP/IPSL/MIROC6/historical/r1i1p1f1/Amon/tas/gn/v20240101'
+_FILE_NAME = 'tas_Amon_MIROC6_historical_r1i1p1f1_gn_20000101-20001231.nc'
+
+
+@pytest.fixture(scope='module')
+def validator() -> DrsValidator:
+    return DrsValidator(_PROJECT_ID)
+
+
+def test_valid_expressions(validator) -> None:
+    report = validator.validate_dataset_id(_DATASET_ID)
+    assert report.validated
+    assert report.facets['institution_id'] == 'ipsl'
+    assert report.facets['member_id'] == 'ripf'
+    assert validator.validate_directory(_DIRECTORY)
+    assert validator.validate_directory('/' + _DIRECTORY + '/')
+    report = validator.validate_file_name(_FILE_NAME)
+    assert report.validated
+    assert 'time_range' in report.facets
+    # The time range is optional.
+    report = validator.validate_file_name('tas_Amon_MIROC6_historical_r1i1p1f1_gn.nc')
+    assert report.validated
+    assert 'time_range' not in report.facets
+
+
+def test_invalid_expressions(validator) -> None:
+    report = validator.validate_dataset_id(_DATASET_ID.replace('IPSL', 'IPL'))
+    assert [error.kind for error in report.errors] == [DrsIssueKind.invalid_token]
+    assert report.errors[0].collection_id == 'institution_id'
+    assert report.errors[0].position == 2
+    report = validator.validate_dataset_id(_DATASET_ID + '.extra')
+    assert [error.kind for error in report.errors] == [DrsIssueKind.extra_token]
+    report = validator.validate_dataset_id(_DATASET_ID.rsplit('.', 1)[0])
+    assert [error.kind for error in report.errors] == [DrsIssueKind.missing_token]
+    report = validator.validate_file_name(_FILE_NAME[:-len('.nc')])
+    assert [error.kind for error in report.errors] == [DrsIssueKind.missing_extension]
+
+
+def test_validate_many(validator) -> None:
+    expressions = [_DATASET_ID, _DATASET_ID.replace('IPSL', 'IPL')]
+    reports = list(validator.validate_many(expressions, DrsType.dataset_id))
+    assert [report.validated for report in reports] == [True, False]
+    with pytest.raises(ValueError):
+        validator.validate(_DATASET_ID, 'unknown')
+
+
+def test_optional_part_errors(validator) -> None:
+    # Without time range, the invalid member is reported rather than a shift of the tokens.
+    report = validator.validate_file_name('tas_Amon_MIROC6_historical_r1i1p1f111_gn.nc')
+    assert [error.kind for error in report.errors] == [DrsIssueKind.invalid_token]
+    assert report.errors[0].collection_id == 'member_id'
+    report = validator.validate_file_name('tas_Amon_MIROC6_historical_r1i1p1f1_gn_2000-2001.nc')
+    assert [error.kind for error in report.errors] == [DrsIssueKind.invalid_token]
+    assert report.errors[0].collection_id == 'time_range'
+
+
+def test_project_specs_cache(mocker) -> None:
+    import esgvoc.core.service as service
+    from esgvoc.apps.drs._compiled import get_compiled_drs_project
+    from esgvoc.apps.drs.parser import parse_project_specs
+    project_specs = parse_project_specs(_PROJECT_ID)
+    compiled_project = get_compiled_drs_project(_PROJECT_ID)
+    spy = mocker.spy(projects, 'find_project')
+    assert parse_project_specs(_PROJECT_ID) is project_specs
+    assert get_compiled_drs_project(_PROJECT_ID) is compiled_project
+    assert spy.call_count == 0
+    # A rebuilt database has another version.
+    state = service.state_service.projects[_PROJECT_ID]
+    mocker.patch.object(state, 'db_version', 'rebuilt')
+    assert parse_project_specs(_PROJECT_ID) is not project_specs
+    assert get_compiled_drs_project(_PROJECT_ID) is not compiled_project
+    assert spy.call_count == 1
+
+
+def test_compiled_project_of_rebuilt_db(mocker, tmp_path) -> None:
+    import os
+    import shutil
+    import esgvoc.core.service as service
+    from esgvoc.apps.drs._compiled import get_compiled_drs_project
+    state = service.state_service.projects[_PROJECT_ID]
+    db_file_path = tmp_path / 'project.sqlite'
+    shutil.copy(state.db_path, db_file_path)
+    state.close_db_connection()
+    mocker.patch.object(state, 'db_path', str(db_file_path))
+    try:
+        compiled_project = get_compiled_drs_project(_PROJECT_ID)
+        connection = state.db_connection
+        assert get_compiled_drs_project(_PROJECT_ID) is compiled_project
+        # Another process rebuilds the database from the same git hash.
+        rebuilt_db_file_path = tmp_path / 'rebuilt.sqlite'
+        shutil.copy(state.db_path, rebuilt_db_file_path)
+        os.replace(rebuilt_db_file_path, db_file_path)
+        assert get_compiled_drs_project(_PROJECT_ID) is not compiled_project
+        assert state.db_connection is not connection
+        assert DrsValidator(_PROJECT_ID).validate_dataset_id(_DATASET_ID).validated
+    finally:
+        state.close_db_connection()
@@ -0,0 +1,58 @@
+import re
+
+import pytest
+
+import esgvoc.api.universe as universe
+from esgvoc.api import SearchSettings, SearchType
+from esgvoc.api.search import _get_regex_literal_prefix
+
+_REGEX_LITERAL_PREFIXES = [('^abc', 'abc'),
+                           ('abc', ''),
+                           ('^ab*c', 'a'),
+                           ('^ab+c', 'ab'),
+                           ('^ab?', 'a'),
+                           ('^ab{2}', 'a'),
+                           (r'^a\.b\d', 'a.b'),
+                           ('^a.b', 'a'),
+                           ('^a|b', ''),
+                           ('^(ab)', ''),
+                           (r'^\d', '')]
+
+
+@pytest.mark.parametrize('pattern, prefix', _REGEX_LITERAL_PREFIXES)
+def test_regex_literal_prefix(pattern, prefix) -> None:
+    assert _get_regex_literal_prefix(pattern) == prefix
+    # The prefix is a prefix of all the strings that the regex matches.
+    for string in ('abc', 'abbc', 'a.b1', 'ab', 'a', 'b', '1', 'abcd'):
+        if re.search(pattern, string):
+            assert string.startswith(prefix)
+
+
+@pytest.mark.parametrize('search_type, value', [(SearchType.REGEX, '^ip'),
+                                                (SearchType.REGEX, r'^ipsl-cm\d'),
+                                                (SearchType.REGEX, '^a.*s$'),
+                                                (SearchType.REGEX, 'ips'),
+                                                (SearchType.STARTS_WITH, 'ipsl'),
+                                                (SearchType.STARTS_WITH, 'ip.l'),
+                                                (SearchType.STARTS_WITH, 'z'),
+                                                (SearchType.STARTS_WITH, '')])
+def test_prefix_search(search_type, value) -> None:
+    all_term_ids = {term.id for term in universe.get_all_terms_in_universe()}
+    pattern = value if search_type == SearchType.REGEX else f'^{value}'
+    expected = {term_id for term_id in all_term_ids if re.search(pattern, term_id)}
+    terms = universe.find_terms_in_universe(value, SearchSettings(type=search_type))
+    assert {term.id for term in terms} == expected
+    not_settings = SearchSettings(type=search_type, not_operator=True)
+    terms = universe.find_terms_in_universe(value, not_settings)
+    assert {term.id for term in terms} == all_term_ids - expected
+
+
+def test_case_insensitive_exact_search() -> None:
+    settings = SearchSettings(case_sensitive=False)
+    assert [term.id for term in universe.find_terms_in_universe('IPSL', settings)] == ['ipsl']
+    assert [term.id for term in universe.find_terms_in_data_descriptor('institution', 'IpSl',
+                                                                       settings)] == ['ipsl']
+    assert len(universe.find_data_descriptors_in_universe('INSTITUTION', settings)) == 1
+    not_settings = SearchSettings(case_sensitive=False, not_operator=True)
+    term_ids = {term.id for term in universe.find_terms_in_universe('IPSL', not_settings)}
+    assert 'ipsl' not in term_ids and 'cnrm-cerfacs' in term_ids
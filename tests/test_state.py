@@ -1,4 +1,8 @@
 
+import subprocess
+import sys
+import time
+
 import pytest
 from unittest.mock import MagicMock
 from esgvoc.core.service.state import StateService
@@ -90,6 +94,172 @@ def test_missing_local_repo(mock_repo_fetcher, service_settings):
     assert summary['universe']['github_local_sync'] is None
 
 
+_IMPORT_TIME_BUDGET = 5  # Seconds.
+_IMPORT_SCRIPT = '''
+import subprocess
+def forbidden(*args, **kwargs):
+    raise AssertionError(f"subprocess called at import time: {args}")
+subprocess.Popen = forbidden
+subprocess.run = forbidden
+subprocess.check_output = forbidden
+import esgvoc.api
+import esgvoc.core.service as service
+assert "state_service" not in vars(service), "state service built at import time"
+'''
+
+
+def test_import_is_lazy():
+    """Importing the API must not run git nor open any database, within a time budget."""
+    start = time.perf_counter()
+    process = subprocess.run([sys.executable, "-c", _IMPORT_SCRIPT], capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    assert process.returncode == 0, process.stderr
+    assert elapsed < _IMPORT_TIME_BUDGET, f"import esgvoc.api took {elapsed:.2f}s"
+
+
+def test_state_service_is_lazy(mocker, service_settings):
+    """Building the state service must not fetch any version."""
+    mock_rf = mocker.patch('esgvoc.core.service.state.RepoFetcher')
+    mock_connection = mocker.patch('esgvoc.core.service.state.DBConnection')
+    state_service = StateService(service_settings)
+    assert not mock_rf.return_value.method_calls
+    mock_connection.assert_not_called()
+    assert state_service.universe.db_version is None
+
+
+def test_read_only_db_connection(tmp_path):
+    """The read only profile of the API connections rejects writes and sets the pragmas."""
+    import sqlite3
+    from sqlalchemy import text
+    from sqlalchemy.exc import OperationalError
+    from esgvoc.core.db.connection import DBConnection
+    from esgvoc.core.service.settings import DBSettings
+    db_file_path = tmp_path / "read only.sqlite"
+    with sqlite3.connect(db_file_path) as sqlite_connection:
+        sqlite_connection.execute("CREATE TABLE terms (id TEXT)")
+        sqlite_connection.execute("INSERT INTO terms VALUES ('ipsl')")
+    db_settings = DBSettings()
+    connection = DBConnection(db_file_path, read_only=True, pragmas=db_settings.get_pragmas(),
+                              pool_size=db_settings.pool_size)
+    with connection.create_session() as session:
+        assert session.exec(text("SELECT id FROM terms")).all() == [("ipsl",)]
+        assert session.exec(text("PRAGMA query_only")).one() == (1,)
+        assert session.exec(text("PRAGMA mmap_size")).one() == (db_settings.mmap_size,)
+        with pytest.raises(OperationalError):
+            session.exec(text("INSERT INTO terms VALUES ('cnrm')"))
+    connection.get_engine().dispose()
+
+
+def test_missing_db_is_not_reopened(mocker, tmp_path):
+    """A missing database is looked up once, until the next sync or build."""
+    from esgvoc.core.service.state import StateUniverse
+    state = StateUniverse(UniverseSettings(github_repo="https://github.com/example/universe",
+                                           branch="main", local_path=str(tmp_path / "universe"),
+                                           db_path=str(tmp_path / "missing.sqlite")))
+    fetch_version_db = mocker.spy(state, "fetch_version_db")
+    assert state.db_connection is None
+    assert state.db_connection is None
+    assert fetch_version_db.call_count == 1
+    mocker.patch.object(state, "check_sync_status",
+                        return_value={"github_local_sync": None, "local_db_sync": None,
+                                      "github_db_sync": None})
+    state.github_access = False
+    state.local_access = False
+    state.db_access = True
+    state.sync()
+    assert state.db_connection is None
+    assert fetch_version_db.call_count == 2
+
+
+def test_db_connection_is_opened_once(mocker, tmp_path):
+    """Concurrent first accesses to the database open a single connection."""
+    import sqlite3
+    from concurrent.futures import ThreadPoolExecutor
+    from esgvoc.core.service.state import StateUniverse
+    db_file_path = tmp_path / "universe.sqlite"
+    with sqlite3.connect(db_file_path) as sqlite_connection:
+        sqlite_connection.execute("CREATE TABLE universes (pk INTEGER PRIMARY KEY, git_hash TEXT)")
+    state = StateUniverse(UniverseSettings(github_repo="https://github.com/example/universe",
+                                           db_path=str(db_file_path)))
+    create_db_connection = state._create_db_connection
+
+    def slow_create_db_connection():
+        time.sleep(0.05)
+        return create_db_connection()
+    create = mocker.patch.object(state, "_create_db_connection",
+                                 side_effect=slow_create_db_connection)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        connections = list(executor.map(lambda _: state.db_connection, range(8)))
+    assert create.call_count == 1
+    assert all(connection is connections[0] for connection in connections)
+    state.close_db_connection()
+
+
+def test_db_settings_validation(tmp_path):
+    """The settings of the connections can't inject SQL into the pragmas."""
+    from pydantic import ValidationError
+    from esgvoc.core.db.connection import DBConnection
+    from esgvoc.core.service.settings import DBSettings
+    for settings in [{"temp_store": "MEMORY; DROP TABLE uterms"},
+                     {"mmap_size": "0; DROP TABLE uterms"},
+                     {"pool_size": 0},
+                     {"journal_mode": "OFF"}]:
+        with pytest.raises(ValidationError):
+            DBSettings(**settings)
+    assert DBSettings(temp_store="FILE").get_pragmas()["temp_store"] == "FILE"
+    for pragmas in [{"journal_mode": "OFF"}, {"temp_store": "MEMORY; DROP TABLE uterms"},
+                    {"cache_size": "1"}]:
+        with pytest.raises(ValueError):
+            DBConnection(tmp_path / "db.sqlite", pragmas=pragmas)
+    settings_file_path = tmp_path / "settings.toml"
+    service_settings = ServiceSettings(universe=UniverseSettings(github_repo="https://github.com/example/universe"))
+    service_settings.save_to_file(str(settings_file_path))
+    assert ServiceSettings.load_from_file(str(settings_file_path)).db == DBSettings()
+
+
+def test_cache_settings_validation(tmp_path):
+    """An unknown eviction policy of the term cache is rejected when the settings are loaded."""
+    import toml
+    from pydantic import ValidationError
+    settings_file_path = tmp_path / "settings.toml"
+    with settings_file_path.open("w") as settings_file:
+        toml.dump({"universe": {"github_repo": "https://github.com/example/universe"},
+                   "cache": {"term_cache_eviction": "random"}}, settings_file)
+    with pytest.raises(ValidationError):
+        ServiceSettings.load_from_file(str(settings_file_path))
+
+
+def test_outdated_db_schema_is_rebuilt(mocker, tmp_path):
+    """A database of another schema version is rebuilt even if its git hash is up to date."""
+    import sqlite3
+    from esgvoc.core.constants import DB_SCHEMA_VERSION
+    from esgvoc.core.service.state import StateUniverse
+    db_file_path = tmp_path / "universe.sqlite"
+    with sqlite3.connect(db_file_path) as sqlite_connection:
+        # Built before the schema was versioned.
+        sqlite_connection.execute("CREATE TABLE universes (pk INTEGER PRIMARY KEY, git_hash TEXT)")
+        sqlite_connection.execute("INSERT INTO universes (git_hash) VALUES ('commit_hash')")
+    state = StateUniverse(UniverseSettings(github_repo="https://github.com/example/universe",
+                                           branch="main", local_path=str(tmp_path / "universe"),
+                                           db_path=str(db_file_path)))
+    state.rf = MagicMock()
+    state.rf.get_github_version.return_value = "commit_hash"
+    state.rf.get_local_repo_version.return_value = "commit_hash"
+    build_db = mocker.patch.object(state, "build_db")
+    summary = state.check_sync_status()
+    assert state.db_version == "commit_hash"
+    assert state.db_schema_version is None
+    assert summary == {"github_local_sync": True, "local_db_sync": False, "github_db_sync": False}
+    state.sync()
+    build_db.assert_called_once()
+    state.close_db_connection()
+    with sqlite3.connect(db_file_path) as sqlite_connection:
+        sqlite_connection.execute("ALTER TABLE universes ADD COLUMN schema_version INTEGER")
+        sqlite_connection.execute(f"UPDATE universes SET schema_version = {DB_SCHEMA_VERSION}")
+    assert state.check_sync_status()["local_db_sync"] is True
+    state.close_db_connection()
+
+
 #TODO when DB will be up
 
 # def test_local_and_db_out_of_sync(mock_repo_fetcher, service_settings):